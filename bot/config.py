@@ -50,6 +50,65 @@ class Settings(BaseSettings):
     LIMIT_BETWEEN_REQUESTS_SECONDS: int = 20
     LIMIT_PROCESSING_SECONDS: int = 60
 
+    USER_CACHE_TTL_SECONDS: int = 600
+    USER_CACHE_LOCAL_TTL_SECONDS: int = 5
+    USER_CACHE_LOCAL_MAX_SIZE: int = 10000
+    PRODUCT_CATALOG_REFRESH_SECONDS: int = 300
+    AI_MESSAGE_STREAM_INTERVAL_SECONDS: float = 1.5
+    UPDATE_DAILY_LIMITS_CONCURRENCY: int = 50
+    UPDATE_WORKERS: int = 100
+    UPDATE_QUEUE_MAX_SIZE: int = 5000
+    BLOB_METADATA_CACHE_TTL_SECONDS: int = 3600
+    BLOB_METADATA_CACHE_MAX_SIZE: int = 10000
+    CHAT_HISTORY_CACHE_SIZE: int = 20
+    CHAT_HISTORY_CACHE_TTL_SECONDS: int = 86400
+    TELEGRAM_FILE_CACHE_TTL_SECONDS: int = 2592000
+    HTTP_CLIENT_DNS_CACHE_TTL_SECONDS: int = 300
+    HTTP_CLIENT_KEEPALIVE_TIMEOUT_SECONDS: int = 30
+    VIDEO_SUMMARY_CACHE_TTL_SECONDS: int = 604800
+    VIDEO_SUMMARY_CACHE_MAX_SIZE: int = 10000
+    GEMINI_VIDEO_SPOOL_MAX_SIZE: int = 16 * 1024 * 1024
+    GEMINI_FILE_CACHE_TTL_SECONDS: int = 169200
+    RUNWAY_POLLER_INTERVAL_SECONDS: float = 2
+    RUNWAY_POLLER_BATCH_SIZE: int = 50
+    RUNWAY_TASK_TIMEOUT_SECONDS: int = 900
+    RUNWAY_TASK_MAX_ATTEMPTS: int = 5
+    WEBHOOK_EVENT_TTL_SECONDS: int = 86400
+    TRANSLATION_MEMORY_TTL_SECONDS: int = 7776000
+    TRANSLATE_TOKEN_REFRESH_MARGIN_SECONDS: int = 600
+    KEYBOARD_CACHE_MAX_SIZE: int = 10000
+    AUDIO_TRANSCODER_CONCURRENCY: int = 4
+    AUDIO_TRANSCODER_TIMEOUT_SECONDS: int = 300
+    LONG_AUDIO_SEGMENT_SECONDS: int = 600
+    LONG_AUDIO_SILENCE_NOISE: str = '-30dB'
+    LONG_AUDIO_SILENCE_SECONDS: float = 0.5
+    LONG_AUDIO_CONCURRENCY: int = 4
+    SPEECH_CACHE_TTL_SECONDS: int = 604800
+    SPEECH_CACHE_MAX_SIZE: int = 1000
+    SPEECH_FIRST_CHUNK_CHARACTERS: int = 300
+    SPEECH_CHUNK_CHARACTERS: int = 1000
+    STORAGE_UPLOAD_CHUNK_SIZE: int = 8 * 1024 * 1024
+    MEDIA_INGESTION_CONCURRENCY: int = 4
+    ALBUM_QUIET_WINDOW_SECONDS: float = 0.3
+    ALBUM_MAX_LATENCY_SECONDS: float = 2.0
+    DEFAULT_CONTEXT_TOKEN_BUDGET: int = 8000
+    CONTEXT_TOKEN_BUDGETS: dict[str, int] = field(default_factory=lambda: {
+        'gpt-4o-mini': 16000,
+        'gpt-4o': 8000,
+        'o1-mini': 8000,
+        'o1': 4000,
+        'claude-3-5-haiku-latest': 16000,
+        'claude-3-5-sonnet-latest': 8000,
+        'claude-3-opus-latest': 4000,
+        'gemini-2.0-flash-exp': 32000,
+        'gemini-1.5-pro': 16000,
+        'gemini-1.0-ultra': 8000,
+        'grok-2-vision-1212': 8000,
+        'llama-3.1-sonar-small-128k-online': 16000,
+        'llama-3.1-sonar-large-128k-online': 8000,
+        'llama-3.1-sonar-huge-128k-online': 4000,
+    })
+
     SUPER_ADMIN_ID: str = '354543567'
     ADMIN_IDS: list[str] = field(default_factory=lambda: ['354543567', '6078317830'])
     DEVELOPER_IDS: list[str] = field(default_factory=lambda: ['354543567'])
@@ -0,0 +1,72 @@
+import logging
+import time
+from typing import Optional, Union
+
+from redis.exceptions import RedisError
+
+from bot.database.cache import cache
+
+
+class BoundedCache:
+    def __init__(self, namespace: str, ttl: int, max_size: int, refresh_on_hit=False):
+        self.namespace = namespace
+        self.index_key = f'{namespace}:index'
+        self.stats_key = f'{namespace}:stats'
+        self.ttl = ttl
+        self.max_size = max_size
+        self.refresh_on_hit = refresh_on_hit
+
+    async def get(self, key: str) -> Optional[bytes]:
+        if not cache.redis:
+            return None
+
+        try:
+            value = await cache.redis.get(key)
+            await cache.redis.hincrby(self.stats_key, 'hits' if value else 'misses', 1)
+            if value and self.refresh_on_hit:
+                await cache.redis.zadd(self.index_key, {key: time.time()}, xx=True)
+        except RedisError as e:
+            logging.warning(f'Error in BoundedCache.get ({self.namespace}): {e}')
+            return None
+
+        return value
+
+    async def set(self, key: str, value: Union[str, bytes]):
+        if not cache.redis or not value:
+            return
+
+        try:
+            async with cache.redis.pipeline(transaction=True) as pipeline:
+                pipeline.set(key, value, ex=self.ttl)
+                pipeline.zadd(self.index_key, {key: time.time()})
+                pipeline.zremrangebyscore(self.index_key, '-inf', time.time() - self.ttl)
+                pipeline.zcard(self.index_key)
+                *_, size = await pipeline.execute()
+
+            overflow = size - self.max_size
+            if overflow > 0:
+                evicted_keys = await cache.redis.zpopmin(self.index_key, overflow)
+                if evicted_keys:
+                    await cache.redis.delete(*[evicted_key for evicted_key, _ in evicted_keys])
+        except RedisError as e:
+            logging.warning(f'Error in BoundedCache.set ({self.namespace}): {e}')
+
+    async def get_stats(self) -> dict:
+        if not cache.redis:
+            return {}
+
+        try:
+            stats = await cache.redis.hgetall(self.stats_key)
+            size = await cache.redis.zcard(self.index_key)
+        except RedisError as e:
+            logging.warning(f'Error in BoundedCache.get_stats ({self.namespace}): {e}')
+            return {}
+
+        hits = int(stats.get(b'hits', 0))
+        misses = int(stats.get(b'misses', 0))
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            'size': size,
+        }
@@ -0,0 +1,16 @@
+from typing import Optional
+
+from redis.asyncio import Redis
+
+
+class Cache:
+    redis: Optional[Redis] = None
+
+    async def init(self, redis: Redis):
+        self.redis = redis
+
+    async def close(self):
+        self.redis = None
+
+
+cache = Cache()
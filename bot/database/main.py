@@ -1,14 +1,17 @@
 import asyncio
 import os
-from typing import Optional
+from typing import AsyncIterator, Optional
 from urllib.parse import quote
 
+from aiohttp import ClientResponseError
+from cachetools import TTLCache
 from firebase_admin import auth, credentials, initialize_app, firestore_async
 from gcloud.aio.auth import Token
 from google.cloud.firestore_v1 import AsyncClient
 from gcloud.aio.storage import Storage, Bucket
 
 from bot.config import config
+from bot.integrations.http_client import http_client, HTTPProvider
 
 
 class Firebase:
@@ -20,6 +23,7 @@ class Firebase:
 
     def __init__(self):
         self.path_to_credentials = os.path.join(config.BASE_DIR, config.CERTIFICATE_NAME.get_secret_value())
+        self.blob_metadata = TTLCache(maxsize=config.BLOB_METADATA_CACHE_MAX_SIZE, ttl=config.BLOB_METADATA_CACHE_TTL_SECONDS)
 
     async def init(self):
         cred = credentials.Certificate(self.path_to_credentials)
@@ -51,8 +55,92 @@ class Firebase:
 
         return public_url
 
+    async def get_blob_metadata(self, blob_name: str) -> Optional[dict]:
+        if blob_name in self.blob_metadata:
+            return self.blob_metadata[blob_name]
+
+        try:
+            metadata = await self.storage.download_metadata(self.bucket.name, blob_name)
+        except ClientResponseError as e:
+            if e.status == 404:
+                return None
+            raise
+
+        blob_metadata = {
+            'content_type': metadata.get('contentType'),
+            'size': int(metadata.get('size', 0)),
+        }
+        self.blob_metadata[blob_name] = blob_metadata
+
+        return blob_metadata
+
+    async def upload_blob_stream(
+        self,
+        blob_name: str,
+        stream: AsyncIterator[bytes],
+        content_type: Optional[str] = None,
+    ):
+        content_type = content_type or 'application/octet-stream'
+        token = await self.token.get()
+        session = http_client.get_session(HTTPProvider.STORAGE)
+        async with session.post(
+            f'https://storage.googleapis.com/upload/storage/v1/b/{self.bucket.name}/o',
+            params={
+                'uploadType': 'resumable',
+                'name': blob_name,
+            },
+            headers={
+                'Authorization': f'Bearer {token}',
+                'X-Upload-Content-Type': content_type,
+            },
+            json={},
+            raise_for_status=True,
+        ) as response:
+            upload_url = response.headers['Location']
+
+        size = 0
+        buffer = bytearray()
+        async for chunk in stream:
+            buffer += chunk
+            while len(buffer) >= config.STORAGE_UPLOAD_CHUNK_SIZE:
+                await self.upload_blob_chunk(upload_url, bytes(buffer[:config.STORAGE_UPLOAD_CHUNK_SIZE]), size)
+                del buffer[:config.STORAGE_UPLOAD_CHUNK_SIZE]
+                size += config.STORAGE_UPLOAD_CHUNK_SIZE
+
+        await self.upload_blob_chunk(upload_url, bytes(buffer), size, size + len(buffer))
+        self.blob_metadata[blob_name] = {
+            'content_type': content_type,
+            'size': size + len(buffer),
+        }
+
+    @staticmethod
+    async def upload_blob_chunk(upload_url: str, chunk: bytes, offset: int, size: Optional[int] = None):
+        if chunk:
+            content_range = f'bytes {offset}-{offset + len(chunk) - 1}/{size if size is not None else "*"}'
+        else:
+            content_range = f'bytes */{size}'
+
+        session = http_client.get_session(HTTPProvider.STORAGE)
+        async with session.put(
+            upload_url,
+            data=chunk,
+            headers={
+                'Content-Range': content_range,
+            },
+            allow_redirects=False,
+        ) as response:
+            if response.status not in [200, 201, 308]:
+                error_message = await response.text()
+                raise ClientResponseError(
+                    response.request_info,
+                    response.history,
+                    status=response.status,
+                    message=error_message,
+                )
+
     async def delete_blob(self, blob_name: str):
         await self.storage.delete(self.bucket.name, blob_name)
+        self.blob_metadata.pop(blob_name, None)
 
     async def get_user(self, uid: str):
         await asyncio.to_thread(
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from typing import Optional
 
 
 class Message:
@@ -11,6 +12,7 @@ class Message:
     content: str
     is_in_context: bool
     photo_filenames: list[str]
+    token_count: Optional[int]
     created_at: datetime
     edited_at: datetime
 
@@ -23,6 +25,7 @@ class Message:
         content: str,
         is_in_context=True,
         photo_filenames=None,
+        token_count=None,
         created_at=None,
         edited_at=None,
         **kwargs,
@@ -34,6 +37,7 @@ class Message:
         self.content = content
         self.is_in_context = is_in_context
         self.photo_filenames = photo_filenames if photo_filenames else []
+        self.token_count = token_count
 
         current_time = datetime.now(timezone.utc)
         self.created_at = created_at if created_at is not None else current_time
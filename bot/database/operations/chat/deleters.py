@@ -2,6 +2,7 @@ import asyncio
 
 from bot.database.main import firebase
 from bot.database.models.chat import Chat
+from bot.database.operations.message.cache import delete_cached_messages
 from bot.database.operations.message.getters import get_messages_by_chat_id
 from bot.database.operations.message.updaters import update_message
 
@@ -9,6 +10,7 @@ from bot.database.operations.message.updaters import update_message
 async def delete_chat(chat_id: str) -> None:
     chat_ref = firebase.db.collection(Chat.COLLECTION_NAME).document(chat_id)
     await chat_ref.delete()
+    await delete_cached_messages(chat_id)
 
 
 async def reset_chat(chat_id: str) -> None:
@@ -24,3 +26,4 @@ async def reset_chat(chat_id: str) -> None:
             )
         )
     await asyncio.gather(*tasks)
+    await delete_cached_messages(chat_id)
@@ -18,3 +18,12 @@ async def update_used_face_swap_package(used_face_swap_package_id: str, data: di
     data['edited_at'] = datetime.now(timezone.utc)
 
     await used_face_swap_package_ref.update(data)
+
+
+async def update_used_face_swap_package_in_transaction(transaction, used_face_swap_package_id: str, data: dict):
+    data['edited_at'] = datetime.now(timezone.utc)
+
+    transaction.update(
+        firebase.db.collection(UsedFaceSwapPackage.COLLECTION_NAME).document(used_face_swap_package_id),
+        data,
+    )
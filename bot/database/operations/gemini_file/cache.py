@@ -0,0 +1,50 @@
+import hashlib
+import logging
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from bot.config import config
+from bot.database.cache import cache
+
+
+def get_gemini_file_cache_key(source: str) -> str:
+    return f'gemini_file:{hashlib.sha256(source.encode()).hexdigest()}'
+
+
+async def get_cached_gemini_file(source: str) -> Optional[str]:
+    if not cache.redis:
+        return None
+
+    try:
+        file_name = await cache.redis.get(get_gemini_file_cache_key(source))
+    except RedisError as e:
+        logging.warning(f'Error in get_cached_gemini_file: {e}')
+        return None
+
+    if file_name:
+        return file_name.decode()
+
+
+async def set_cached_gemini_file(source: str, file_name: str):
+    if not cache.redis:
+        return
+
+    try:
+        await cache.redis.set(
+            get_gemini_file_cache_key(source),
+            file_name,
+            ex=config.GEMINI_FILE_CACHE_TTL_SECONDS,
+        )
+    except RedisError as e:
+        logging.warning(f'Error in set_cached_gemini_file: {e}')
+
+
+async def delete_cached_gemini_file(source: str):
+    if not cache.redis:
+        return
+
+    try:
+        await cache.redis.delete(get_gemini_file_cache_key(source))
+    except RedisError as e:
+        logging.warning(f'Error in delete_cached_gemini_file: {e}')
@@ -9,3 +9,9 @@ async def update_generation(generation_id: str, data: dict):
     data['edited_at'] = datetime.now(timezone.utc)
 
     await generation_ref.update(data)
+
+
+async def update_generation_in_transaction(transaction, generation_id: str, data: dict):
+    data['edited_at'] = datetime.now(timezone.utc)
+
+    transaction.update(firebase.db.collection(Generation.COLLECTION_NAME).document(generation_id), data)
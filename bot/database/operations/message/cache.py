@@ -0,0 +1,67 @@
+import logging
+import pickle
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from bot.config import config
+from bot.database.cache import cache
+from bot.database.models.message import Message
+
+
+def get_chat_messages_cache_key(chat_id: str) -> str:
+    return f'chat:{chat_id}:messages'
+
+
+async def get_cached_messages(chat_id: str, limit: int) -> Optional[list[Message]]:
+    if not cache.redis:
+        return None
+
+    try:
+        messages_data = await cache.redis.lrange(get_chat_messages_cache_key(chat_id), 0, limit - 1)
+    except RedisError as e:
+        logging.warning(f'Error in get_cached_messages: {e}')
+        return None
+
+    if messages_data:
+        return [Message(**pickle.loads(message_data)) for message_data in messages_data]
+
+
+async def set_cached_messages(chat_id: str, messages: list[Message]):
+    if not cache.redis or not messages:
+        return
+
+    key = get_chat_messages_cache_key(chat_id)
+    try:
+        async with cache.redis.pipeline(transaction=True) as pipeline:
+            pipeline.delete(key)
+            pipeline.rpush(key, *[pickle.dumps(message.to_dict()) for message in messages])
+            pipeline.ltrim(key, 0, config.CHAT_HISTORY_CACHE_SIZE - 1)
+            pipeline.expire(key, config.CHAT_HISTORY_CACHE_TTL_SECONDS)
+            await pipeline.execute()
+    except RedisError as e:
+        logging.warning(f'Error in set_cached_messages: {e}')
+
+
+async def add_cached_message(message: Message):
+    if not cache.redis or not message.is_in_context:
+        return
+
+    key = get_chat_messages_cache_key(message.chat_id)
+    try:
+        async with cache.redis.pipeline(transaction=True) as pipeline:
+            pipeline.lpushx(key, pickle.dumps(message.to_dict()))
+            pipeline.ltrim(key, 0, config.CHAT_HISTORY_CACHE_SIZE - 1)
+            await pipeline.execute()
+    except RedisError as e:
+        logging.warning(f'Error in add_cached_message: {e}')
+
+
+async def delete_cached_messages(chat_id: str):
+    if not cache.redis:
+        return
+
+    try:
+        await cache.redis.delete(get_chat_messages_cache_key(chat_id))
+    except RedisError as e:
+        logging.warning(f'Error in delete_cached_messages: {e}')
@@ -1,5 +1,6 @@
 from bot.database.main import firebase
 from bot.database.models.message import Message
+from bot.helpers.getters.get_token_count import get_token_count
 
 
 async def create_message_object(
@@ -20,4 +21,5 @@ async def create_message_object(
         content=content,
         is_in_context=is_in_context,
         photo_filenames=photo_filenames,
+        token_count=get_token_count(content, photo_filenames),
     )
@@ -1,6 +1,8 @@
 from bot.database.main import firebase
 from bot.database.models.message import Message
+from bot.database.operations.message.cache import add_cached_message
 from bot.database.operations.message.helpers import create_message_object
+from bot.database.transactional import add_post_commit_callback
 
 
 async def write_message(
@@ -13,6 +15,7 @@ async def write_message(
 ) -> Message:
     message = await create_message_object(chat_id, sender, sender_id, content, is_in_context, photo_filenames)
     await firebase.db.collection(Message.COLLECTION_NAME).document(message.id).set(message.to_dict())
+    await add_cached_message(message)
 
     return message
 
@@ -28,5 +31,6 @@ async def write_message_in_transaction(
 ) -> Message:
     message = await create_message_object(chat_id, sender, sender_id, content, is_in_context, photo_filenames)
     transaction.set(firebase.db.collection(Message.COLLECTION_NAME).document(message.id), message.to_dict())
+    add_post_commit_callback(transaction, lambda: add_cached_message(message))
 
     return message
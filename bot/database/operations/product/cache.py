@@ -0,0 +1,72 @@
+import asyncio
+import logging
+from typing import Optional
+
+from bot.config import config
+from bot.database.main import firebase
+from bot.database.models.common import Quota
+from bot.database.models.product import Product
+
+
+class ProductCatalog:
+    products: dict[str, Product]
+    products_by_quota: dict[Quota, Product]
+    is_loaded: bool
+
+    def __init__(self):
+        self.products = {}
+        self.products_by_quota = {}
+        self.is_loaded = False
+        self.refresh_task: Optional[asyncio.Task] = None
+
+    async def load(self):
+        products = {}
+        products_by_quota = {}
+        async for product_doc in firebase.db.collection(Product.COLLECTION_NAME).stream():
+            product = Product(**product_doc.to_dict())
+            products[product.id] = product
+
+            quota = (product.details or {}).get('quota')
+            if quota:
+                products_by_quota.setdefault(quota, product)
+
+        self.products = products
+        self.products_by_quota = products_by_quota
+        self.is_loaded = True
+
+    def invalidate(self):
+        self.is_loaded = False
+
+    async def refresh(self):
+        while True:
+            await asyncio.sleep(config.PRODUCT_CATALOG_REFRESH_SECONDS)
+            try:
+                await self.load()
+            except Exception as e:
+                logging.warning(f'Error in ProductCatalog.refresh: {e}')
+
+    async def start(self):
+        await self.load()
+        self.refresh_task = asyncio.create_task(self.refresh())
+
+    async def close(self):
+        if self.refresh_task:
+            self.refresh_task.cancel()
+            self.refresh_task = None
+        self.invalidate()
+
+    def get(self, product_id: str) -> Optional[Product]:
+        product = self.products.get(product_id)
+        if product:
+            return product.model_copy(deep=True)
+
+    def get_by_quota(self, quota: Quota) -> Optional[Product]:
+        product = self.products_by_quota.get(quota)
+        if product:
+            return product.model_copy(deep=True)
+
+    def get_all(self) -> list[Product]:
+        return [product.model_copy(deep=True) for product in self.products.values()]
+
+
+product_catalog = ProductCatalog()
@@ -6,9 +6,15 @@ from google.cloud.firestore_v1 import FieldFilter, Query
 from bot.database.main import firebase
 from bot.database.models.common import Quota
 from bot.database.models.product import Product, ProductType, ProductCategory
+from bot.database.operations.product.cache import product_catalog
 
 
 async def get_product(product_id: str) -> Optional[Product]:
+    if product_catalog.is_loaded:
+        product = product_catalog.get(str(product_id))
+        if product:
+            return product
+
     product_ref = firebase.db.collection(Product.COLLECTION_NAME).document(str(product_id))
     product = await product_ref.get()
 
@@ -19,6 +25,11 @@ async def get_product(product_id: str) -> Optional[Product]:
 async def get_product_by_quota(
     quota: Quota,
 ) -> Optional[Product]:
+    if product_catalog.is_loaded:
+        product = product_catalog.get_by_quota(quota)
+        if product:
+            return product
+
     product_stream = firebase.db.collection(Product.COLLECTION_NAME) \
         .where(filter=FieldFilter('details.quota', '==', quota)) \
         .limit(1) \
@@ -32,6 +43,15 @@ async def get_active_products_by_product_type_and_category(
     product_type: ProductType,
     product_category: Optional[ProductCategory] = None,
 ) -> list[Product]:
+    if product_catalog.is_loaded:
+        products = [
+            product for product in product_catalog.get_all()
+            if product.is_active and
+            product.type == product_type and
+            (not product_category or product.category == product_category)
+        ]
+        return sorted(products, key=lambda product: product.order)
+
     products_query = firebase.db.collection(Product.COLLECTION_NAME) \
         .where(filter=FieldFilter('is_active', '==', True)) \
         .where(filter=FieldFilter('type', '==', product_type))
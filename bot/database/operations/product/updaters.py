@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 
 from bot.database.main import firebase
 from bot.database.models.product import Product
+from bot.database.operations.product.cache import product_catalog
 
 
 async def update_product(product_id: str, data: dict):
@@ -9,4 +10,5 @@ async def update_product(product_id: str, data: dict):
     data['edited_at'] = datetime.now(timezone.utc)
 
     await product_ref.update(data)
+    await product_catalog.load()
 
@@ -1,5 +1,6 @@
 from bot.database.main import firebase
 from bot.database.models.product import ProductType, Product, ProductCategory
+from bot.database.operations.product.cache import product_catalog
 from bot.database.operations.product.helpers import create_product_object
 from bot.locales.types import LanguageCode
 
@@ -31,5 +32,6 @@ async def write_product(
         details,
     )
     await firebase.db.collection(Product.COLLECTION_NAME).document(product.id).set(product.to_dict())
+    await product_catalog.load()
 
     return product
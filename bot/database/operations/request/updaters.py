@@ -9,3 +9,9 @@ async def update_request(request_id: str, data: dict):
     data['edited_at'] = datetime.now(timezone.utc)
 
     await request_ref.update(data)
+
+
+async def update_request_in_transaction(transaction, request_id: str, data: dict):
+    data['edited_at'] = datetime.now(timezone.utc)
+
+    transaction.update(firebase.db.collection(Request.COLLECTION_NAME).document(request_id), data)
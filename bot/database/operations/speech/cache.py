@@ -0,0 +1,28 @@
+import hashlib
+from typing import Optional
+
+from bot.config import config
+from bot.database.bounded_cache import BoundedCache
+
+speech_cache = BoundedCache(
+    'speech',
+    config.SPEECH_CACHE_TTL_SECONDS,
+    config.SPEECH_CACHE_MAX_SIZE,
+    refresh_on_hit=True,
+)
+
+
+def get_speech_cache_key(text: str, voice: str) -> str:
+    return f'speech:{voice}:{hashlib.sha256(text.encode()).hexdigest()}'
+
+
+async def get_cached_speech(text: str, voice: str) -> Optional[bytes]:
+    return await speech_cache.get(get_speech_cache_key(text, voice))
+
+
+async def set_cached_speech(text: str, voice: str, audio: bytes):
+    await speech_cache.set(get_speech_cache_key(text, voice), audio)
+
+
+async def get_speech_cache_stats() -> dict:
+    return await speech_cache.get_stats()
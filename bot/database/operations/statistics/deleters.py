@@ -0,0 +1,7 @@
+from bot.database.cache import cache
+
+
+async def delete_namespace_statistics(namespace: str) -> None:
+    statistics_keys = [statistics_key async for statistics_key in cache.redis.scan_iter(match=f'{namespace}:*')]
+    if statistics_keys:
+        await cache.redis.delete(*statistics_keys)
@@ -0,0 +1,49 @@
+from bot.database.cache import cache
+from bot.database.operations.statistics.helpers import STATISTICS_DAYS_KEY, STATISTICS_NAMESPACE, get_statistics_key
+
+
+async def is_statistics_ready(days: list[str]) -> bool:
+    if not cache.redis or not days:
+        return False
+
+    async with cache.redis.pipeline(transaction=False) as pipeline:
+        for day in days:
+            pipeline.sismember(STATISTICS_DAYS_KEY, day)
+        results = await pipeline.execute()
+
+    return all(results)
+
+
+async def get_statistics(days: list[str], name: str) -> dict[str, float]:
+    async with cache.redis.pipeline(transaction=False) as pipeline:
+        for day in days:
+            pipeline.hgetall(get_statistics_key(day, name))
+        results = await pipeline.execute()
+
+    statistics = {}
+    for result in results:
+        for key, value in result.items():
+            key = key.decode()
+            statistics[key] = statistics.get(key, 0) + float(value)
+
+    return statistics
+
+
+async def get_count_of_statistics_users(days: list[str], name: str) -> int:
+    return await cache.redis.pfcount(*[get_statistics_key(day, name) for day in days])
+
+
+async def get_statistics_keys(days: list[str], namespace=STATISTICS_NAMESPACE) -> list:
+    statistics_keys = [
+        get_statistics_key(day, name, namespace)
+        for day in days
+        for name in ['transactions', 'income', 'expense', 'activated_users', 'paid_users']
+    ]
+    days = set(days)
+    async for subscription_users_key in cache.redis.scan_iter(
+        match=get_statistics_key('*', 'subscription_users:*', namespace),
+    ):
+        if subscription_users_key.decode()[len(namespace) + 1:].split(':')[0] in days:
+            statistics_keys.append(subscription_users_key)
+
+    return statistics_keys
@@ -0,0 +1,100 @@
+from datetime import datetime, timezone, timedelta
+from typing import Optional
+
+from redis.asyncio.client import Pipeline
+
+from bot.config import config
+from bot.database.models.common import Currency
+from bot.database.models.product import Product, ProductType
+from bot.database.models.transaction import Transaction, TransactionType
+
+STATISTICS_NAMESPACE = 'statistics'
+STATISTICS_DAYS_KEY = 'statistics:days'
+
+
+def get_statistics_key(day: str, name: str, namespace=STATISTICS_NAMESPACE) -> str:
+    return f'{namespace}:{day}:{name}'
+
+
+def get_statistics_day(date: datetime) -> str:
+    if date.tzinfo:
+        date = date.astimezone(timezone.utc)
+
+    return date.strftime('%Y-%m-%d')
+
+
+def get_statistics_days(start_date: datetime, end_date: datetime) -> list[str]:
+    start_day = datetime.strptime(get_statistics_day(start_date), '%Y-%m-%d')
+    end_day = datetime.strptime(get_statistics_day(end_date), '%Y-%m-%d')
+
+    return [
+        get_statistics_day(start_day + timedelta(days=i)) for i in range((end_day - start_day).days + 1)
+    ]
+
+
+def get_transaction_net(transaction: Transaction) -> float:
+    transaction_net = transaction.clear_amount
+    if transaction.currency == Currency.USD:
+        transaction_net *= 100
+    elif transaction.currency == Currency.XTR:
+        transaction_net *= 2
+
+    return transaction_net
+
+
+def add_transaction_to_statistics(
+    pipeline: Pipeline,
+    transaction: Transaction,
+    product: Optional[Product],
+    subscription_key: str,
+    namespace=STATISTICS_NAMESPACE,
+):
+    day = get_statistics_day(transaction.created_at)
+
+    pipeline.pfadd(get_statistics_key(day, 'activated_users', namespace), transaction.user_id)
+    pipeline.pfadd(get_statistics_key(day, f'subscription_users:{subscription_key}', namespace), transaction.user_id)
+
+    if transaction.type == TransactionType.INCOME:
+        income_key = get_statistics_key(day, 'income', namespace)
+        transaction_net = get_transaction_net(transaction)
+
+        pipeline.hincrby(income_key, 'COUNT', 1)
+        pipeline.hincrbyfloat(income_key, transaction.product_id, transaction_net)
+        if product and product.type == ProductType.SUBSCRIPTION:
+            pipeline.hincrbyfloat(income_key, 'SUBSCRIPTION_ALL', transaction_net)
+        elif product and product.type == ProductType.PACKAGE:
+            pipeline.hincrbyfloat(income_key, 'PACKAGES_ALL', transaction_net)
+        pipeline.hincrbyfloat(income_key, 'ALL', transaction_net)
+
+        if transaction.details.get('is_bonus', False):
+            pipeline.hincrby(get_statistics_key(day, 'transactions', namespace), f'{transaction.product_id}:BONUS', 1)
+
+        if transaction_net > 0:
+            pipeline.pfadd(get_statistics_key(day, 'paid_users', namespace), transaction.user_id)
+    elif transaction.type == TransactionType.EXPENSE:
+        transactions_key = get_statistics_key(day, 'transactions', namespace)
+        expense_key = get_statistics_key(day, 'expense', namespace)
+        has_error = transaction.details.get('has_error', False)
+        is_suggestion = transaction.details.get('is_suggestion', False)
+
+        if has_error:
+            pipeline.hincrby(transactions_key, f'{transaction.product_id}:FAIL', transaction.quantity)
+        else:
+            pipeline.hincrby(transactions_key, f'{transaction.product_id}:SUCCESS', transaction.quantity)
+        if is_suggestion:
+            pipeline.hincrby(transactions_key, f'{transaction.product_id}:EXAMPLE', transaction.quantity)
+        pipeline.hincrby(transactions_key, f'{transaction.product_id}:ALL', transaction.quantity)
+
+        if is_suggestion:
+            pipeline.hincrbyfloat(expense_key, f'{transaction.product_id}:AVERAGE_EXAMPLE_PRICE', transaction.amount)
+            pipeline.hincrbyfloat(expense_key, f'{transaction.product_id}:EXAMPLE_ALL', transaction.amount)
+        else:
+            pipeline.hincrbyfloat(expense_key, f'{transaction.product_id}:AVERAGE_PRICE', transaction.amount)
+        pipeline.hincrbyfloat(expense_key, f'{transaction.product_id}:ALL', transaction.amount)
+        pipeline.hincrbyfloat(expense_key, 'ALL', transaction.amount)
+
+        if transaction.user_id != config.SUPER_ADMIN_ID:
+            pipeline.hincrbyfloat(expense_key, f'{subscription_key}:ALL', transaction.amount)
+
+    if namespace == STATISTICS_NAMESPACE:
+        pipeline.sadd(STATISTICS_DAYS_KEY, day)
@@ -0,0 +1,64 @@
+import logging
+import traceback
+
+from cachetools import LRUCache
+
+from bot.database.cache import cache
+from bot.database.models.transaction import Transaction, ServiceType
+from bot.database.operations.product.getters import get_product
+from bot.database.operations.statistics.getters import get_statistics_keys
+from bot.database.operations.statistics.helpers import (
+    STATISTICS_DAYS_KEY,
+    STATISTICS_NAMESPACE,
+    add_transaction_to_statistics,
+)
+from bot.database.operations.subscription.getters import get_subscription
+from bot.database.operations.user.getters import get_user
+
+subscription_products = LRUCache(maxsize=10000)
+
+
+async def get_subscription_key(user_id: str) -> str:
+    user = await get_user(user_id)
+    if not user or not user.subscription_id:
+        return ServiceType.FREE
+
+    if user.subscription_id not in subscription_products:
+        subscription = await get_subscription(user.subscription_id)
+        if not subscription:
+            return ServiceType.FREE
+        subscription_products[user.subscription_id] = subscription.product_id
+
+    return subscription_products[user.subscription_id]
+
+
+async def update_statistics(transaction: Transaction):
+    if not cache.redis:
+        return
+
+    try:
+        product = await get_product(transaction.product_id)
+        subscription_key = await get_subscription_key(transaction.user_id)
+
+        async with cache.redis.pipeline(transaction=False) as pipeline:
+            add_transaction_to_statistics(pipeline, transaction, product, subscription_key)
+            await pipeline.execute()
+    except Exception:
+        error_trace = traceback.format_exc()
+        logging.exception(f'Error in update_statistics: {error_trace}')
+
+
+async def replace_statistics(days: list[str], namespace: str):
+    statistics_keys = await get_statistics_keys(days)
+    namespace_keys = [namespace_key async for namespace_key in cache.redis.scan_iter(match=f'{namespace}:*')]
+
+    async with cache.redis.pipeline(transaction=True) as pipeline:
+        if statistics_keys:
+            pipeline.delete(*statistics_keys)
+        pipeline.srem(STATISTICS_DAYS_KEY, *days)
+        for namespace_key in namespace_keys:
+            statistics_key = namespace_key.decode()[len(namespace) + 1:]
+            pipeline.rename(namespace_key, f'{STATISTICS_NAMESPACE}:{statistics_key}')
+        # days without transactions have no keys but are still backfilled
+        pipeline.sadd(STATISTICS_DAYS_KEY, *days)
+        await pipeline.execute()
@@ -0,0 +1,78 @@
+import hashlib
+import logging
+from enum import StrEnum
+from typing import Optional
+
+from aiogram.types import Message
+from redis.exceptions import RedisError
+
+from bot.config import config
+from bot.database.cache import cache
+
+TELEGRAM_FILE_STATS_KEY = 'telegram_file:stats'
+
+
+class TelegramFileType(StrEnum):
+    PHOTO = 'photo'
+    VIDEO = 'video'
+    AUDIO = 'audio'
+    DOCUMENT = 'document'
+
+
+def get_telegram_file_cache_key(source: str, file_type: TelegramFileType) -> str:
+    return f'telegram_file:{file_type}:{hashlib.sha256(source.encode()).hexdigest()}'
+
+
+def get_telegram_file_id(message: Message, file_type: TelegramFileType) -> Optional[str]:
+    if file_type == TelegramFileType.PHOTO and message.photo:
+        return message.photo[-1].file_id
+    elif file_type == TelegramFileType.VIDEO and message.video:
+        return message.video.file_id
+    elif file_type == TelegramFileType.AUDIO and message.audio:
+        return message.audio.file_id
+    elif file_type == TelegramFileType.DOCUMENT and message.document:
+        return message.document.file_id
+
+
+async def get_cached_telegram_file(source: str, file_type: TelegramFileType) -> Optional[str]:
+    if not cache.redis:
+        return None
+
+    try:
+        file_id = await cache.redis.get(get_telegram_file_cache_key(source, file_type))
+        await cache.redis.hincrby(TELEGRAM_FILE_STATS_KEY, 'hits' if file_id else 'misses', 1)
+    except RedisError as e:
+        logging.warning(f'Error in get_cached_telegram_file: {e}')
+        return None
+
+    if file_id:
+        return file_id.decode()
+
+
+async def set_cached_telegram_file(source: str, file_type: TelegramFileType, message: Optional[Message]):
+    if not cache.redis or not isinstance(message, Message):
+        return
+
+    file_id = get_telegram_file_id(message, file_type)
+    if not file_id:
+        return
+
+    try:
+        await cache.redis.set(
+            get_telegram_file_cache_key(source, file_type),
+            file_id,
+            ex=config.TELEGRAM_FILE_CACHE_TTL_SECONDS,
+        )
+    except RedisError as e:
+        logging.warning(f'Error in set_cached_telegram_file: {e}')
+
+
+async def delete_cached_telegram_files(source: str):
+    if not cache.redis:
+        return
+
+    try:
+        await cache.redis.delete(*[get_telegram_file_cache_key(source, file_type) for file_type in TelegramFileType])
+    except RedisError as e:
+        logging.warning(f'Error in delete_cached_telegram_files: {e}')
+
@@ -1,6 +1,7 @@
 from bot.database.main import firebase
 from bot.database.models.common import Currency
 from bot.database.models.transaction import Transaction, TransactionType
+from bot.database.operations.statistics.updaters import update_statistics
 from bot.database.operations.transaction.helpers import create_transaction_object
 
 
@@ -27,6 +28,7 @@ async def write_transaction(
         created_at,
     )
     await firebase.db.collection(Transaction.COLLECTION_NAME).document(transaction.id).set(transaction.to_dict())
+    await update_statistics(transaction)
 
     return transaction
 
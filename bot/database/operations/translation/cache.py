@@ -0,0 +1,55 @@
+import hashlib
+import logging
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from bot.config import config
+from bot.database.cache import cache
+
+
+def get_translation_cache_key(text: str, source_language_code: str, target_language_code: str) -> str:
+    return f'translation:{source_language_code}:{target_language_code}:{hashlib.sha256(text.encode()).hexdigest()}'
+
+
+async def get_cached_translations(
+    texts: list[str],
+    source_language_code: str,
+    target_language_code: str,
+) -> list[Optional[str]]:
+    if not cache.redis or not texts:
+        return [None] * len(texts)
+
+    keys = [get_translation_cache_key(text, source_language_code, target_language_code) for text in texts]
+    try:
+        translations = await cache.redis.mget(keys)
+    except RedisError as e:
+        logging.warning(f'Error in get_cached_translations: {e}')
+        return [None] * len(texts)
+
+    return [translation.decode() if translation else None for translation in translations]
+
+
+async def set_cached_translations(
+    texts: list[str],
+    translations: list[str],
+    source_language_code: str,
+    target_language_code: str,
+):
+    if not cache.redis:
+        return
+
+    try:
+        async with cache.redis.pipeline(transaction=False) as pipeline:
+            for text, translation in zip(texts, translations):
+                if not translation:
+                    continue
+
+                pipeline.set(
+                    get_translation_cache_key(text, source_language_code, target_language_code),
+                    translation,
+                    ex=config.TRANSLATION_MEMORY_TTL_SECONDS,
+                )
+            await pipeline.execute()
+    except RedisError as e:
+        logging.warning(f'Error in set_cached_translations: {e}')
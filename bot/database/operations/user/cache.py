@@ -0,0 +1,64 @@
+import logging
+import pickle
+from typing import Optional
+
+from cachetools import TTLCache
+from redis.exceptions import RedisError
+
+from bot.config import config
+from bot.database.cache import cache
+from bot.database.models.user import User
+
+# local tier is not invalidated on other instances, reads there may be stale for up to its TTL
+local_users = TTLCache(
+    maxsize=config.USER_CACHE_LOCAL_MAX_SIZE,
+    ttl=config.USER_CACHE_LOCAL_TTL_SECONDS,
+)
+
+
+def get_user_cache_key(user_id: str) -> str:
+    return f'user:{user_id}:data'
+
+
+async def get_cached_user(user_id: str, use_local_cache=True) -> Optional[User]:
+    user_data = local_users.get(user_id) if use_local_cache else None
+    if user_data is None and cache.redis:
+        try:
+            user_data = await cache.redis.get(get_user_cache_key(user_id))
+        except RedisError as e:
+            logging.warning(f'Error in get_cached_user: {e}')
+
+        if user_data is not None:
+            local_users[user_id] = user_data
+
+    if user_data is not None:
+        return User(**pickle.loads(user_data))
+
+
+async def set_cached_user(user: User):
+    user_data = pickle.dumps(user.to_dict())
+    local_users[user.id] = user_data
+
+    if cache.redis:
+        try:
+            await cache.redis.set(get_user_cache_key(user.id), user_data, ex=config.USER_CACHE_TTL_SECONDS)
+        except RedisError as e:
+            logging.warning(f'Error in set_cached_user: {e}')
+
+
+async def delete_cached_users(user_ids: list[str]):
+    if not user_ids:
+        return
+
+    for user_id in user_ids:
+        local_users.pop(user_id, None)
+
+    if cache.redis:
+        try:
+            await cache.redis.delete(*[get_user_cache_key(user_id) for user_id in user_ids])
+        except RedisError as e:
+            logging.warning(f'Error in delete_cached_users: {e}')
+
+
+async def delete_cached_user(user_id: str):
+    await delete_cached_users([user_id])
@@ -6,13 +6,29 @@ from google.cloud.firestore_v1 import FieldFilter
 from bot.database.main import firebase
 from bot.database.models.common import UTM
 from bot.database.models.user import User
+from bot.database.operations.user.cache import get_cached_user, set_cached_user
 from bot.locales.types import LanguageCode
 
 
-async def get_user(user_id: str) -> Optional[User]:
+async def get_user(user_id: str, use_local_cache=True) -> Optional[User]:
+    cached_user = await get_cached_user(user_id, use_local_cache)
+    if cached_user:
+        return cached_user
+
     user_ref = firebase.db.collection(User.COLLECTION_NAME).document(user_id)
     user = await user_ref.get()
 
+    if user.exists:
+        user = User(**user.to_dict())
+        await set_cached_user(user)
+
+        return user
+
+
+async def get_user_in_transaction(transaction, user_id: str) -> Optional[User]:
+    user_ref = firebase.db.collection(User.COLLECTION_NAME).document(user_id)
+    user = await user_ref.get(transaction=transaction)
+
     if user.exists:
         return User(**user.to_dict())
 
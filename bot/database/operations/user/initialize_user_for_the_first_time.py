@@ -2,7 +2,6 @@ from typing import Optional
 
 import stripe
 from firebase_admin.exceptions import AlreadyExistsError
-from google.cloud import firestore
 
 from bot.database.main import firebase
 from bot.database.models.common import Quota
@@ -10,9 +9,10 @@ from bot.database.models.user import User
 from bot.database.operations.cart.writers import write_cart_in_transaction
 from bot.database.operations.chat.writers import write_chat_in_transaction
 from bot.database.operations.user.writers import write_user_in_transaction
+from bot.database.transactional import async_transactional
 
 
-@firestore.async_transactional
+@async_transactional
 async def initialize_user_for_the_first_time(
     transaction,
     telegram_user: User,
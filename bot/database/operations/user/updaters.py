@@ -1,7 +1,10 @@
 from datetime import datetime, timezone
 
+from bot.config import config
 from bot.database.main import firebase
 from bot.database.models.user import User
+from bot.database.operations.user.cache import delete_cached_user, delete_cached_users
+from bot.database.transactional import add_post_commit_callback
 
 
 async def update_user(user_id: str, data: dict):
@@ -9,9 +12,23 @@ async def update_user(user_id: str, data: dict):
     data['edited_at'] = datetime.now(timezone.utc)
 
     await user_ref.update(data)
+    await delete_cached_user(user_id)
+
+
+async def update_users(user_ids: list[str], data: dict):
+    data['edited_at'] = datetime.now(timezone.utc)
+
+    for i in range(0, len(user_ids), config.BATCH_SIZE):
+        batch = firebase.db.batch()
+        for user_id in user_ids[i:i + config.BATCH_SIZE]:
+            batch.update(firebase.db.collection(User.COLLECTION_NAME).document(user_id), data)
+        await batch.commit()
+
+    await delete_cached_users(user_ids)
 
 
 async def update_user_in_transaction(transaction, user_id: str, data: dict):
     data['edited_at'] = datetime.now(timezone.utc)
 
     transaction.update(firebase.db.collection(User.COLLECTION_NAME).document(user_id), data)
+    add_post_commit_callback(transaction, lambda: delete_cached_user(user_id))
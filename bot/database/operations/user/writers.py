@@ -5,7 +5,9 @@ from aiogram.types import User as TelegramUser
 from bot.database.main import firebase
 from bot.database.models.common import Quota
 from bot.database.models.user import User
+from bot.database.operations.user.cache import delete_cached_user
 from bot.database.operations.user.helpers import create_user_object
+from bot.database.transactional import add_post_commit_callback
 
 
 async def write_user_in_transaction(
@@ -35,5 +37,6 @@ async def write_user_in_transaction(
     )
 
     transaction.set(user_ref, created_user.to_dict())
+    add_post_commit_callback(transaction, lambda: delete_cached_user(created_user.id))
 
     return created_user
@@ -0,0 +1,51 @@
+import hashlib
+from typing import Optional
+
+from bot.config import config
+from bot.database.bounded_cache import BoundedCache
+from bot.database.models.common import VideoSummaryFocus, VideoSummaryFormat, VideoSummaryAmount
+from bot.locales.types import LanguageCode
+
+video_summary_cache = BoundedCache(
+    'video_summary',
+    config.VIDEO_SUMMARY_CACHE_TTL_SECONDS,
+    config.VIDEO_SUMMARY_CACHE_MAX_SIZE,
+)
+
+
+def get_video_summary_cache_key(
+    video_id: str,
+    language_code: LanguageCode,
+    focus: VideoSummaryFocus,
+    format: VideoSummaryFormat,
+    amount: VideoSummaryAmount,
+) -> str:
+    source = f'{video_id}:{language_code}:{focus}:{format}:{amount}'
+    return f'video_summary:{hashlib.sha256(source.encode()).hexdigest()}'
+
+
+async def get_cached_video_summary(
+    video_id: str,
+    language_code: LanguageCode,
+    focus: VideoSummaryFocus,
+    format: VideoSummaryFormat,
+    amount: VideoSummaryAmount,
+) -> Optional[str]:
+    summary = await video_summary_cache.get(get_video_summary_cache_key(video_id, language_code, focus, format, amount))
+    if summary:
+        return summary.decode()
+
+
+async def set_cached_video_summary(
+    video_id: str,
+    language_code: LanguageCode,
+    focus: VideoSummaryFocus,
+    format: VideoSummaryFormat,
+    amount: VideoSummaryAmount,
+    summary: str,
+):
+    await video_summary_cache.set(get_video_summary_cache_key(video_id, language_code, focus, format, amount), summary)
+
+
+async def get_video_summary_cache_stats() -> dict:
+    return await video_summary_cache.get_stats()
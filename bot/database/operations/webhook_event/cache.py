@@ -0,0 +1,70 @@
+import logging
+from enum import StrEnum
+from typing import Any, Awaitable, Callable, Optional
+
+from redis.exceptions import RedisError
+
+from bot.config import config
+from bot.database.cache import cache
+
+
+class WebhookProvider(StrEnum):
+    REPLICATE = 'replicate'
+    MIDJOURNEY = 'midjourney'
+    SUNO = 'suno'
+    KLING = 'kling'
+    LUMA = 'luma'
+
+
+def get_webhook_event_key(provider: WebhookProvider, event_id: str) -> str:
+    return f'webhook:{provider}:{event_id}'
+
+
+async def acquire_webhook_event(provider: WebhookProvider, event_id: Optional[str]) -> bool:
+    if not cache.redis or not event_id:
+        return True
+
+    try:
+        is_acquired = await cache.redis.set(
+            get_webhook_event_key(provider, event_id),
+            1,
+            nx=True,
+            ex=config.WEBHOOK_EVENT_TTL_SECONDS,
+        )
+    except RedisError as e:
+        logging.warning(f'Error in acquire_webhook_event: {e}')
+        return True
+
+    return bool(is_acquired)
+
+
+async def release_webhook_event(provider: WebhookProvider, event_id: Optional[str]):
+    if not cache.redis or not event_id:
+        return
+
+    try:
+        await cache.redis.delete(get_webhook_event_key(provider, event_id))
+    except RedisError as e:
+        logging.warning(f'Error in release_webhook_event: {e}')
+
+
+async def handle_webhook_event_once(
+    provider: WebhookProvider,
+    event_id: Optional[str],
+    handler: Callable[..., Awaitable[Any]],
+    *args,
+):
+    is_acquired = await acquire_webhook_event(provider, event_id)
+    if not is_acquired:
+        return True
+
+    try:
+        is_ok = await handler(*args)
+    except Exception:
+        await release_webhook_event(provider, event_id)
+        raise
+
+    if is_ok is False:
+        await release_webhook_event(provider, event_id)
+
+    return is_ok
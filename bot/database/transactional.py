@@ -0,0 +1,44 @@
+import logging
+from functools import wraps
+from typing import Awaitable, Callable
+from weakref import WeakKeyDictionary
+
+from google.cloud import firestore
+
+post_commit_callbacks: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def add_post_commit_callback(transaction, callback: Callable[[], Awaitable]):
+    post_commit_callbacks.setdefault(transaction, []).append(callback)
+
+
+async def run_post_commit_callbacks(transaction):
+    for callback in post_commit_callbacks.pop(transaction, []):
+        try:
+            await callback()
+        except Exception as e:
+            logging.warning(f'Error in run_post_commit_callbacks: {e}')
+
+
+def async_transactional(to_wrap):
+    # callbacks of a retried attempt are dropped, only the committed attempt is applied
+    @wraps(to_wrap)
+    async def attempt(transaction, *args, **kwargs):
+        post_commit_callbacks.pop(transaction, None)
+        return await to_wrap(transaction, *args, **kwargs)
+
+    transactional = firestore.async_transactional(attempt)
+
+    @wraps(to_wrap)
+    async def wrapper(transaction, *args, **kwargs):
+        try:
+            result = await transactional(transaction, *args, **kwargs)
+        except Exception:
+            post_commit_callbacks.pop(transaction, None)
+            raise
+
+        await run_post_commit_callbacks(transaction)
+
+        return result
+
+    return wrapper
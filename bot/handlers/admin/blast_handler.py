@@ -6,7 +6,7 @@ from aiogram.types import Message, CallbackQuery
 
 from bot.helpers.senders.send_message_to_users import send_message_to_users
 from bot.keyboards.admin.admin import build_admin_keyboard
-from bot.locales.translate_text import translate_text
+from bot.locales.translate_text import translate_text_to_languages
 from bot.keyboards.admin.blast import (
     build_blast_keyboard,
     build_blast_language_keyboard,
@@ -98,15 +98,11 @@ async def blast_letter_sent(message: Message, state: FSMContext):
     if blast_language != 'all':
         blast_letters[blast_language] = message.text
     else:
-        for language_code in localization_classes.keys():
-            if language_code == LanguageCode.RU:
-                blast_letters[language_code] = message.text
-            else:
-                translated_blast_letter = await translate_text(message.text, LanguageCode.RU, language_code)
-                if translated_blast_letter:
-                    blast_letters[language_code] = translated_blast_letter
-                else:
-                    blast_letters[language_code] = message.text
+        blast_letters = await translate_text_to_languages(
+            message.text,
+            LanguageCode.RU,
+            list(localization_classes.keys()),
+        )
 
     reply_markup = build_blast_confirmation_keyboard(user_language_code)
     await message.answer(
@@ -1,13 +1,15 @@
 from aiogram import Router, F
 from aiogram.fsm.context import FSMContext
-from aiogram.types import Message, CallbackQuery, URLInputFile
+from aiogram.types import Message, CallbackQuery
 
 from bot.database.main import firebase
 from bot.database.operations.role.getters import get_roles, get_role
 from bot.database.operations.role.updaters import update_role
 from bot.database.operations.role.writers import write_role
+from bot.database.operations.telegram_file.cache import TelegramFileType
+from bot.helpers.senders.send_cached_file import send_cached_file
 from bot.keyboards.admin.admin import build_admin_keyboard
-from bot.locales.translate_text import translate_text
+from bot.locales.translate_text import translate_text_to_languages
 from bot.keyboards.admin.catalog import (
     build_manage_catalog_keyboard,
     build_manage_catalog_create_keyboard,
@@ -63,8 +65,11 @@ async def handle_catalog_manage_selection(callback_query: CallbackQuery, state:
         role_photo_link = firebase.get_public_url(role_photo.name)
 
         reply_markup = build_manage_catalog_edit_keyboard(user_language_code, role.id)
-        await callback_query.message.answer_photo(
-            photo=URLInputFile(role_photo_link, filename=role.photo, timeout=300),
+        await send_cached_file(
+            callback_query.message.answer_photo,
+            role_photo_link,
+            TelegramFileType.PHOTO,
+            role.photo,
             caption=get_localization(user_language_code).admin_catalog_edit_role_info(
                 role_names=role.translated_names,
                 role_descriptions=role.translated_descriptions,
@@ -132,16 +137,11 @@ async def catalog_manage_create_role_system_name_sent(message: Message, state: F
 async def catalog_manage_create_role_name_sent(message: Message, state: FSMContext):
     user_language_code = await get_user_language(str(message.from_user.id), state.storage)
 
-    role_names = {}
-    for language_code in localization_classes.keys():
-        if language_code == LanguageCode.RU:
-            role_names[language_code] = message.text
-        else:
-            translated_role_name = await translate_text(message.text, LanguageCode.RU, language_code)
-            if translated_role_name:
-                role_names[language_code] = translated_role_name
-            else:
-                role_names[language_code] = message.text
+    role_names = await translate_text_to_languages(
+        message.text,
+        LanguageCode.RU,
+        list(localization_classes.keys()),
+    )
 
     reply_markup = build_cancel_keyboard(user_language_code)
     await message.answer(
@@ -157,16 +157,11 @@ async def catalog_manage_create_role_name_sent(message: Message, state: FSMConte
 async def catalog_manage_create_role_description_sent(message: Message, state: FSMContext):
     user_language_code = await get_user_language(str(message.from_user.id), state.storage)
 
-    role_descriptions = {}
-    for language_code in localization_classes.keys():
-        if language_code == LanguageCode.RU:
-            role_descriptions[language_code] = message.text
-        else:
-            translated_role_description = await translate_text(message.text, LanguageCode.RU, language_code)
-            if translated_role_description:
-                role_descriptions[language_code] = translated_role_description
-            else:
-                role_descriptions[language_code] = message.text
+    role_descriptions = await translate_text_to_languages(
+        message.text,
+        LanguageCode.RU,
+        list(localization_classes.keys()),
+    )
 
     reply_markup = build_cancel_keyboard(user_language_code)
     await message.answer(
@@ -182,16 +177,11 @@ async def catalog_manage_create_role_description_sent(message: Message, state: F
 async def catalog_manage_create_role_instruction_sent(message: Message, state: FSMContext):
     user_language_code = await get_user_language(str(message.from_user.id), state.storage)
 
-    role_instructions = {}
-    for language_code in localization_classes.keys():
-        if language_code == LanguageCode.RU:
-            role_instructions[language_code] = message.text
-        else:
-            translated_role_instruction = await translate_text(message.text, LanguageCode.RU, language_code)
-            if translated_role_instruction:
-                role_instructions[language_code] = translated_role_instruction
-            else:
-                role_instructions[language_code] = message.text
+    role_instructions = await translate_text_to_languages(
+        message.text,
+        LanguageCode.RU,
+        list(localization_classes.keys()),
+    )
 
     reply_markup = build_cancel_keyboard(user_language_code)
     await message.answer(
@@ -258,16 +248,11 @@ async def catalog_manage_edit_role_sent(message: Message, state: FSMContext):
     user_language_code = await get_user_language(str(message.from_user.id), state.storage)
     user_data = await state.get_data()
 
-    role_info = {}
-    for language_code in localization_classes.keys():
-        if language_code == LanguageCode.RU:
-            role_info[language_code] = message.text
-        else:
-            translated_role_name = await translate_text(message.text, LanguageCode.RU, language_code)
-            if translated_role_name:
-                role_info[language_code] = translated_role_name
-            else:
-                role_info[language_code] = message.text
+    role_info = await translate_text_to_languages(
+        message.text,
+        LanguageCode.RU,
+        list(localization_classes.keys()),
+    )
 
     role = await get_role(user_data['role_id'])
     info_type = user_data['info_type']
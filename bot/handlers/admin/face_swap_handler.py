@@ -3,7 +3,7 @@ from typing import cast
 
 from aiogram import Router, F
 from aiogram.fsm.context import FSMContext
-from aiogram.types import Message, CallbackQuery, URLInputFile, InlineKeyboardMarkup, InlineKeyboardButton
+from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.utils.chat_action import ChatActionSender
 
 from bot.config import config, MessageSticker
@@ -21,8 +21,10 @@ from bot.database.operations.face_swap_package.writers import write_face_swap_pa
 from bot.database.operations.generation.writers import write_generation
 from bot.database.operations.product.getters import get_product_by_quota
 from bot.database.operations.request.writers import write_request
+from bot.database.operations.telegram_file.cache import TelegramFileType
+from bot.helpers.senders.send_cached_file import send_cached_file
 from bot.keyboards.admin.admin import build_admin_keyboard
-from bot.locales.translate_text import translate_text
+from bot.locales.translate_text import translate_text_to_languages
 from bot.integrations.replicateAI import create_face_swap_image
 from bot.keyboards.admin.face_swap import (
     build_manage_face_swap_keyboard,
@@ -131,16 +133,11 @@ async def face_swap_manage_name_sent(message: Message, state: FSMContext):
     user_language_code = await get_user_language(str(message.from_user.id), state.storage)
     user_data = await state.get_data()
 
-    face_swap_package_names = {}
-    for language_code in localization_classes.keys():
-        if language_code == LanguageCode.RU:
-            face_swap_package_names[language_code] = message.text
-        else:
-            translated_face_swap_package_name = await translate_text(message.text, LanguageCode.RU, language_code)
-            if translated_face_swap_package_name:
-                face_swap_package_names[language_code] = translated_face_swap_package_name
-            else:
-                face_swap_package_names[language_code] = message.text
+    face_swap_package_names = await translate_text_to_languages(
+        message.text,
+        LanguageCode.RU,
+        list(localization_classes.keys()),
+    )
 
     reply_markup = build_manage_face_swap_create_confirmation_keyboard(user_language_code)
     await message.answer(
@@ -236,8 +233,11 @@ async def show_picture(
         photo = await firebase.bucket.get_blob(photo_path)
         photo_link = firebase.get_public_url(photo.name)
 
-        await callback_query.message.answer_photo(
-            photo=URLInputFile(photo_link, filename=photo_path, timeout=300),
+        await send_cached_file(
+            callback_query.message.answer_photo,
+            photo_link,
+            TelegramFileType.PHOTO,
+            photo_path,
             caption=f'<b>{file_name}</b>\n\n{file_status}',
             reply_markup=reply_markup,
         )
@@ -2,7 +2,7 @@ from datetime import datetime
 
 from aiogram import Router, F
 from aiogram.fsm.context import FSMContext
-from aiogram.types import Message, CallbackQuery, URLInputFile
+from aiogram.types import Message, CallbackQuery
 
 from bot.database.main import firebase
 from bot.database.models.product import ProductType, ProductCategory
@@ -11,6 +11,8 @@ from bot.database.models.subscription import SubscriptionPeriod
 from bot.database.operations.product.getters import get_active_products_by_product_type_and_category, get_product
 from bot.database.operations.promo_code.getters import get_promo_code_by_name
 from bot.database.operations.promo_code.writers import write_promo_code
+from bot.database.operations.telegram_file.cache import TelegramFileType
+from bot.helpers.senders.send_cached_file import send_cached_file
 from bot.keyboards.admin.admin import build_admin_keyboard
 from bot.keyboards.admin.promo_code import (
     build_create_promo_code_keyboard,
@@ -62,8 +64,11 @@ async def handle_create_promo_code_selection(callback_query: CallbackQuery, stat
 
         caption = get_localization(user_language_code).ADMIN_PROMO_CODE_CHOOSE_SUBSCRIPTION
         reply_markup = build_create_promo_code_subscription_keyboard(user_language_code, products)
-        await callback_query.message.answer_photo(
-            photo=URLInputFile(photo_link, filename=photo_path, timeout=300),
+        await send_cached_file(
+            callback_query.message.answer_photo,
+            photo_link,
+            TelegramFileType.PHOTO,
+            photo_path,
             caption=caption,
             reply_markup=reply_markup,
         )
@@ -76,8 +81,11 @@ async def handle_create_promo_code_selection(callback_query: CallbackQuery, stat
 
         caption = get_localization(user_language_code).ADMIN_PROMO_CODE_CHOOSE_PACKAGE
         reply_markup = build_create_promo_code_package_keyboard(user_language_code, products)
-        await callback_query.message.answer_photo(
-            photo=URLInputFile(photo_link, filename=photo_path, timeout=300),
+        await send_cached_file(
+            callback_query.message.answer_photo,
+            photo_link,
+            TelegramFileType.PHOTO,
+            photo_path,
             caption=caption,
             reply_markup=reply_markup,
         )
@@ -23,6 +23,12 @@ from bot.database.operations.game.getters import get_count_of_games, get_sum_of_
 from bot.database.operations.generation.getters import get_count_of_generations
 from bot.database.operations.product.getters import get_products
 from bot.database.operations.promo_code.getters import get_count_of_used_promo_codes
+from bot.database.operations.statistics.getters import (
+    is_statistics_ready,
+    get_statistics,
+    get_count_of_statistics_users,
+)
+from bot.database.operations.statistics.helpers import get_statistics_days
 from bot.database.operations.subscription.getters import get_count_of_subscriptions, get_subscription
 from bot.database.operations.transaction.writers import write_transaction
 from bot.database.operations.user.getters import get_user, get_count_of_users, get_count_of_users_referred_by
@@ -64,21 +70,7 @@ async def get_zero():
     return 0
 
 
-async def get_statistics_by_transactions_query(
-    products: list[Product],
-    start_date: Optional[datetime] = None,
-    end_date: Optional[datetime] = None,
-):
-    subscription_users = {
-        product.id: set() for product in products if product.type == ProductType.SUBSCRIPTION
-    }
-    subscription_users[ServiceType.FREE] = set()
-
-    paid_users = set()
-    activated_users = set()
-
-    user_cache = {}
-
+def get_default_statistics(products: list[Product]):
     default_transaction_nested_dict = {
         'SUCCESS': 0,
         'FAIL': 0,
@@ -94,7 +86,6 @@ async def get_statistics_by_transactions_query(
     count_all_transactions[ServiceType.DATABASE] = default_transaction_nested_dict.copy()
     count_all_transactions[ServiceType.OTHER] = default_transaction_nested_dict.copy()
 
-    count_income_money_total = 0
     count_income_money = {
         product.id: 0 for product in products
         if product.id not in {
@@ -129,17 +120,64 @@ async def get_statistics_by_transactions_query(
         'ALL': 0,
     })
 
-    service_subscriptions = [
-        product.id for product in products
-        if product.type == ProductType.SUBSCRIPTION
-    ]
+    return count_all_transactions, count_income_money, count_expense_money
+
+
+def calculate_average_prices(
+    products: list[Product],
+    count_all_transactions: dict,
+    count_expense_money: dict,
+    count_subscription_users: dict[str, int],
+):
     service_ai_models = [
         product.id for product in products
         if product.type == ProductType.PACKAGE and product.category != ProductCategory.OTHER
     ]
-    service_packages = service_ai_models + [
+
+    for service in service_ai_models:
+        successes = count_all_transactions[service]['SUCCESS']
+        fails = count_all_transactions[service]['FAIL']
+        examples = count_all_transactions[service]['EXAMPLE']
+        total = successes + fails
+
+        average_price = count_expense_money[service]['AVERAGE_PRICE']
+        average_example_price = count_expense_money[service]['AVERAGE_EXAMPLE_PRICE']
+
+        count_expense_money[service]['AVERAGE_PRICE'] = average_price / total \
+            if total > 0 else 0
+        count_expense_money[service]['AVERAGE_EXAMPLE_PRICE'] = average_example_price / examples \
+            if examples > 0 else 0
+    for key, value in count_subscription_users.items():
+        count_expense_money[key]['AVERAGE_PRICE'] = (
+            count_expense_money[key]['ALL'] / value
+        ) if value else 0
+
+
+async def get_statistics_by_transactions_query(
+    products: list[Product],
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+):
+    subscription_users = {
+        product.id: set() for product in products if product.type == ProductType.SUBSCRIPTION
+    }
+    subscription_users[ServiceType.FREE] = set()
+
+    paid_users = set()
+    activated_users = set()
+
+    user_cache = {}
+
+    count_all_transactions, count_income_money, count_expense_money = get_default_statistics(products)
+    count_income_money_total = 0
+
+    service_subscriptions = [
+        product.id for product in products
+        if product.type == ProductType.SUBSCRIPTION
+    ]
+    service_packages = [
         product.id for product in products
-        if product.type == ProductType.PACKAGE and product.category == ProductCategory.OTHER
+        if product.type == ProductType.PACKAGE
     ]
 
     transactions_query = firebase.db.collection(Transaction.COLLECTION_NAME).order_by('created_at')
@@ -240,27 +278,75 @@ async def get_statistics_by_transactions_query(
 
         last_doc = doc
 
-    for service in service_ai_models:
-        successes = count_all_transactions[service]['SUCCESS']
-        fails = count_all_transactions[service]['FAIL']
-        examples = count_all_transactions[service]['EXAMPLE']
-        total = successes + fails
+    calculate_average_prices(
+        products,
+        count_all_transactions,
+        count_expense_money,
+        {key: len(value) for key, value in subscription_users.items()},
+    )
 
-        average_price = count_expense_money[service]['AVERAGE_PRICE']
-        average_example_price = count_expense_money[service]['AVERAGE_EXAMPLE_PRICE']
+    return (
+        len(paid_users),
+        len(activated_users),
+        count_all_transactions,
+        count_income_money_total,
+        count_income_money,
+        count_expense_money,
+    )
 
-        count_expense_money[service]['AVERAGE_PRICE'] = average_price / total \
-            if total > 0 else 0
-        count_expense_money[service]['AVERAGE_EXAMPLE_PRICE'] = average_example_price / examples \
-            if examples > 0 else 0
-    for key, value in subscription_users.items():
-        count_expense_money[key]['AVERAGE_PRICE'] = (
-            count_expense_money[key]['ALL'] / len(value)
-        ) if len(value) else 0
+
+async def get_statistics_by_rollups(products: list[Product], days: list[str]):
+    count_all_transactions, count_income_money, count_expense_money = get_default_statistics(products)
+    count_income_money_total = 0
+
+    subscription_keys = [
+        product.id for product in products if product.type == ProductType.SUBSCRIPTION
+    ] + [ServiceType.FREE]
+
+    (
+        transactions,
+        income,
+        expense,
+        count_paid_users,
+        count_activated_users,
+        *count_subscription_users,
+    ) = await asyncio.gather(
+        get_statistics(days, 'transactions'),
+        get_statistics(days, 'income'),
+        get_statistics(days, 'expense'),
+        get_count_of_statistics_users(days, 'paid_users'),
+        get_count_of_statistics_users(days, 'activated_users'),
+        *[get_count_of_statistics_users(days, f'subscription_users:{key}') for key in subscription_keys],
+    )
+
+    for key, value in transactions.items():
+        product_id, name = key.rsplit(':', 1)
+        if product_id in count_all_transactions:
+            count_all_transactions[product_id][name] += int(value)
+    for key, value in income.items():
+        if key == 'COUNT':
+            count_income_money_total = int(value)
+        elif key in count_income_money:
+            count_income_money[key] += value
+    for key, value in expense.items():
+        if key == 'ALL':
+            count_expense_money['ALL'] += value
+            continue
+
+        product_id, name = key.rsplit(':', 1)
+        if product_id in count_expense_money:
+            count_expense_money[product_id][name] += value
+
+    calculate_average_prices(
+        products,
+        count_all_transactions,
+        count_expense_money,
+        dict(zip(subscription_keys, count_subscription_users)),
+    )
 
     return (
-        paid_users,
-        activated_users,
+        count_paid_users,
+        count_activated_users,
         count_all_transactions,
         count_income_money_total,
         count_income_money,
@@ -268,6 +354,19 @@ async def get_statistics_by_transactions_query(
     )
 
 
+async def get_statistics_by_period(
+    products: list[Product],
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+):
+    if start_date and end_date:
+        days = get_statistics_days(start_date, end_date)
+        if await is_statistics_ready(days):
+            return await get_statistics_by_rollups(products, days)
+
+    return await get_statistics_by_transactions_query(products, start_date, end_date)
+
+
 async def handle_get_statistics(language_code: LanguageCode, period: str):
     current_date = datetime.now(timezone.utc)
     start_date = None
@@ -598,35 +697,30 @@ async def handle_get_statistics(language_code: LanguageCode, period: str):
 
     # transactions
     (
-        paid_users,
-        activated_users,
+        count_paid_users,
+        count_activated_users,
         count_all_transactions,
         count_income_money_total,
         count_income_money,
         count_expense_money,
-    ) = await get_statistics_by_transactions_query(
+    ) = await get_statistics_by_period(
         products=products,
         start_date=start_date,
         end_date=end_date,
     )
     (
-        paid_users_before,
-        activated_users_before,
+        count_paid_users_before,
+        count_activated_users_before,
         count_all_transactions_before,
         count_income_money_total_before,
         count_income_money_before,
         count_expense_money_before,
-    ) = await get_statistics_by_transactions_query(
+    ) = await get_statistics_by_period(
         products=products,
         start_date=start_date_before,
         end_date=end_date_before,
     )
 
-    count_activated_users = len(activated_users)
-    count_activated_users_before = len(activated_users_before)
-    count_paid_users = len(paid_users)
-    count_paid_users_before = len(paid_users_before)
-
     count_games = {
         key: 0 for key in list(GameType.__members__.keys())
     }
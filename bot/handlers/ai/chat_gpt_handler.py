@@ -14,7 +14,6 @@ from bot.database.models.common import Quota, Currency, Model, ChatGPTVersion
 from bot.database.models.transaction import TransactionType
 from bot.database.models.user import UserSettings, User
 from bot.database.operations.chat.getters import get_chat
-from bot.database.operations.message.getters import get_messages_by_chat_id
 from bot.database.operations.message.writers import write_message
 from bot.database.operations.product.getters import get_product_by_quota
 from bot.database.operations.role.getters import get_role
@@ -22,12 +21,14 @@ from bot.database.operations.transaction.writers import write_transaction
 from bot.database.operations.user.getters import get_user
 from bot.database.operations.user.updaters import update_user
 from bot.helpers.creaters.create_new_message_and_update_user import create_new_message_and_update_user
+from bot.helpers.getters.get_context_messages import get_context_messages
 from bot.helpers.getters.get_quota_by_model import get_quota_by_model
 from bot.helpers.getters.get_switched_to_ai_model import get_switched_to_ai_model
+from bot.helpers.getters.get_vision_photos import get_vision_photo_link
 from bot.helpers.reply_with_voice import reply_with_voice
 from bot.helpers.senders.send_error_info import send_error_info
-from bot.helpers.senders.send_ai_message import send_ai_message
-from bot.integrations.openAI import get_response_message
+from bot.helpers.senders.send_ai_message import send_ai_message, get_ai_message_header_text, AIMessageStream
+from bot.integrations.openAI import get_response_message, get_response_message_stream
 from bot.keyboards.ai.chat_gpt import build_chat_gpt_keyboard
 from bot.keyboards.ai.model import build_switched_to_ai_keyboard
 from bot.keyboards.common.common import (
@@ -171,22 +172,12 @@ async def handle_chatgpt(message: Message, state: FSMContext, user: User, user_q
         await write_message(user.current_chat_id, 'user', user.id, text)
 
     chat = await get_chat(user.current_chat_id)
-    if user_quota == Quota.CHAT_GPT_O_1:
-        limit = 2
-    elif user_quota == Quota.CHAT_GPT_O_1_MINI:
-        limit = 6
-    elif not user.subscription_id:
-        limit = 4
-    elif user_quota not in [Quota.CHAT_GPT_O_1, Quota.CHAT_GPT_O_1_MINI]:
-        limit = 8
-    else:
-        limit = 4
-    messages = await get_messages_by_chat_id(
+    role = await get_role(chat.role_id)
+    sorted_messages = await get_context_messages(
         chat_id=user.current_chat_id,
-        limit=limit,
+        version=user.settings[user.current_model][UserSettings.VERSION],
+        system_prompt=role.translated_instructions.get(user_language_code, LanguageCode.EN),
     )
-    role = await get_role(chat.role_id)
-    sorted_messages = sorted(messages, key=lambda m: m.created_at)
     history = []
     if can_work_with_photos:
         history.append({
@@ -204,9 +195,7 @@ async def handle_chatgpt(message: Message, state: FSMContext, user: User, user_q
 
         if sorted_message.photo_filenames and can_work_with_photos:
             for photo_filename in sorted_message.photo_filenames:
-                photo_path = f'users/vision/{user.id}/{photo_filename}'
-                photo = await firebase.bucket.get_blob(photo_path)
-                photo_link = firebase.get_public_url(photo.name)
+                photo_link = get_vision_photo_link(user.id, photo_filename)
 
                 if photo_filename.split('.')[-1] not in ['png', 'jpg', 'jpeg', 'gif', 'webp']:
                     continue
@@ -237,8 +226,17 @@ async def handle_chatgpt(message: Message, state: FSMContext, user: User, user_q
         chat_action_sender = ChatActionSender.typing
 
     async with chat_action_sender(bot=message.bot, chat_id=message.chat.id):
+        header_text = get_ai_message_header_text(user, chat, role, user_language_code)
+        ai_message_stream = AIMessageStream(message, header_text)
         try:
-            response = await get_response_message(user.settings[user.current_model][UserSettings.VERSION], history)
+            if user.settings[user.current_model][UserSettings.TURN_ON_VOICE_MESSAGES]:
+                response = await get_response_message(user.settings[user.current_model][UserSettings.VERSION], history)
+            else:
+                response = await get_response_message_stream(
+                    user.settings[user.current_model][UserSettings.VERSION],
+                    history,
+                    ai_message_stream.update,
+                )
             response_message = response['message']
             if user_quota == Quota.CHAT_GPT4_OMNI_MINI:
                 input_price = response['input_tokens'] * PRICE_GPT4_OMNI_MINI_INPUT
@@ -288,20 +286,12 @@ async def handle_chatgpt(message: Message, state: FSMContext, user: User, user_q
                     voice=user.settings[user.current_model][UserSettings.VOICE],
                 )
             else:
-                chat_info = f'💬 {chat.title}\n' if (
-                    user.settings[user.current_model][UserSettings.SHOW_THE_NAME_OF_THE_CHATS]
-                ) else ''
-                role_info = f'{role.translated_names.get(user_language_code, "en")}\n' if (
-                    user.settings[user.current_model][UserSettings.SHOW_THE_NAME_OF_THE_ROLES]
-                ) else ''
-                header_text = f'{chat_info}{role_info}\n' if chat_info or role_info else ''
                 footer_text = f'\n\n✉️ {user.daily_limits[user_quota] + user.additional_usage_quota[user_quota] + 1}' \
                     if user.settings[user.current_model][UserSettings.SHOW_USAGE_QUOTA] and \
                        user.daily_limits[user_quota] != float('inf') else ''
                 reply_markup = build_continue_generating_keyboard(user_language_code)
-                full_text = f"{header_text}{message_content}{footer_text}"
-                await send_ai_message(
-                    message=message,
+                full_text = f'{header_text}{message_content}{footer_text}'
+                await ai_message_stream.finish(
                     text=full_text,
                     reply_markup=reply_markup if response['finish_reason'] == 'length' else None,
                 )
@@ -348,6 +338,7 @@ async def handle_chatgpt(message: Message, state: FSMContext, user: User, user_q
                 hashtags=['chatgpt'],
             )
         finally:
+            await ai_message_stream.abort()
             await processing_sticker.delete()
             await processing_message.delete()
             await state.update_data(is_processing=False)
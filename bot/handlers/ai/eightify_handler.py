@@ -15,6 +15,7 @@ from bot.database.operations.product.getters import get_product_by_quota
 from bot.database.operations.transaction.writers import write_transaction
 from bot.database.operations.user.getters import get_user
 from bot.database.operations.user.updaters import update_user
+from bot.database.operations.video_summary.cache import get_cached_video_summary, set_cached_video_summary
 from bot.helpers.getters.get_quota_by_model import get_quota_by_model
 from bot.helpers.getters.get_switched_to_ai_model import get_switched_to_ai_model
 from bot.helpers.reply_with_voice import reply_with_voice
@@ -127,13 +128,34 @@ async def handle_eightify(message: Message, state: FSMContext, user: User):
             else:
                 product = await get_product_by_quota(Quota.EIGHTIFY)
 
-                response_summary = await generate_summary(
-                    language_code=user_language_code,
-                    video_id=video_id,
-                    focus=user.settings[Model.EIGHTIFY][UserSettings.FOCUS],
-                    format=user.settings[Model.EIGHTIFY][UserSettings.FORMAT],
-                    amount=user.settings[Model.EIGHTIFY][UserSettings.AMOUNT],
+                focus = user.settings[Model.EIGHTIFY][UserSettings.FOCUS]
+                format = user.settings[Model.EIGHTIFY][UserSettings.FORMAT]
+                amount = user.settings[Model.EIGHTIFY][UserSettings.AMOUNT]
+
+                response_summary = await get_cached_video_summary(
+                    video_id,
+                    user_language_code,
+                    focus,
+                    format,
+                    amount,
                 )
+                is_cached = response_summary is not None
+                if not is_cached:
+                    response_summary = await generate_summary(
+                        language_code=user_language_code,
+                        video_id=video_id,
+                        focus=focus,
+                        format=format,
+                        amount=amount,
+                    )
+                    await set_cached_video_summary(
+                        video_id,
+                        user_language_code,
+                        focus,
+                        format,
+                        amount,
+                        response_summary,
+                    )
 
                 await write_transaction(
                     user_id=user.id,
@@ -146,6 +168,7 @@ async def handle_eightify(message: Message, state: FSMContext, user: User):
                     details={
                         'request': link,
                         'answer': response_summary,
+                        'is_cached': is_cached,
                         'has_error': False,
                     },
                 )
@@ -8,7 +8,6 @@ from aiogram.fsm.context import FSMContext
 from aiogram.types import (
     Message,
     CallbackQuery,
-    URLInputFile,
 )
 from aiogram.utils.chat_action import ChatActionSender
 
@@ -39,10 +38,12 @@ from bot.database.operations.product.getters import get_product_by_quota
 from bot.database.operations.request.getters import get_started_requests_by_user_id_and_product_id
 from bot.database.operations.request.updaters import update_request
 from bot.database.operations.request.writers import write_request
+from bot.database.operations.telegram_file.cache import TelegramFileType
 from bot.database.operations.user.getters import get_user
 from bot.database.operations.user.updaters import update_user
 from bot.helpers.getters.get_quota_by_model import get_quota_by_model
 from bot.helpers.getters.get_switched_to_ai_model import get_switched_to_ai_model
+from bot.helpers.senders.send_cached_file import send_cached_file
 from bot.helpers.senders.send_error_info import send_error_info
 from bot.integrations.luma import get_response_face_swap
 from bot.integrations.replicateAI import create_face_swap_images
@@ -172,15 +173,17 @@ async def handle_face_swap(bot: Bot, chat_id: str, state: FSMContext, user_id: s
                 )
         except aiohttp.ClientResponseError:
             photo_path = 'users/avatars/example.png'
-            photo = await firebase.bucket.get_blob(photo_path)
-            photo_link = firebase.get_public_url(photo.name)
+            photo_link = firebase.get_public_url(photo_path)
 
             reply_markup = build_cancel_keyboard(user_language_code)
-            await bot.send_photo(
+            await send_cached_file(
+                bot.send_photo,
+                photo_link,
+                TelegramFileType.PHOTO,
+                photo_path,
                 chat_id=chat_id,
-                photo=URLInputFile(photo_link, filename=photo_path, timeout=300),
                 caption=get_localization(user_language_code).PROFILE_SEND_ME_YOUR_PICTURE,
-                reply_markup=reply_markup
+                reply_markup=reply_markup,
             )
             await state.set_state(Profile.waiting_for_photo)
 
@@ -261,14 +264,16 @@ async def handle_face_swap_prompt(
             )
         except aiohttp.ClientResponseError:
             photo_path = 'users/avatars/example.png'
-            photo = await firebase.bucket.get_blob(photo_path)
-            photo_link = firebase.get_public_url(photo.name)
+            photo_link = firebase.get_public_url(photo_path)
 
             reply_markup = build_cancel_keyboard(user_language_code)
-            await message.answer_photo(
-                photo=URLInputFile(photo_link, filename=photo_path, timeout=300),
+            await send_cached_file(
+                message.answer_photo,
+                photo_link,
+                TelegramFileType.PHOTO,
+                photo_path,
                 caption=get_localization(user_language_code).PROFILE_SEND_ME_YOUR_PICTURE,
-                reply_markup=reply_markup
+                reply_markup=reply_markup,
             )
             await state.set_state(Profile.waiting_for_photo)
 
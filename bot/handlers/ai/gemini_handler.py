@@ -1,14 +1,11 @@
 import asyncio
-import base64
 from datetime import datetime, timezone
 
-import httpx
 from aiogram import Router
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.chat_action import ChatActionSender
-from filetype import filetype
 from google.generativeai.types import StopCandidateException, BlockedPromptException
 
 from bot.config import config, MessageEffect, MessageSticker
@@ -17,7 +14,6 @@ from bot.database.models.common import Model, GeminiGPTVersion, Quota, Currency
 from bot.database.models.transaction import TransactionType
 from bot.database.models.user import UserSettings, User
 from bot.database.operations.chat.getters import get_chat
-from bot.database.operations.message.getters import get_messages_by_chat_id
 from bot.database.operations.message.writers import write_message
 from bot.database.operations.product.getters import get_product_by_quota
 from bot.database.operations.role.getters import get_role
@@ -25,12 +21,14 @@ from bot.database.operations.transaction.writers import write_transaction
 from bot.database.operations.user.getters import get_user
 from bot.database.operations.user.updaters import update_user
 from bot.helpers.creaters.create_new_message_and_update_user import create_new_message_and_update_user
+from bot.helpers.getters.get_context_messages import get_context_messages
 from bot.helpers.getters.get_quota_by_model import get_quota_by_model
 from bot.helpers.getters.get_switched_to_ai_model import get_switched_to_ai_model
+from bot.helpers.getters.get_vision_photos import get_vision_photos
 from bot.helpers.reply_with_voice import reply_with_voice
-from bot.helpers.senders.send_ai_message import send_ai_message
+from bot.helpers.senders.send_ai_message import send_ai_message, get_ai_message_header_text, AIMessageStream
 from bot.helpers.senders.send_error_info import send_error_info
-from bot.integrations.googleAI import get_response_message
+from bot.integrations.googleAI import get_response_message, get_response_message_stream
 from bot.keyboards.ai.gemini import build_gemini_keyboard
 from bot.keyboards.ai.model import build_switched_to_ai_keyboard
 from bot.keyboards.common.common import (
@@ -175,22 +173,20 @@ async def handle_gemini(
         await write_message(user.current_chat_id, 'user', user.id, text)
 
     chat = await get_chat(user.current_chat_id)
-    if not user.subscription_id:
-        limit = 6
-    elif user_quota == Quota.GEMINI_1_ULTRA:
-        limit = 20
-    else:
-        limit = 12
-    messages = await get_messages_by_chat_id(
+    role = await get_role(chat.role_id)
+    sorted_messages = await get_context_messages(
         chat_id=user.current_chat_id,
-        limit=limit,
+        version=user.settings[user.current_model][UserSettings.VERSION],
+        system_prompt=role.translated_instructions.get(user_language_code, LanguageCode.EN),
     )
-    role = await get_role(chat.role_id)
-    sorted_messages = sorted(messages, key=lambda m: m.created_at)
     if single_mode:
         sorted_messages = [sorted_messages[-1]]
     system_prompt = role.translated_instructions.get(user_language_code, LanguageCode.EN)
     history = []
+    photos = await get_vision_photos(user.id, [
+        photo_filename for sorted_message in sorted_messages
+        for photo_filename in sorted_message.photo_filenames
+    ])
     for sorted_message in sorted_messages:
         parts = []
         if sorted_message.content:
@@ -198,27 +194,17 @@ async def handle_gemini(
 
         if sorted_message.photo_filenames:
             for photo_filename in sorted_message.photo_filenames:
-                photo_path = f'users/vision/{user.id}/{photo_filename}'
-                photo = await firebase.bucket.get_blob(photo_path)
-                photo_link = firebase.get_public_url(photo.name)
-
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(photo_link)
-                    response_content = response.content
-
-                kind = await asyncio.to_thread(lambda: filetype.guess(response_content))
-                if kind:
-                    media_type = kind.mime
-                else:
-                    media_type = 'image/jpeg'
+                photo = photos.get(photo_filename)
+                if not photo:
+                    continue
 
+                media_type = photo['media_type']
                 if not media_type.startswith('image') and not single_mode:
                     continue
 
-                data = await asyncio.to_thread(lambda: base64.b64encode(response_content).decode('utf-8'))
                 parts.append({
                     'mime_type': media_type,
-                    'data': data,
+                    'data': photo['data'],
                 })
 
         if parts:
@@ -241,12 +227,22 @@ async def handle_gemini(
         chat_action_sender = ChatActionSender.typing
 
     async with chat_action_sender(bot=message.bot, chat_id=message.chat.id):
+        header_text = get_ai_message_header_text(user, chat, role, user_language_code)
+        ai_message_stream = AIMessageStream(message, header_text)
         try:
-            response = await get_response_message(
-                model_version=user.settings[user.current_model][UserSettings.VERSION],
-                system_prompt=system_prompt,
-                history=history,
-            )
+            if user.settings[user.current_model][UserSettings.TURN_ON_VOICE_MESSAGES]:
+                response = await get_response_message(
+                    model_version=user.settings[user.current_model][UserSettings.VERSION],
+                    system_prompt=system_prompt,
+                    history=history,
+                )
+            else:
+                response = await get_response_message_stream(
+                    model_version=user.settings[user.current_model][UserSettings.VERSION],
+                    system_prompt=system_prompt,
+                    history=history,
+                    on_text=ai_message_stream.update,
+                )
             response_message = response['message']
             if user_quota == Quota.GEMINI_2_FLASH:
                 input_price = response['input_tokens'] * PRICE_GEMINI_2_FLASH_INPUT
@@ -293,20 +289,12 @@ async def handle_gemini(
                     voice=user.settings[user.current_model][UserSettings.VOICE],
                 )
             else:
-                chat_info = f'💬 {chat.title}\n' if (
-                    user.settings[user.current_model][UserSettings.SHOW_THE_NAME_OF_THE_CHATS]
-                ) else ''
-                role_info = f'{role.translated_names.get(user_language_code, "en")}\n' if (
-                    user.settings[user.current_model][UserSettings.SHOW_THE_NAME_OF_THE_ROLES]
-                ) else ''
-                header_text = f'{chat_info}{role_info}\n' if chat_info or role_info else ''
                 footer_text = f'\n\n✉️ {user.daily_limits[user_quota] + user.additional_usage_quota[user_quota] + 1}' \
                     if user.settings[user.current_model][UserSettings.SHOW_USAGE_QUOTA] and \
                        user.daily_limits[user_quota] != float('inf') else ''
                 reply_markup = build_continue_generating_keyboard(user_language_code)
                 full_text = f'{header_text}{message_content}{footer_text}'
-                await send_ai_message(
-                    message=message,
+                await ai_message_stream.finish(
                     text=full_text,
                     reply_markup=reply_markup if response['finish_reason'] == 'MAX_TOKENS' else None,
                 )
@@ -336,6 +324,7 @@ async def handle_gemini(
                 hashtags=['gemini'],
             )
         finally:
+            await ai_message_stream.abort()
             await processing_sticker.delete()
             await processing_message.delete()
             await state.update_data(is_processing=False)
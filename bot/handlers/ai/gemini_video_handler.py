@@ -15,6 +15,7 @@ from bot.database.operations.product.getters import get_product_by_quota
 from bot.database.operations.transaction.writers import write_transaction
 from bot.database.operations.user.getters import get_user
 from bot.database.operations.user.updaters import update_user
+from bot.helpers.getters.get_gemini_video_file import get_gemini_video_file
 from bot.helpers.getters.get_quota_by_model import get_quota_by_model
 from bot.helpers.getters.get_switched_to_ai_model import get_switched_to_ai_model
 from bot.helpers.reply_with_voice import reply_with_voice
@@ -110,9 +111,10 @@ async def handle_gemini_video(message: Message, state: FSMContext, user: User, v
 
     async with chat_action_sender(bot=message.bot, chat_id=message.chat.id):
         try:
+            video_file = await get_gemini_video_file(video_link)
             response = await get_response_video_summary(
                 prompt=system_prompt,
-                video_file_link=video_link,
+                video_file=video_file,
             )
             response_summary = response['message']
             input_price = response['input_tokens'] * PRICE_GEMINI_VIDEO_INPUT
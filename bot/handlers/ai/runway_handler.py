@@ -8,18 +8,24 @@ from aiogram.types import Message
 from aiogram.utils.chat_action import ChatActionSender
 
 from bot.config import config, MessageEffect, MessageSticker
-from bot.database.models.common import Model, Quota, Currency, SendType
-from bot.database.models.transaction import TransactionType
+from bot.database.models.common import Model, Quota
+from bot.database.models.generation import GenerationStatus
+from bot.database.models.request import RequestStatus
 from bot.database.models.user import UserSettings, User
+from bot.database.operations.generation.getters import get_generations_by_request_id
+from bot.database.operations.generation.updaters import update_generation
+from bot.database.operations.generation.writers import write_generation
 from bot.database.operations.product.getters import get_product_by_quota
-from bot.database.operations.transaction.writers import write_transaction
+from bot.database.operations.request.getters import get_started_requests_by_user_id_and_product_id
+from bot.database.operations.request.updaters import update_request
+from bot.database.operations.request.writers import write_request
 from bot.database.operations.user.getters import get_user
 from bot.database.operations.user.updaters import update_user
 from bot.helpers.getters.get_quota_by_model import get_quota_by_model
 from bot.helpers.getters.get_switched_to_ai_model import get_switched_to_ai_model
+from bot.helpers.runway_poller import runway_poller
 from bot.helpers.senders.send_error_info import send_error_info
-from bot.helpers.updaters.update_user_usage_quota import update_user_usage_quota
-from bot.integrations.runway import get_response_video, get_cost_for_video
+from bot.integrations.runway import create_video, get_cost_for_video
 from bot.keyboards.ai.model import build_switched_to_ai_keyboard
 from bot.keyboards.common.common import build_limit_exceeded_keyboard, build_error_keyboard
 from bot.locales.main import get_user_language, get_localization
@@ -99,26 +105,52 @@ async def handle_runway(message: Message, state: FSMContext, user: User, video_f
     )
 
     async with ChatActionSender.upload_video(bot=message.bot, chat_id=message.chat.id):
-        try:
-            maximum_generations = user.daily_limits[Quota.RUNWAY] + user.additional_usage_quota[Quota.RUNWAY]
-            model_version = user.settings[Model.RUNWAY][UserSettings.VERSION]
-            resolution = user.settings[Model.RUNWAY][UserSettings.RESOLUTION]
-            duration = user.settings[Model.RUNWAY][UserSettings.DURATION]
+        maximum_generations = user.daily_limits[Quota.RUNWAY] + user.additional_usage_quota[Quota.RUNWAY]
+        model_version = user.settings[Model.RUNWAY][UserSettings.VERSION]
+        resolution = user.settings[Model.RUNWAY][UserSettings.RESOLUTION]
+        duration = user.settings[Model.RUNWAY][UserSettings.DURATION]
 
-            cost = get_cost_for_video(duration)
-            if maximum_generations < cost:
-                await message.answer_sticker(
-                    sticker=config.MESSAGE_STICKERS.get(MessageSticker.SAD),
-                )
+        cost = get_cost_for_video(duration)
+        if maximum_generations < cost:
+            await message.answer_sticker(
+                sticker=config.MESSAGE_STICKERS.get(MessageSticker.SAD),
+            )
 
-                reply_markup = build_limit_exceeded_keyboard(user_language_code)
-                await message.reply(
-                    text=get_localization(user_language_code).model_reached_usage_limit(),
-                    reply_markup=reply_markup,
-                    allow_sending_without_reply=True,
-                )
-                return
+            reply_markup = build_limit_exceeded_keyboard(user_language_code)
+            await message.reply(
+                text=get_localization(user_language_code).model_reached_usage_limit(),
+                reply_markup=reply_markup,
+                allow_sending_without_reply=True,
+            )
+
+            await processing_sticker.delete()
+            await processing_message.delete()
+            await state.update_data(is_processing=False)
+            return
+
+        product = await get_product_by_quota(Quota.RUNWAY)
+
+        user_not_finished_requests = await get_started_requests_by_user_id_and_product_id(user.id, product.id)
+
+        if len(user_not_finished_requests):
+            await message.reply(
+                text=get_localization(user_language_code).MODEL_ALREADY_MAKE_REQUEST,
+                allow_sending_without_reply=True,
+            )
+
+            await processing_sticker.delete()
+            await processing_message.delete()
+            await state.update_data(is_processing=False)
+            return
 
+        request = await write_request(
+            user_id=user.id,
+            processing_message_ids=[processing_sticker.message_id, processing_message.message_id],
+            product_id=product.id,
+            requested=1,
+        )
+
+        try:
             if prompt and user_language_code != LanguageCode.EN:
                 prompt = await translate_text(prompt, user_language_code, LanguageCode.EN)
 
@@ -127,9 +159,17 @@ async def handle_runway(message: Message, state: FSMContext, user: User, video_f
                     text=get_localization(user_language_code).ERROR_PROMPT_TOO_LONG,
                     allow_sending_without_reply=True,
                 )
+
+                request.status = RequestStatus.FINISHED
+                await update_request(request.id, {
+                    'status': request.status
+                })
+
+                await processing_sticker.delete()
+                await processing_message.delete()
                 return
 
-            response = await get_response_video(
+            result_id = await create_video(
                 model_version,
                 prompt,
                 video_frame_link,
@@ -137,65 +177,60 @@ async def handle_runway(message: Message, state: FSMContext, user: User, video_f
                 duration,
             )
 
-            product = await get_product_by_quota(Quota.RUNWAY)
-
-            total_price = PRICE_RUNWAY * cost
-            await write_transaction(
-                user_id=user.id,
-                type=TransactionType.EXPENSE,
+            await write_generation(
+                id=result_id,
+                request_id=request.id,
                 product_id=product.id,
-                amount=total_price,
-                clear_amount=total_price,
-                currency=Currency.USD,
-                quantity=1,
                 details={
                     'prompt_text': prompt,
                     'prompt_image': video_frame_link,
+                    'version': model_version,
                     'resolution': resolution,
                     'duration': duration,
-                    'has_error': False,
-                },
+                }
             )
-
-            footer_text = f'\n\n📹 {user.daily_limits[Quota.RUNWAY] + user.additional_usage_quota[Quota.RUNWAY]}' \
-                if user.settings[Model.RUNWAY][UserSettings.SHOW_USAGE_QUOTA] and \
-                   user.daily_limits[Quota.RUNWAY] != float('inf') else ''
-            if user.settings[Model.RUNWAY][UserSettings.SEND_TYPE] == SendType.DOCUMENT:
-                await message.reply_document(
-                    caption=f'{get_localization(user_language_code).GENERATION_VIDEO_SUCCESS}{footer_text}',
-                    document=response.get('result', [])[0],
+            await runway_poller.add(result_id)
+        except Exception as e:
+            if isinstance(e, runwayml.RateLimitError):
+                await message.reply(
+                    text=get_localization(user_language_code).ERROR_SERVER_OVERLOADED,
                     allow_sending_without_reply=True,
                 )
             else:
-                await message.reply_video(
-                    caption=f'{get_localization(user_language_code).GENERATION_VIDEO_SUCCESS}{footer_text}',
-                    video=response.get('result', [])[0],
-                    allow_sending_without_reply=True,
+                await message.answer_sticker(
+                    sticker=config.MESSAGE_STICKERS.get(MessageSticker.ERROR),
                 )
 
-            await update_user_usage_quota(user, Quota.RUNWAY, cost)
-        except runwayml.RateLimitError:
-            await message.reply(
-                text=get_localization(user_language_code).ERROR_SERVER_OVERLOADED,
-                allow_sending_without_reply=True,
-            )
-        except Exception as e:
-            await message.answer_sticker(
-                sticker=config.MESSAGE_STICKERS.get(MessageSticker.ERROR),
-            )
+                reply_markup = build_error_keyboard(user_language_code)
+                await message.answer(
+                    text=get_localization(user_language_code).ERROR,
+                    reply_markup=reply_markup,
+                )
+                await send_error_info(
+                    bot=message.bot,
+                    user_id=user.id,
+                    info=str(e),
+                    hashtags=['runway'],
+                )
+
+            request.status = RequestStatus.FINISHED
+            await update_request(request.id, {
+                'status': request.status
+            })
+
+            generations = await get_generations_by_request_id(request.id)
+            for generation in generations:
+                generation.status = GenerationStatus.FINISHED
+                generation.has_error = True
+                await update_generation(
+                    generation.id,
+                    {
+                        'status': generation.status,
+                        'has_error': generation.has_error,
+                    },
+                )
 
-            reply_markup = build_error_keyboard(user_language_code)
-            await message.answer(
-                text=get_localization(user_language_code).ERROR,
-                reply_markup=reply_markup,
-            )
-            await send_error_info(
-                bot=message.bot,
-                user_id=user.id,
-                info=str(e),
-                hashtags=['runway'],
-            )
-        finally:
             await processing_sticker.delete()
             await processing_message.delete()
+        finally:
             await state.update_data(is_processing=False)
@@ -6,7 +6,6 @@ from aiogram.fsm.context import FSMContext
 from aiogram.types import (
     Message,
     CallbackQuery,
-    URLInputFile,
     InlineKeyboardButton,
     InlineKeyboardMarkup,
     InputMediaPhoto,
@@ -24,9 +23,11 @@ from bot.database.operations.prompt.getters import (
     get_prompt,
 )
 from bot.database.operations.role.getters import get_roles, get_role
+from bot.database.operations.telegram_file.cache import TelegramFileType
 from bot.database.operations.user.getters import get_user
 from bot.helpers.getters.get_human_model import get_human_model
 from bot.helpers.getters.get_model_type import get_model_type
+from bot.helpers.senders.send_cached_file import send_cached_file, send_cached_media_group
 from bot.keyboards.common.common import build_buy_motivation_keyboard
 from bot.keyboards.settings.catalog import (
     build_catalog_keyboard,
@@ -146,14 +147,16 @@ async def handle_catalog_digital_employees_selection(callback_query: CallbackQue
 
     role = await get_role(role_id)
 
-    role_photo = await firebase.bucket.get_blob(role.photo)
-    role_photo_link = firebase.get_public_url(role_photo.name)
+    role_photo_link = firebase.get_public_url(role.photo)
 
     if not user.daily_limits[Quota.ACCESS_TO_CATALOG] and not user.additional_usage_quota[Quota.ACCESS_TO_CATALOG]:
         text = get_localization(user_language_code).CATALOG_DIGITAL_EMPLOYEES_FORBIDDEN_ERROR
         reply_markup = build_buy_motivation_keyboard(user_language_code)
-        await callback_query.message.reply_photo(
-            photo=URLInputFile(role_photo_link, filename=role.photo, timeout=300),
+        await send_cached_file(
+            callback_query.message.reply_photo,
+            role_photo_link,
+            TelegramFileType.PHOTO,
+            role.photo,
             caption=text,
             reply_markup=reply_markup,
             allow_sending_without_reply=True,
@@ -188,8 +191,11 @@ async def handle_catalog_digital_employees_selection(callback_query: CallbackQue
                 reply_markup=InlineKeyboardMarkup(inline_keyboard=new_keyboard),
             )
 
-            await callback_query.message.reply_photo(
-                photo=URLInputFile(role_photo_link, filename=role.photo, timeout=300),
+            await send_cached_file(
+                callback_query.message.reply_photo,
+                role_photo_link,
+                TelegramFileType.PHOTO,
+                role.photo,
                 caption=role.translated_descriptions.get(user_language_code, LanguageCode.EN),
                 allow_sending_without_reply=True,
             )
@@ -413,21 +419,29 @@ async def handle_catalog_prompt_chosen_selection(callback_query: CallbackQuery,
                     product = await get_product(blob_id)
                     products.append(product)
 
+            media_links = []
+            media_names = []
             for blob in blobs:
                 blob_name = blob.split('/')[-1]
                 blob_id = blob_name.split('.')[0]
                 if blob_id and blob_id in prompt.product_ids:
+                    media_link = firebase.get_public_url(blob)
                     media_caption = get_localization(user_language_code).catalog_prompts_examples(products)
                     media.append(
                         InputMediaPhoto(
-                            media=URLInputFile(firebase.get_public_url(blob), filename=blob_name, timeout=300),
+                            media=media_link,
                             caption=media_caption if len(media) == 0 else None,
                             show_caption_above_media=True,
                         )
                     )
-
-            await callback_query.message.answer_media_group(
-                media=media,
+                    media_links.append(media_link)
+                    media_names.append(blob_name)
+
+            await send_cached_media_group(
+                callback_query.message.answer_media_group,
+                media_links,
+                media_names,
+                media,
             )
 
             return
@@ -1,19 +1,16 @@
-import asyncio
 import time
-import uuid
 
 from aiogram import Router, F
 
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, File
 
-from bot.database.main import firebase
 from bot.database.models.common import Model, ClaudeGPTVersion, GeminiGPTVersion, Quota
-from bot.database.models.user import UserSettings
-from bot.database.operations.user.getters import get_user
+from bot.database.models.user import UserSettings, User
 from bot.handlers.ai.claude_handler import handle_claude
 from bot.handlers.ai.gemini_handler import handle_gemini
 from bot.handlers.common.photo_handler import handle_photo, handle_album
+from bot.helpers.getters.get_uploaded_telegram_file import get_uploaded_telegram_file
 from bot.locales.main import get_localization, get_user_language
 from bot.middlewares.AlbumMiddleware import AlbumMiddleware
 from bot.utils.is_already_processing import is_already_processing
@@ -25,15 +22,15 @@ document_router.message.middleware(AlbumMiddleware())
 
 
 @document_router.message(F.document)
-async def document(message: Message, state: FSMContext, album: list[Message]):
+async def document(message: Message, state: FSMContext, user: User, album: list[Message]):
     if len(album):
-        await handle_album(message, state, album)
+        await handle_album(message, state, user, album)
     elif message.document.mime_type.startswith('image') and message.document.thumbnail:
         photo_file = await message.bot.get_file(message.document.file_id)
-        await handle_photo(message, state, photo_file)
+        await handle_photo(message, state, user, photo_file)
     elif message.document.mime_type == 'application/pdf':
         document_file = await message.bot.get_file(message.document.file_id)
-        await handle_document(message, state, document_file)
+        await handle_document(message, state, user, document_file)
     else:
         user_id = str(message.from_user.id)
         user_language_code = await get_user_language(user_id, state.storage)
@@ -44,9 +41,8 @@ async def document(message: Message, state: FSMContext, album: list[Message]):
         )
 
 
-async def handle_document(message: Message, state: FSMContext, document_file: File):
+async def handle_document(message: Message, state: FSMContext, user: User, document_file: File):
     user_id = str(message.from_user.id)
-    user = await get_user(user_id)
     user_language_code = await get_user_language(user_id, state.storage)
 
     if (
@@ -78,14 +74,11 @@ async def handle_document(message: Message, state: FSMContext, document_file: Fi
             return
         await state.update_data(last_request_time=current_time)
 
-        document_data_io = await message.bot.download_file(document_file.file_path, timeout=300)
-        document_data = await asyncio.to_thread(document_data_io.read)
-        document_extension = document_file.file_path.split('.')[-1]
-
-        document_vision_filename = f'{uuid.uuid4()}.{document_extension}'
-        document_vision_path = f'users/vision/{user_id}/{document_vision_filename}'
-        document_vision = firebase.bucket.new_blob(document_vision_path)
-        await document_vision.upload(document_data)
+        document_vision_filename = await get_uploaded_telegram_file(
+            message.bot,
+            document_file,
+            f'users/vision/{user_id}',
+        )
 
         if user.current_model == Model.CLAUDE:
             await handle_claude(message, state, user, quota, [document_vision_filename], True)
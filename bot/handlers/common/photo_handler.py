@@ -1,12 +1,12 @@
 import asyncio
 import time
-import uuid
+from typing import Optional
 
 import aiohttp
-from aiogram import Router, F
+from aiogram import Router, F, Bot
 
 from aiogram.fsm.context import FSMContext
-from aiogram.types import Message, URLInputFile, File, ReactionTypeEmoji
+from aiogram.types import Message, File, ReactionTypeEmoji
 from aiogram.utils.chat_action import ChatActionSender
 
 from bot.config import config, MessageSticker
@@ -21,7 +21,7 @@ from bot.database.models.common import (
     MidjourneyAction,
     PhotoshopAIAction, )
 from bot.database.models.face_swap_package import FaceSwapPackageStatus
-from bot.database.models.user import UserSettings
+from bot.database.models.user import UserSettings, User
 from bot.database.operations.face_swap_package.getters import (
     get_face_swap_package,
     get_used_face_swap_packages_by_user_id,
@@ -31,7 +31,7 @@ from bot.database.operations.generation.writers import write_generation
 from bot.database.operations.product.getters import get_product_by_quota
 from bot.database.operations.request.getters import get_started_requests_by_user_id_and_product_id
 from bot.database.operations.request.writers import write_request
-from bot.database.operations.user.getters import get_user
+from bot.database.operations.telegram_file.cache import TelegramFileType, delete_cached_telegram_files
 from bot.handlers.admin.face_swap_handler import handle_manage_face_swap
 from bot.handlers.ai.chat_gpt_handler import handle_chatgpt
 from bot.handlers.ai.claude_handler import handle_claude
@@ -45,6 +45,8 @@ from bot.handlers.ai.midjourney_handler import handle_midjourney
 from bot.handlers.ai.runway_handler import handle_runway
 from bot.handlers.ai.stable_diffusion_handler import handle_stable_diffusion
 from bot.helpers.getters.get_quota_by_model import get_quota_by_model
+from bot.helpers.getters.get_uploaded_telegram_file import get_uploaded_telegram_file
+from bot.helpers.senders.send_cached_file import send_cached_file
 from bot.integrations.replicateAI import create_face_swap_image, create_photoshop_ai_image
 from bot.keyboards.admin.catalog import build_manage_catalog_create_role_confirmation_keyboard
 from bot.keyboards.common.common import build_cancel_keyboard, build_limit_exceeded_keyboard, build_suggestions_keyboard
@@ -62,9 +64,8 @@ photo_router = Router()
 photo_router.message.middleware(AlbumMiddleware())
 
 
-async def handle_photo(message: Message, state: FSMContext, photo_file: File):
+async def handle_photo(message: Message, state: FSMContext, user: User, photo_file: File):
     user_id = str(message.from_user.id)
-    user = await get_user(user_id)
     user_language_code = await get_user_language(user_id, state.storage)
 
     current_state = await state.get_state()
@@ -86,9 +87,11 @@ async def handle_photo(message: Message, state: FSMContext, photo_file: File):
                 object_name=existing_blob_name,
                 timeout=300,
             )
+            await delete_cached_telegram_files(firebase.get_public_url(existing_blob_name))
 
         blob = firebase.bucket.new_blob(blob_path)
         await blob.upload(photo_data)
+        await delete_cached_telegram_files(firebase.get_public_url(blob_path))
 
         await message.bot.set_message_reaction(
             message.chat.id,
@@ -119,6 +122,7 @@ async def handle_photo(message: Message, state: FSMContext, photo_file: File):
         photo_path = f'roles/{photo_name}'
         photo_blob = firebase.bucket.new_blob(photo_path)
         await photo_blob.upload(photo_data)
+        await delete_cached_telegram_files(firebase.get_public_url(photo_path))
 
         reply_markup = build_manage_catalog_create_role_confirmation_keyboard(user_language_code)
         await message.answer(
@@ -143,6 +147,7 @@ async def handle_photo(message: Message, state: FSMContext, photo_file: File):
         photo_path = f'face_swap/{user_data["gender"].lower()}/{user_data["package_name"].lower()}/{photo_name}'
         photo_blob = firebase.bucket.new_blob(photo_path)
         await photo_blob.upload(photo_data)
+        await delete_cached_telegram_files(firebase.get_public_url(photo_path))
         face_swap_package.files.append({
             'name': photo_name,
             'status': FaceSwapPackageStatus.PRIVATE,
@@ -202,14 +207,9 @@ async def handle_photo(message: Message, state: FSMContext, photo_file: File):
             return
 
         async with ChatActionSender.upload_photo(bot=message.bot, chat_id=message.chat.id):
-            photo_data_io = await message.bot.download_file(photo_file.file_path, timeout=300)
-            photo_data = await asyncio.to_thread(photo_data_io.read)
-            photo_extension = photo_file.file_path.split('.')[-1]
-            photo_name = f'{uuid.uuid4()}.{photo_extension}'
-            photo_path = f'users/photoshop/{photoshop_ai_action_name}/{user_id}/{photo_name}'
-            photo_link = firebase.get_public_url(photo_path)
-            photo_photoshop = firebase.bucket.new_blob(photo_path)
-            await photo_photoshop.upload(photo_data)
+            photo_folder = f'users/photoshop/{photoshop_ai_action_name}/{user_id}'
+            photo_name = await get_uploaded_telegram_file(message.bot, photo_file, photo_folder)
+            photo_link = firebase.get_public_url(f'{photo_folder}/{photo_name}')
 
             result = await create_photoshop_ai_image(photoshop_ai_action_name, photo_link)
             request = await write_request(
@@ -273,14 +273,7 @@ async def handle_photo(message: Message, state: FSMContext, photo_file: File):
         if need_exit:
             return
 
-        photo_data_io = await message.bot.download_file(photo_file.file_path, timeout=300)
-        photo_data = await asyncio.to_thread(photo_data_io.read)
-        photo_extension = photo_file.file_path.split('.')[-1]
-
-        photo_vision_filename = f'{uuid.uuid4()}.{photo_extension}'
-        photo_vision_path = f'users/vision/{user_id}/{photo_vision_filename}'
-        photo_vision = firebase.bucket.new_blob(photo_vision_path)
-        await photo_vision.upload(photo_data)
+        photo_vision_filename = await get_uploaded_telegram_file(message.bot, photo_file, f'users/vision/{user_id}')
 
         if user.current_model == Model.CHAT_GPT:
             await handle_chatgpt(message, state, user, quota, [photo_vision_filename])
@@ -308,14 +301,7 @@ async def handle_photo(message: Message, state: FSMContext, photo_file: File):
             return
         await state.update_data(last_request_time=current_time)
 
-        photo_data_io = await message.bot.download_file(photo_file.file_path, timeout=300)
-        photo_data = await asyncio.to_thread(photo_data_io.read)
-        photo_extension = photo_file.file_path.split('.')[-1]
-
-        photo_vision_filename = f'{uuid.uuid4()}.{photo_extension}'
-        photo_vision_path = f'users/vision/{user_id}/{photo_vision_filename}'
-        photo_vision = firebase.bucket.new_blob(photo_vision_path)
-        await photo_vision.upload(photo_data)
+        photo_vision_filename = await get_uploaded_telegram_file(message.bot, photo_file, f'users/vision/{user_id}')
 
         if user.current_model == Model.MIDJOURNEY:
             await handle_midjourney(
@@ -357,14 +343,9 @@ async def handle_photo(message: Message, state: FSMContext, photo_file: File):
                         user_photo_blob = f'users/avatars/{user_id}.jpeg'
                     user_photo = await firebase.bucket.get_blob(user_photo_blob)
                     user_photo_link = firebase.get_public_url(user_photo.name)
-                    photo_data_io = await message.bot.download_file(photo_file.file_path, timeout=300)
-                    photo_data = await asyncio.to_thread(photo_data_io.read)
-                    photo_extension = photo_file.file_path.split('.')[-1]
-
-                    background_path = f'users/backgrounds/{user_id}/{uuid.uuid4()}.{photo_extension}'
-                    background_photo = firebase.bucket.new_blob(background_path)
-                    await background_photo.upload(photo_data)
-                    background_photo_link = firebase.get_public_url(background_path)
+                    background_folder = f'users/backgrounds/{user_id}'
+                    background_name = await get_uploaded_telegram_file(message.bot, photo_file, background_folder)
+                    background_photo_link = firebase.get_public_url(f'{background_folder}/{background_name}')
 
                     product = await get_product_by_quota(Quota.FACE_SWAP)
 
@@ -388,14 +369,16 @@ async def handle_photo(message: Message, state: FSMContext, photo_file: File):
                     await state.clear()
                 except aiohttp.ClientResponseError:
                     photo_path = 'users/avatars/example.png'
-                    example_photo = await firebase.bucket.get_blob(photo_path)
-                    photo_link = firebase.get_public_url(example_photo.name)
+                    photo_link = firebase.get_public_url(photo_path)
 
                     reply_markup = build_cancel_keyboard(user_language_code)
-                    await message.answer_photo(
-                        photo=URLInputFile(photo_link, filename=photo_path, timeout=300),
+                    await send_cached_file(
+                        message.answer_photo,
+                        photo_link,
+                        TelegramFileType.PHOTO,
+                        photo_path,
                         caption=get_localization(user_language_code).PROFILE_SEND_ME_YOUR_PICTURE,
-                        reply_markup=reply_markup
+                        reply_markup=reply_markup,
                     )
                     await state.set_state(Profile.waiting_for_photo)
     elif (
@@ -415,14 +398,9 @@ async def handle_photo(message: Message, state: FSMContext, photo_file: File):
             return
         await state.update_data(last_request_time=current_time)
 
-        photo_data_io = await message.bot.download_file(photo_file.file_path, timeout=300)
-        photo_data = await asyncio.to_thread(photo_data_io.read)
-        photo_extension = photo_file.file_path.split('.')[-1]
-
-        video_frame_path = f'users/video_frames/{user_quota}/{user_id}/{uuid.uuid4()}.{photo_extension}'
-        video_frame_photo = firebase.bucket.new_blob(video_frame_path)
-        await video_frame_photo.upload(photo_data)
-        video_frame_photo_link = firebase.get_public_url(video_frame_path)
+        video_frame_folder = f'users/video_frames/{user_quota}/{user_id}'
+        video_frame_name = await get_uploaded_telegram_file(message.bot, photo_file, video_frame_folder)
+        video_frame_photo_link = firebase.get_public_url(f'{video_frame_folder}/{video_frame_name}')
 
         if user.current_model == Model.KLING:
             await handle_kling(message, state, user, video_frame_photo_link)
@@ -438,9 +416,20 @@ async def handle_photo(message: Message, state: FSMContext, photo_file: File):
         )
 
 
-async def handle_album(message: Message, state: FSMContext, album: list[Message]):
+async def handle_album_photo(bot: Bot, user_id: str, file: Message, semaphore: asyncio.Semaphore) -> Optional[str]:
+    async with semaphore:
+        if file.photo:
+            photo_file = await bot.get_file(file.photo[-1].file_id)
+        elif file.document.mime_type.startswith('image') and file.document.thumbnail:
+            photo_file = await bot.get_file(file.document.file_id)
+        else:
+            return None
+
+        return await get_uploaded_telegram_file(bot, photo_file, f'users/vision/{user_id}')
+
+
+async def handle_album(message: Message, state: FSMContext, user: User, album: list[Message]):
     user_id = str(message.from_user.id)
-    user = await get_user(user_id)
     user_language_code = await get_user_language(user_id, state.storage)
 
     if (
@@ -484,25 +473,13 @@ async def handle_album(message: Message, state: FSMContext, album: list[Message]
         if need_exit:
             return
 
-        photo_vision_filenames = []
-        for file in album:
-            if file.photo:
-                photo_file = await message.bot.get_file(message.photo[-1].file_id)
-            elif file.document.mime_type.startswith('image') and file.document.thumbnail:
-                photo_file = await message.bot.get_file(file.document.file_id)
-            else:
-                continue
-
-            photo_data_io = await message.bot.download_file(photo_file.file_path, timeout=300)
-            photo_data = await asyncio.to_thread(photo_data_io.read)
-            photo_extension = photo_file.file_path.split('.')[-1]
-
-            photo_vision_filename = f'{uuid.uuid4()}.{photo_extension}'
-            photo_vision_path = f'users/vision/{user_id}/{photo_vision_filename}'
-            photo_vision = firebase.bucket.new_blob(photo_vision_path)
-            await photo_vision.upload(photo_data)
-
-            photo_vision_filenames.append(photo_vision_filename)
+        semaphore = asyncio.Semaphore(config.MEDIA_INGESTION_CONCURRENCY)
+        photo_vision_filenames = await asyncio.gather(
+            *[handle_album_photo(message.bot, user_id, file, semaphore) for file in album]
+        )
+        photo_vision_filenames = [
+            photo_vision_filename for photo_vision_filename in photo_vision_filenames if photo_vision_filename
+        ]
 
         if user.current_model == Model.CHAT_GPT:
             await handle_chatgpt(message, state, user, quota, photo_vision_filenames)
@@ -535,9 +512,9 @@ async def handle_album(message: Message, state: FSMContext, album: list[Message]
 
 
 @photo_router.message(F.photo)
-async def photo(message: Message, state: FSMContext, album: list[Message]):
+async def photo(message: Message, state: FSMContext, user: User, album: list[Message]):
     if len(album):
-        await handle_album(message, state, album)
+        await handle_album(message, state, user, album)
     else:
         photo_file = await message.bot.get_file(message.photo[-1].file_id)
-        await handle_photo(message, state, photo_file)
+        await handle_photo(message, state, user, photo_file)
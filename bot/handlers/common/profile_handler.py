@@ -4,7 +4,7 @@ import aiohttp
 from aiogram import Router
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
-from aiogram.types import Message, CallbackQuery, URLInputFile, User as TelegramUser
+from aiogram.types import Message, CallbackQuery, User as TelegramUser
 
 from bot.database.main import firebase
 from bot.database.models.common import Model, Currency
@@ -12,6 +12,7 @@ from bot.database.models.subscription import SubscriptionStatus, SUBSCRIPTION_FR
 from bot.database.models.user import UserGender, UserSettings
 from bot.database.operations.product.getters import get_product, get_product_by_quota
 from bot.database.operations.subscription.getters import get_subscription
+from bot.database.operations.telegram_file.cache import TelegramFileType
 from bot.database.operations.user.getters import get_user
 from bot.database.operations.user.updaters import update_user
 from bot.handlers.ai.face_swap_handler import handle_face_swap
@@ -24,6 +25,7 @@ from bot.handlers.payment.payment_handler import (
 )
 from bot.handlers.settings.settings_handler import handle_settings
 from bot.helpers.getters.get_quota_by_model import get_quota_by_model
+from bot.helpers.senders.send_cached_file import send_cached_file
 from bot.keyboards.common.common import build_cancel_keyboard
 from bot.keyboards.common.profile import (
     build_profile_keyboard,
@@ -102,8 +104,11 @@ async def handle_profile(message: Message, state: FSMContext, telegram_user: Tel
                 reply_markup=reply_markup,
             )
         else:
-            await message.answer_photo(
-                photo=URLInputFile(photo_link, filename=photo_path, timeout=300),
+            await send_cached_file(
+                message.answer_photo,
+                photo_link,
+                TelegramFileType.PHOTO,
+                photo_path,
                 caption=text,
                 reply_markup=reply_markup,
             )
@@ -159,12 +164,14 @@ async def handle_profile_selection(callback_query: CallbackQuery, state: FSMCont
         )
     elif action == 'change_photo':
         photo_path = 'users/avatars/example.png'
-        photo = await firebase.bucket.get_blob(photo_path)
-        photo_link = firebase.get_public_url(photo.name)
+        photo_link = firebase.get_public_url(photo_path)
 
         reply_markup = build_cancel_keyboard(user_language_code)
-        await callback_query.message.reply_photo(
-            photo=URLInputFile(photo_link, filename=photo_path, timeout=300),
+        await send_cached_file(
+            callback_query.message.reply_photo,
+            photo_link,
+            TelegramFileType.PHOTO,
+            photo_path,
             caption=get_localization(user_language_code).PROFILE_SEND_ME_YOUR_PICTURE,
             reply_markup=reply_markup,
             allow_sending_without_reply=True,
@@ -8,8 +8,7 @@ from bot.database.models.common import (
     Model,
     MidjourneyAction,
 )
-from bot.database.models.user import UserSettings
-from bot.database.operations.user.getters import get_user
+from bot.database.models.user import UserSettings, User
 from bot.handlers.ai.chat_gpt_handler import handle_chatgpt
 from bot.handlers.ai.claude_handler import handle_claude
 from bot.handlers.ai.dalle_handler import handle_dall_e
@@ -38,9 +37,7 @@ text_router = Router()
 
 
 @text_router.message(F.text, ~F.text.startswith('/'))
-async def handle_text(message: Message, state: FSMContext):
-    user = await get_user(str(message.from_user.id))
-
+async def handle_text(message: Message, state: FSMContext, user: User):
     current_time = time.time()
 
     user_quota = get_quota_by_model(user.current_model, user.settings[user.current_model][UserSettings.VERSION])
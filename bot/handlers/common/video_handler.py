@@ -1,6 +1,4 @@
-import asyncio
 import time
-import uuid
 
 from aiogram import Router, F
 from aiogram.fsm.context import FSMContext
@@ -8,8 +6,9 @@ from aiogram.types import Message, Video
 
 from bot.database.main import firebase
 from bot.database.models.common import Model, Quota
-from bot.database.operations.user.getters import get_user
+from bot.database.models.user import User
 from bot.handlers.ai.gemini_video_handler import handle_gemini_video
+from bot.helpers.getters.get_uploaded_telegram_file import get_uploaded_telegram_file
 from bot.locales.main import get_user_language, get_localization
 from bot.utils.is_already_processing import is_already_processing
 from bot.utils.is_messages_limit_exceeded import is_messages_limit_exceeded
@@ -19,13 +18,12 @@ video_router = Router()
 
 
 @video_router.message(F.video)
-async def video(message: Message, state: FSMContext):
-    await handle_video(message, state, message.video)
+async def video(message: Message, state: FSMContext, user: User):
+    await handle_video(message, state, user, message.video)
 
 
-async def handle_video(message: Message, state: FSMContext, video_file: Video):
+async def handle_video(message: Message, state: FSMContext, user: User, video_file: Video):
     user_id = str(message.from_user.id)
-    user = await get_user(user_id)
     user_language_code = await get_user_language(user_id, state.storage)
 
     current_time = time.time()
@@ -46,14 +44,10 @@ async def handle_video(message: Message, state: FSMContext, video_file: Video):
             )
             return
 
-        video_data_io = await message.bot.download(video_file, timeout=300)
-        video_data = await asyncio.to_thread(video_data_io.read)
-
-        video_vision_filename = f'{uuid.uuid4()}.mp4'
-        video_vision_path = f'users/videos/{Quota.GEMINI_VIDEO}/{user_id}/{video_vision_filename}'
-        video_vision = firebase.bucket.new_blob(video_vision_path)
-        await video_vision.upload(video_data)
-        video_link = firebase.get_public_url(video_vision_path)
+        video_vision_file = await message.bot.get_file(video_file.file_id)
+        video_vision_folder = f'users/videos/{Quota.GEMINI_VIDEO}/{user_id}'
+        video_vision_filename = await get_uploaded_telegram_file(message.bot, video_vision_file, video_vision_folder)
+        video_link = firebase.get_public_url(f'{video_vision_folder}/{video_vision_filename}')
 
         await handle_gemini_video(message, state, user, video_link)
     else:
@@ -1,17 +1,17 @@
 import asyncio
 import io
+import logging
 import math
-import os
-import tempfile
 import time
 import uuid
+from typing import Optional
 
 from filetype import filetype
-from pydub import AudioSegment
 from aiogram import Router, F, Bot
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, File
 
+from bot.config import config
 from bot.database.models.common import (
     Quota,
     Currency,
@@ -22,7 +22,6 @@ from bot.database.models.transaction import TransactionType
 from bot.database.models.user import UserSettings, User
 from bot.database.operations.product.getters import get_product_by_quota
 from bot.database.operations.transaction.writers import write_transaction
-from bot.database.operations.user.getters import get_user
 from bot.handlers.ai.chat_gpt_handler import handle_chatgpt
 from bot.handlers.ai.claude_handler import handle_claude
 from bot.handlers.ai.dalle_handler import handle_dall_e
@@ -41,7 +40,9 @@ from bot.handlers.ai.photoshop_ai_handler import handle_photoshop_ai
 from bot.handlers.ai.runway_handler import handle_runway
 from bot.handlers.ai.stable_diffusion_handler import handle_stable_diffusion
 from bot.handlers.ai.suno_handler import handle_suno
+from bot.helpers.audio_transcoder import audio_transcoder, WHISPER_MAX_FILE_SIZE
 from bot.helpers.getters.get_quota_by_model import get_quota_by_model
+from bot.helpers.senders.send_error_info import send_error_info
 from bot.integrations.openAI import get_response_speech_to_text
 from bot.keyboards.common.common import build_buy_motivation_keyboard
 from bot.locales.main import get_localization, get_user_language
@@ -53,44 +54,74 @@ from bot.utils.is_time_limit_exceeded import is_time_limit_exceeded
 voice_router = Router()
 
 
-async def process_voice_message(bot: Bot, voice: File, user: User, user_language_code: LanguageCode):
-    unique_id = uuid.uuid4()
-    with tempfile.TemporaryDirectory() as tempdir:
-        wav_path = os.path.join(tempdir, f'{unique_id}.wav')
-
-        voice_ogg = io.BytesIO()
-        await bot.download_file(voice.file_path, voice_ogg, timeout=300)
-        extension = await asyncio.to_thread(lambda: filetype.guess(voice_ogg.getvalue()).extension)
-
-        audio_data = {
-            'file': voice_ogg,
-            'format': extension,
-        }
-        audio = await asyncio.to_thread(AudioSegment.from_file, **audio_data)
-        audio_in_seconds = audio.duration_seconds
-
-        audio_export_data = {
-            'out_f': wav_path,
-            'format': 'wav',
-        }
-        await asyncio.to_thread(audio.export, **audio_export_data)
-
-        audio_file = await asyncio.to_thread(lambda: open(wav_path, 'rb'))
-        audio_file_size = await asyncio.to_thread(lambda: os.path.getsize(wav_path))
-        if audio_file_size > 25 * 1024 * 1024:
-            await asyncio.to_thread(audio_file.close)
-            await bot.send_message(
-                chat_id=user.telegram_chat_id,
-                text=get_localization(user_language_code).ERROR_FILE_TOO_BIG,
-            )
-            return
+async def process_voice_message(
+    bot: Bot,
+    voice: File,
+    user: User,
+    user_language_code: LanguageCode,
+    duration: Optional[int] = None,
+):
+    started_at = time.monotonic()
+    voice_io = io.BytesIO()
+    await bot.download_file(voice.file_path, voice_io, timeout=300)
+    voice_data = voice_io.getvalue()
+    audio_transcoder.record('download', time.monotonic() - started_at)
+
+    extension = await asyncio.to_thread(lambda: getattr(filetype.guess(voice_data), 'extension', None))
+    audio_data, audio_format, audio_in_seconds = await audio_transcoder.prepare_for_speech_to_text(
+        voice_data,
+        extension,
+        duration,
+    )
+    if len(audio_data) > WHISPER_MAX_FILE_SIZE or (audio_in_seconds or 0) > config.LONG_AUDIO_SEGMENT_SECONDS:
+        segments = await audio_transcoder.split(audio_data, audio_in_seconds, config.LONG_AUDIO_SEGMENT_SECONDS)
+        audio_segments = [(segment, 'ogg', segment_in_seconds) for segment, segment_in_seconds in segments]
+    else:
+        audio_segments = [(audio_data, audio_format, audio_in_seconds)]
 
-        text = await get_response_speech_to_text(audio_file)
-        await asyncio.to_thread(audio_file.close)
+    if any(len(segment) > WHISPER_MAX_FILE_SIZE for segment, _, _ in audio_segments):
+        await bot.send_message(
+            chat_id=user.telegram_chat_id,
+            text=get_localization(user_language_code).ERROR_FILE_TOO_BIG,
+        )
+        return
+
+    semaphore = asyncio.Semaphore(config.LONG_AUDIO_CONCURRENCY)
+    started_at = time.monotonic()
+    results = await asyncio.gather(
+        *[
+            process_voice_segment(semaphore, segment, segment_format)
+            for segment, segment_format, _ in audio_segments
+        ],
+        return_exceptions=True,
+    )
+    audio_transcoder.record('transcribe', time.monotonic() - started_at)
+
+    errors = [result for result in results if isinstance(result, Exception)]
+    if len(errors) == len(results):
+        raise errors[0]
+
+    texts = [None if isinstance(result, Exception) else result for result in results]
+    if errors:
+        logging.warning(f'Error in process_voice_message: {len(errors)}/{len(results)} segments failed: {errors[0]}')
+        await bot.send_message(
+            chat_id=user.telegram_chat_id,
+            text=get_localization(user_language_code).ERROR_VOICE_MESSAGE_PARTIALLY_RECOGNIZED,
+        )
+        await send_error_info(
+            bot=bot,
+            user_id=user.id,
+            info=f'{len(errors)}/{len(results)} voice segments failed: {errors[0]}',
+            hashtags=['voice'],
+        )
+
+    product = await get_product_by_quota(Quota.VOICE_MESSAGES)
 
-        product = await get_product_by_quota(Quota.VOICE_MESSAGES)
+    for index, ((_, _, segment_in_seconds), text) in enumerate(zip(audio_segments, texts)):
+        if text is None:
+            continue
 
-        total_price = 0.0001 * math.ceil(audio_in_seconds)
+        total_price = 0.0001 * math.ceil(segment_in_seconds or 0)
         await write_transaction(
             user_id=user.id,
             type=TransactionType.EXPENSE,
@@ -102,17 +133,26 @@ async def process_voice_message(bot: Bot, voice: File, user: User, user_language
             details={
                 'subtype': 'STT',
                 'text': text,
+                'segment': index,
+                'total_segments': len(audio_segments),
                 'has_error': False,
             },
         )
 
-        return text
+    return ' '.join(text.strip() for text in texts if text)
+
+
+async def process_voice_segment(semaphore: asyncio.Semaphore, segment: bytes, segment_format: str) -> str:
+    audio_file = io.BytesIO(segment)
+    audio_file.name = f'{uuid.uuid4()}.{segment_format}'
+
+    async with semaphore:
+        return await get_response_speech_to_text(audio_file)
 
 
 @voice_router.message(F.voice | F.audio | F.video_note)
-async def handle_voice(message: Message, state: FSMContext):
+async def handle_voice(message: Message, state: FSMContext, user: User):
     user_id = str(message.from_user.id)
-    user = await get_user(user_id)
     user_language_code = await get_user_language(user_id, state.storage)
 
     if user.daily_limits[Quota.VOICE_MESSAGES] or user.additional_usage_quota[Quota.VOICE_MESSAGES]:
@@ -134,12 +174,15 @@ async def handle_voice(message: Message, state: FSMContext):
 
         if message.voice:
             voice_file = await message.bot.get_file(message.voice.file_id)
+            voice_duration = message.voice.duration
         elif message.video_note:
             voice_file = await message.bot.get_file(message.video_note.file_id)
+            voice_duration = message.video_note.duration
         else:
             voice_file = await message.bot.get_file(message.audio.file_id)
+            voice_duration = message.audio.duration
 
-        text = await process_voice_message(message.bot, voice_file, user, user_language_code)
+        text = await process_voice_message(message.bot, voice_file, user, user_language_code, voice_duration)
         if not text:
             return
 
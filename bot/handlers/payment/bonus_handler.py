@@ -5,7 +5,7 @@ from typing import cast
 from aiogram import Router, F, Bot
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
-from aiogram.types import Message, CallbackQuery, URLInputFile
+from aiogram.types import Message, CallbackQuery
 from google.cloud.firestore_v1 import Increment
 
 from bot.config import config, MessageEffect
@@ -20,11 +20,13 @@ from bot.database.operations.game.getters import get_count_of_games_by_user_id
 from bot.database.operations.game.writers import write_game
 from bot.database.operations.package.writers import write_package
 from bot.database.operations.product.getters import get_product, get_active_products_by_product_type_and_category
+from bot.database.operations.telegram_file.cache import TelegramFileType
 from bot.database.operations.transaction.writers import write_transaction
 from bot.database.operations.user.getters import get_user, get_count_of_users_by_referral
 from bot.database.operations.user.updaters import update_user
 from bot.handlers.common.feedback_handler import handle_feedback
 from bot.handlers.common.info_handler import handle_info_selection
+from bot.helpers.senders.send_cached_file import send_cached_file
 from bot.keyboards.payment.bonus import (
     build_bonus_keyboard,
     build_bonus_play_game_keyboard,
@@ -65,8 +67,11 @@ async def handle_bonus(message: Message, user_id: str, state: FSMContext):
         count_of_games,
     )
     reply_markup = build_bonus_keyboard(user_language_code, user_id)
-    await message.answer_photo(
-        photo=URLInputFile(photo_link, filename=photo_path, timeout=300),
+    await send_cached_file(
+        message.answer_photo,
+        photo_link,
+        TelegramFileType.PHOTO,
+        photo_path,
         caption=text,
         reply_markup=reply_markup,
     )
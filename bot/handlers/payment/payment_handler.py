@@ -6,7 +6,7 @@ from typing import cast
 from aiogram import Router, F
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
-from aiogram.types import Message, CallbackQuery, URLInputFile, LabeledPrice, PreCheckoutQuery
+from aiogram.types import Message, CallbackQuery, LabeledPrice, PreCheckoutQuery
 
 from bot.config import config, MessageEffect
 from bot.database.main import firebase
@@ -32,6 +32,7 @@ from bot.database.operations.package.writers import write_package
 from bot.database.operations.product.getters import get_active_products_by_product_type_and_category, get_product
 from bot.database.operations.subscription.getters import get_subscription, get_activated_subscriptions_by_user_id
 from bot.database.operations.subscription.writers import write_subscription
+from bot.database.operations.telegram_file.cache import TelegramFileType
 from bot.database.operations.transaction.writers import write_transaction
 from bot.database.operations.user.getters import get_user
 from bot.database.operations.user.updaters import update_user
@@ -49,6 +50,7 @@ from bot.helpers.creaters.create_subscription import create_subscription
 from bot.helpers.getters.get_quota_by_model import get_quota_by_model
 from bot.helpers.getters.get_switched_to_ai_model import get_switched_to_ai_model
 from bot.helpers.getters.get_user_discount import get_user_discount
+from bot.helpers.senders.send_cached_file import send_cached_file
 from bot.helpers.senders.send_message_to_admins import send_message_to_admins
 from bot.keyboards.ai.model import build_switched_to_ai_keyboard
 from bot.keyboards.payment.payment import (
@@ -139,8 +141,11 @@ async def handle_subscribe(message: Message, user_id: str, state: FSMContext):
         user.currency,
         user_language_code,
     )
-    await message.answer_photo(
-        photo=URLInputFile(photo_link, filename=photo_path, timeout=300),
+    await send_cached_file(
+        message.answer_photo,
+        photo_link,
+        TelegramFileType.PHOTO,
+        photo_path,
         caption=text,
         reply_markup=reply_markup,
     )
@@ -252,8 +257,11 @@ async def handle_subscription_selection(callback_query: CallbackQuery, state: FS
         photo = await firebase.bucket.get_blob(photo_path)
         photo_link = firebase.get_public_url(photo.name)
 
-        await callback_query.message.answer_photo(
-            photo=URLInputFile(photo_link, filename=photo_path, timeout=300),
+        await send_cached_file(
+            callback_query.message.answer_photo,
+            photo_link,
+            TelegramFileType.PHOTO,
+            photo_path,
             caption=caption,
             reply_markup=reply_markup,
         )
@@ -445,8 +453,11 @@ async def handle_package(message: Message, user_id: str, state: FSMContext, is_e
             reply_markup=reply_markup,
         )
     else:
-        await message.answer_photo(
-            photo=URLInputFile(photo_link, filename=photo_path, timeout=300),
+        await send_cached_file(
+            message.answer_photo,
+            photo_link,
+            TelegramFileType.PHOTO,
+            photo_path,
             caption=text,
             reply_markup=reply_markup,
         )
@@ -543,8 +554,11 @@ async def quantity_of_package_sent(message: Message, state: FSMContext):
         photo_link = firebase.get_public_url(photo.name)
 
         reply_markup = build_package_quantity_sent_keyboard(user_language_code)
-        await message.reply_photo(
-            photo=URLInputFile(photo_link, filename=photo_path, timeout=300),
+        await send_cached_file(
+            message.reply_photo,
+            photo_link,
+            TelegramFileType.PHOTO,
+            photo_path,
             caption=get_localization(user_language_code).SHOPPING_CART_ADD_OR_BUY_NOW,
             reply_markup=reply_markup,
             allow_sending_without_reply=True,
@@ -633,8 +647,11 @@ async def handle_package_add_to_cart_selection(callback_query: CallbackQuery, st
             discount,
         )
         reply_markup = build_package_cart_keyboard(user_language_code)
-        await callback_query.message.answer_photo(
-            photo=URLInputFile(photo_link, filename=photo_path, timeout=300),
+        await send_cached_file(
+            callback_query.message.answer_photo,
+            photo_link,
+            TelegramFileType.PHOTO,
+            photo_path,
             caption=caption,
             reply_markup=reply_markup,
         )
@@ -0,0 +1,244 @@
+import asyncio
+import json
+import os
+import re
+import tempfile
+import time
+from collections import deque
+from typing import Optional
+
+from bot.config import config
+from bot.utils.get_latency_percentiles import get_latency_percentiles
+
+AUDIO_TRANSCODER_LATENCY_SAMPLES = 1000
+AUDIO_TRANSCODER_STAGES = ['download', 'probe', 'transcode', 'split', 'transcribe']
+# the cache protocol makes stdin seekable, so MP4/M4A with a trailing moov atom can be read
+AUDIO_TRANSCODER_INPUT = 'cache:pipe:0'
+AUDIO_TRANSCODER_CODEC_ARGS = [
+    '-vn',
+    '-ac', '1',
+    '-ar', '16000',
+    '-c:a', 'libopus',
+    '-b:a', '24k',
+]
+AUDIO_TRANSCODER_OUTPUT_ARGS = [
+    *AUDIO_TRANSCODER_CODEC_ARGS,
+    '-f', 'ogg',
+    'pipe:1',
+]
+WHISPER_AUDIO_FORMATS = ['flac', 'm4a', 'mp3', 'mpga', 'oga', 'ogg', 'wav']
+WHISPER_MAX_FILE_SIZE = 25 * 1024 * 1024
+
+
+class AudioTranscoder:
+    def __init__(self, concurrency: int, timeout: int):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.timeout = timeout
+        self.processes: set[asyncio.subprocess.Process] = set()
+        self.count_transcoded_files = 0
+        self.count_passed_files = 0
+        self.count_failed_processes = 0
+        self.latencies = {
+            stage: deque(maxlen=AUDIO_TRANSCODER_LATENCY_SAMPLES) for stage in AUDIO_TRANSCODER_STAGES
+        }
+
+    async def close(self):
+        for process in self.processes:
+            if process.returncode is None:
+                process.kill()
+        await asyncio.gather(*[process.wait() for process in self.processes], return_exceptions=True)
+        self.processes.clear()
+
+    async def run(self, args: list[str], data: bytes) -> tuple[bytes, bytes]:
+        async with self.semaphore:
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            self.processes.add(process)
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(data), self.timeout)
+            except asyncio.TimeoutError:
+                self.count_failed_processes += 1
+                process.kill()
+                await process.wait()
+                raise
+            finally:
+                self.processes.discard(process)
+
+        if process.returncode != 0:
+            self.count_failed_processes += 1
+            raise RuntimeError(f'{args[0]} exited with {process.returncode}: {stderr.decode(errors="ignore")}')
+
+        return stdout, stderr
+
+    async def probe(self, data: bytes) -> Optional[float]:
+        started_at = time.monotonic()
+        stdout, _ = await self.run(
+            [
+                'ffprobe',
+                '-v', 'error',
+                '-show_entries', 'format=duration',
+                '-of', 'json',
+                '-i', AUDIO_TRANSCODER_INPUT,
+            ],
+            data,
+        )
+        self.record('probe', time.monotonic() - started_at)
+
+        duration = json.loads(stdout or b'{}').get('format', {}).get('duration')
+        try:
+            return float(duration)
+        except (TypeError, ValueError):
+            return None
+
+    async def transcode(self, data: bytes) -> tuple[bytes, Optional[float]]:
+        started_at = time.monotonic()
+        stdout, stderr = await self.run(
+            [
+                'ffmpeg',
+                '-hide_banner',
+                '-loglevel', 'error',
+                '-stats',
+                '-i', AUDIO_TRANSCODER_INPUT,
+                *AUDIO_TRANSCODER_OUTPUT_ARGS,
+            ],
+            data,
+        )
+        self.record('transcode', time.monotonic() - started_at)
+        self.count_transcoded_files += 1
+
+        return stdout, self.get_duration_from_stats(stderr)
+
+    async def detect_silences(self, data: bytes) -> tuple[list[tuple[float, float]], Optional[float]]:
+        _, stderr = await self.run(
+            [
+                'ffmpeg',
+                '-hide_banner',
+                '-loglevel', 'info',
+                '-stats',
+                '-i', AUDIO_TRANSCODER_INPUT,
+                '-af', f'silencedetect=noise={config.LONG_AUDIO_SILENCE_NOISE}:d={config.LONG_AUDIO_SILENCE_SECONDS}',
+                '-f', 'null',
+                '-',
+            ],
+            data,
+        )
+
+        output = stderr.decode(errors='ignore')
+        silence_starts = re.findall(r'silence_start: (-?\d+(?:\.\d+)?)', output)
+        silence_ends = re.findall(r'silence_end: (\d+(?:\.\d+)?)', output)
+        silences = [(float(start), float(end)) for start, end in zip(silence_starts, silence_ends)]
+
+        return silences, self.get_duration_from_stats(stderr)
+
+    async def split(
+        self,
+        data: bytes,
+        duration: Optional[float],
+        max_segment_seconds: int,
+    ) -> list[tuple[bytes, float]]:
+        started_at = time.monotonic()
+        silences, detected_duration = await self.detect_silences(data)
+        duration = duration or detected_duration
+        if not duration:
+            audio, transcoded_duration = await self.transcode(data)
+            return [(audio, transcoded_duration or 0)]
+
+        cut_points = self.get_cut_points(silences, duration, max_segment_seconds)
+        if len(cut_points) <= 2:
+            audio, _ = await self.transcode(data)
+            self.record('split', time.monotonic() - started_at)
+            return [(audio, duration)]
+
+        with tempfile.TemporaryDirectory() as directory:
+            await self.run(
+                [
+                    'ffmpeg',
+                    '-hide_banner',
+                    '-loglevel', 'error',
+                    '-i', AUDIO_TRANSCODER_INPUT,
+                    *AUDIO_TRANSCODER_CODEC_ARGS,
+                    '-f', 'segment',
+                    '-segment_format', 'ogg',
+                    '-segment_times', ','.join(f'{cut_point:.3f}' for cut_point in cut_points[1:-1]),
+                    '-reset_timestamps', '1',
+                    os.path.join(directory, '%03d.ogg'),
+                ],
+                data,
+            )
+            segments = await asyncio.to_thread(self.read_segments, directory)
+        self.record('split', time.monotonic() - started_at)
+
+        return [
+            (segment, end - start)
+            for segment, start, end in zip(segments, cut_points, cut_points[1:])
+        ]
+
+    @staticmethod
+    def read_segments(directory: str) -> list[bytes]:
+        segments = []
+        for filename in sorted(os.listdir(directory)):
+            with open(os.path.join(directory, filename), 'rb') as file:
+                segments.append(file.read())
+
+        return segments
+
+    async def prepare_for_speech_to_text(
+        self,
+        data: bytes,
+        extension: Optional[str],
+        duration: Optional[float] = None,
+    ) -> tuple[bytes, str, Optional[float]]:
+        if extension in WHISPER_AUDIO_FORMATS and len(data) <= WHISPER_MAX_FILE_SIZE:
+            if not duration:
+                duration = await self.probe(data)
+
+            if duration:
+                self.count_passed_files += 1
+                return data, extension, duration
+
+        audio, transcoded_duration = await self.transcode(data)
+        return audio, 'ogg', duration or transcoded_duration
+
+    @staticmethod
+    def get_duration_from_stats(stderr: bytes) -> Optional[float]:
+        times = re.findall(r'time=(\d+):(\d+):(\d+(?:\.\d+)?)', stderr.decode(errors='ignore'))
+        if not times:
+            return None
+
+        hours, minutes, seconds = times[-1]
+        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+    @staticmethod
+    def get_cut_points(silences: list[tuple[float, float]], duration: float, max_segment_seconds: int) -> list[float]:
+        silence_middles = [(start + end) / 2 for start, end in silences]
+
+        cut_points = [0.0]
+        while duration - cut_points[-1] > max_segment_seconds:
+            min_cut_point = cut_points[-1] + max_segment_seconds / 2
+            max_cut_point = cut_points[-1] + max_segment_seconds
+            candidates = [middle for middle in silence_middles if min_cut_point <= middle <= max_cut_point]
+            cut_points.append(candidates[-1] if candidates else max_cut_point)
+        cut_points.append(duration)
+
+        return cut_points
+
+    def record(self, stage: str, latency: float):
+        self.latencies[stage].append(latency)
+
+    def get_metrics(self) -> dict:
+        return {
+            'active': len(self.processes),
+            'transcoded': self.count_transcoded_files,
+            'passed': self.count_passed_files,
+            'failed': self.count_failed_processes,
+            'latency': {
+                stage: get_latency_percentiles(latencies) for stage, latencies in self.latencies.items()
+            },
+        }
+
+
+audio_transcoder = AudioTranscoder(config.AUDIO_TRANSCODER_CONCURRENCY, config.AUDIO_TRANSCODER_TIMEOUT_SECONDS)
@@ -1,14 +1,13 @@
-from google.cloud import firestore
-
 from bot.database.models.package import PackageStatus
 from bot.database.operations.package.getters import get_package
 from bot.database.operations.package.updaters import update_package_in_transaction
 from bot.database.operations.product.getters import get_product
-from bot.database.operations.user.getters import get_user
+from bot.database.operations.user.getters import get_user_in_transaction
 from bot.database.operations.user.updaters import update_user_in_transaction
+from bot.database.transactional import async_transactional
 
 
-@firestore.async_transactional
+@async_transactional
 async def create_package(
     transaction,
     package_id: str,
@@ -16,7 +15,7 @@ async def create_package(
     income_amount: float,
     provider_payment_charge_id: str,
 ):
-    user = await get_user(user_id)
+    user = await get_user_in_transaction(transaction, user_id)
     package = await get_package(package_id)
     product = await get_product(package.product_id)
 
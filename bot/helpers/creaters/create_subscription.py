@@ -2,18 +2,18 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from aiogram import Bot
-from google.cloud import firestore
 
 from bot.database.models.subscription import SubscriptionStatus
 from bot.database.operations.product.getters import get_product
 from bot.database.operations.subscription.getters import get_subscription, get_subscriptions_by_user_id
 from bot.database.operations.subscription.updaters import update_subscription_in_transaction
-from bot.database.operations.user.getters import get_user
+from bot.database.operations.user.getters import get_user_in_transaction
 from bot.database.operations.user.updaters import update_user_in_transaction
+from bot.database.transactional import async_transactional
 from bot.helpers.billing.unsubscribe import unsubscribe
 
 
-@firestore.async_transactional
+@async_transactional
 async def create_subscription(
     transaction,
     bot: Bot,
@@ -25,7 +25,7 @@ async def create_subscription(
     stripe_id: Optional[str] = None,
     is_trial=False,
 ):
-    user = await get_user(user_id)
+    user = await get_user_in_transaction(transaction, user_id)
     subscription = await get_subscription(subscription_id)
     product = await get_product(subscription.product_id)
     all_subscriptions = await get_subscriptions_by_user_id(user_id)
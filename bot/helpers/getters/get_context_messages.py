@@ -0,0 +1,31 @@
+from bot.config import config
+from bot.database.models.message import Message
+from bot.database.operations.message.getters import get_messages_by_chat_id
+from bot.helpers.getters.get_token_count import get_token_count
+
+
+def get_message_token_count(message: Message) -> int:
+    if message.token_count is None:
+        message.token_count = get_token_count(message.content, message.photo_filenames)
+
+    return message.token_count
+
+
+async def get_context_messages(chat_id: str, version: str, system_prompt='') -> list[Message]:
+    messages = await get_messages_by_chat_id(
+        chat_id=chat_id,
+        limit=config.CHAT_HISTORY_CACHE_SIZE,
+    )
+
+    token_budget = config.CONTEXT_TOKEN_BUDGETS.get(version, config.DEFAULT_CONTEXT_TOKEN_BUDGET)
+    token_budget -= get_token_count(system_prompt)
+    context_messages = []
+    for message in sorted(messages, key=lambda m: m.created_at, reverse=True):
+        message_token_count = get_message_token_count(message)
+        if context_messages and message_token_count > token_budget:
+            break
+
+        token_budget -= message_token_count
+        context_messages.append(message)
+
+    return context_messages[::-1]
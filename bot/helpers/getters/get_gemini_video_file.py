@@ -0,0 +1,36 @@
+from google.generativeai.types import File
+
+from bot.database.operations.gemini_file.cache import (
+    delete_cached_gemini_file,
+    get_cached_gemini_file,
+    set_cached_gemini_file,
+)
+from bot.integrations.googleAI import download_video_file, get_active_video_file, upload_video_file
+
+
+async def get_gemini_video_file(video_file_link: str) -> File:
+    file_name = await get_cached_gemini_file(video_file_link)
+    if file_name:
+        video_file = await get_active_video_file(file_name)
+        if video_file:
+            return video_file
+
+        await delete_cached_gemini_file(video_file_link)
+
+    video_io, mime_type, content_hash = await download_video_file(video_file_link)
+    try:
+        video_file = None
+
+        file_name = await get_cached_gemini_file(content_hash)
+        if file_name:
+            video_file = await get_active_video_file(file_name)
+
+        if not video_file:
+            video_file = await upload_video_file(video_io, mime_type)
+            await set_cached_gemini_file(content_hash, video_file.name)
+    finally:
+        video_io.close()
+
+    await set_cached_gemini_file(video_file_link, video_file.name)
+
+    return video_file
@@ -0,0 +1,13 @@
+import math
+from typing import Optional
+
+PHOTO_TOKEN_COUNT = 800
+BYTES_PER_TOKEN = 4
+
+
+def get_token_count(content: Optional[str], photo_filenames: Optional[list[str]] = None) -> int:
+    token_count = math.ceil(len(content.encode('utf-8')) / BYTES_PER_TOKEN) if content else 0
+    if photo_filenames:
+        token_count += len(photo_filenames) * PHOTO_TOKEN_COUNT
+
+    return token_count
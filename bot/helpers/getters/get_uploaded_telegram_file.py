@@ -0,0 +1,20 @@
+import mimetypes
+
+from aiogram import Bot
+from aiogram.types import File
+
+from bot.database.main import firebase
+
+
+async def get_uploaded_telegram_file(bot: Bot, file: File, folder: str) -> str:
+    file_extension = file.file_path.split('.')[-1]
+    file_name = f'{file.file_unique_id}.{file_extension}'
+    file_path = f'{folder}/{file_name}'
+    if await firebase.get_blob_metadata(file_path):
+        return file_name
+
+    file_url = bot.session.api.file_url(bot.token, file.file_path)
+    file_stream = bot.session.stream_content(url=file_url, timeout=300, raise_for_status=True)
+    await firebase.upload_blob_stream(file_path, file_stream, mimetypes.guess_type(file_name)[0])
+
+    return file_name
@@ -0,0 +1,50 @@
+import asyncio
+import base64
+import logging
+from typing import Optional
+
+from filetype import filetype
+
+from bot.database.main import firebase
+from bot.integrations.http_client import http_client, HTTPProvider
+
+
+def get_vision_photo_link(user_id: str, photo_filename: str) -> str:
+    return firebase.get_public_url(f'users/vision/{user_id}/{photo_filename}')
+
+
+async def get_vision_photo(user_id: str, photo_filename: str) -> Optional[dict]:
+    photo_path = f'users/vision/{user_id}/{photo_filename}'
+    photo_metadata = await firebase.get_blob_metadata(photo_path)
+    if not photo_metadata:
+        return None
+
+    session = http_client.get_session(HTTPProvider.STORAGE)
+    async with session.get(firebase.get_public_url(photo_path)) as response:
+        if response.status < 200 or response.status >= 300:
+            logging.warning(f'Error in get_vision_photo: {photo_path} returned {response.status}')
+            return None
+
+        response_content = await response.read()
+
+    media_type = photo_metadata.get('content_type')
+    if not media_type or media_type == 'application/octet-stream':
+        kind = await asyncio.to_thread(lambda: filetype.guess(response_content))
+        media_type = kind.mime if kind else 'image/jpeg'
+
+    data = await asyncio.to_thread(lambda: base64.b64encode(response_content).decode('utf-8'))
+
+    return {
+        'media_type': media_type,
+        'data': data,
+    }
+
+
+async def get_vision_photos(user_id: str, photo_filenames: list[str]) -> dict[str, Optional[dict]]:
+    photo_filenames = list(dict.fromkeys(photo_filenames))
+
+    photos = await asyncio.gather(*[
+        get_vision_photo(user_id, photo_filename) for photo_filename in photo_filenames
+    ])
+
+    return dict(zip(photo_filenames, photos))
@@ -12,16 +12,14 @@ from bot.database.models.request import Request, RequestStatus
 from bot.database.models.transaction import TransactionType
 from bot.database.models.user import User, UserSettings
 from bot.database.operations.generation.getters import get_generation
-from bot.database.operations.generation.updaters import update_generation
 from bot.database.operations.request.getters import get_request
-from bot.database.operations.request.updaters import update_request
-from bot.database.operations.transaction.writers import write_transaction
 from bot.database.operations.user.getters import get_user
+from bot.database.operations.webhook_event.cache import WebhookProvider, handle_webhook_event_once
 from bot.handlers.ai.kling_handler import PRICE_KLING
 from bot.helpers.senders.send_document import send_document
 from bot.helpers.senders.send_error_info import send_error_info
 from bot.helpers.senders.send_video import send_video
-from bot.helpers.updaters.update_user_usage_quota import update_user_usage_quota
+from bot.helpers.updaters.generation_finalization import GenerationFinalization
 from bot.keyboards.common.common import build_reaction_keyboard, build_error_keyboard
 from bot.locales.main import get_user_language, get_localization
 from bot.locales.types import LanguageCode
@@ -32,6 +30,17 @@ async def handle_kling_webhook(bot: Bot, dp: Dispatcher, body: dict):
     if body.get('status') == 'processing':
         return
 
+    await handle_webhook_event_once(
+        WebhookProvider.KLING,
+        body.get('task_id'),
+        process_kling_webhook,
+        bot,
+        dp,
+        body,
+    )
+
+
+async def process_kling_webhook(bot: Bot, dp: Dispatcher, body: dict):
     generation = await get_generation(body.get('task_id'))
     if not generation:
         return
@@ -52,14 +61,24 @@ async def handle_kling_webhook(bot: Bot, dp: Dispatcher, body: dict):
     except TypeError:
         generation_result = None
 
+    finalization = GenerationFinalization()
     generation.status = GenerationStatus.FINISHED
     if generation_error or not generation_result:
         generation.has_error = True
-        await update_generation(generation.id, {
+        await finalization.update_generation(generation.id, {
             'status': generation.status,
             'has_error': generation.has_error,
         })
+    else:
+        generation.result = generation_result
+        await finalization.update_generation(generation.id, {
+            'status': generation.status,
+            'result': generation.result,
+            'seconds': generation.seconds,
+        })
+    await finalization.commit()
 
+    if generation.has_error:
         await send_error_info(
             bot=bot,
             user_id=user.id,
@@ -67,15 +86,8 @@ async def handle_kling_webhook(bot: Bot, dp: Dispatcher, body: dict):
             hashtags=['kling'],
         )
         logging.exception(f'Error in kling_webhook: {generation_error}')
-    else:
-        generation.result = generation_result
-        await update_generation(generation.id, {
-            'status': generation.status,
-            'result': generation.result,
-            'seconds': generation.seconds,
-        })
 
-    asyncio.create_task(handle_kling(bot, dp, user, user_language_code, request, generation))
+    asyncio.create_task(handle_kling(bot, dp, user, user_language_code, request, generation, finalization))
 
 
 async def handle_kling(
@@ -85,6 +97,7 @@ async def handle_kling(
     user_language_code: LanguageCode,
     request: Request,
     generation: Generation,
+    finalization: GenerationFinalization,
 ):
     prompt = generation.details.get('prompt')
 
@@ -129,34 +142,32 @@ async def handle_kling(
 
     if request.status != RequestStatus.FINISHED:
         request.status = RequestStatus.FINISHED
-        await update_request(request.id, {
+        await finalization.update_request(request.id, {
             'status': request.status
         })
 
         total_price = PRICE_KLING
-        update_tasks = [
-            write_transaction(
-                user_id=user.id,
-                type=TransactionType.EXPENSE,
-                product_id=generation.product_id,
-                amount=total_price,
-                clear_amount=total_price,
-                currency=Currency.USD,
-                quantity=1 if generation.result else 0,
-                details={
-                    'result': generation.result,
-                    'prompt': prompt,
-                    'has_error': generation.has_error,
-                },
-            ),
-            update_user_usage_quota(
-                user,
-                Quota.KLING,
-                1 if generation.result else 0,
-            ),
-        ]
-
-        await asyncio.gather(*update_tasks)
+        await finalization.write_transaction(
+            user_id=user.id,
+            type=TransactionType.EXPENSE,
+            product_id=generation.product_id,
+            amount=total_price,
+            clear_amount=total_price,
+            currency=Currency.USD,
+            quantity=1 if generation.result else 0,
+            details={
+                'result': generation.result,
+                'prompt': prompt,
+                'has_error': generation.has_error,
+            },
+        )
+        await finalization.update_user_usage_quota(
+            user,
+            Quota.KLING,
+            1 if generation.result else 0,
+        )
+
+        await finalization.commit()
 
         state = FSMContext(
             storage=dp.storage,
@@ -173,3 +184,5 @@ async def handle_kling(
                 await bot.delete_message(user.telegram_chat_id, processing_message_id)
             except Exception:
                 continue
+
+    await finalization.commit()
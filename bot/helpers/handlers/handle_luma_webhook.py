@@ -12,19 +12,17 @@ from bot.database.models.request import Request, RequestStatus
 from bot.database.models.transaction import TransactionType
 from bot.database.models.user import User, UserSettings
 from bot.database.operations.generation.getters import get_generation
-from bot.database.operations.generation.updaters import update_generation
 from bot.database.operations.product.getters import get_product
 from bot.database.operations.request.getters import get_request
-from bot.database.operations.request.updaters import update_request
-from bot.database.operations.transaction.writers import write_transaction
 from bot.database.operations.user.getters import get_user
+from bot.database.operations.webhook_event.cache import WebhookProvider, handle_webhook_event_once
 from bot.handlers.ai.face_swap_handler import handle_face_swap
 from bot.handlers.ai.luma_handler import PRICE_LUMA_PHOTON, PRICE_LUMA_RAY
 from bot.helpers.senders.send_document import send_document
 from bot.helpers.senders.send_error_info import send_error_info
 from bot.helpers.senders.send_images import send_image
 from bot.helpers.senders.send_video import send_video
-from bot.helpers.updaters.update_user_usage_quota import update_user_usage_quota
+from bot.helpers.updaters.generation_finalization import GenerationFinalization
 from bot.keyboards.common.common import build_reaction_keyboard, build_error_keyboard
 from bot.locales.main import get_user_language, get_localization
 from bot.locales.types import LanguageCode
@@ -34,6 +32,17 @@ async def handle_luma_webhook(bot: Bot, dp: Dispatcher, body: dict):
     if body.get('state') == 'dreaming':
         return
 
+    await handle_webhook_event_once(
+        WebhookProvider.LUMA,
+        body.get('id'),
+        process_luma_webhook,
+        bot,
+        dp,
+        body,
+    )
+
+
+async def process_luma_webhook(bot: Bot, dp: Dispatcher, body: dict):
     generation = await get_generation(body.get('id'))
     if not generation:
         return
@@ -55,14 +64,24 @@ async def handle_luma_webhook(bot: Bot, dp: Dispatcher, body: dict):
     generation_result = body.get('assets', {}).get('image') if body.get('generation_type') == 'image' \
         else body.get('assets', {}).get('video')
 
+    finalization = GenerationFinalization()
     generation.status = GenerationStatus.FINISHED
     if generation_error or not generation_result:
         generation.has_error = True
-        await update_generation(generation.id, {
+        await finalization.update_generation(generation.id, {
             'status': generation.status,
             'has_error': generation.has_error,
         })
+    else:
+        generation.result = generation_result
+        await finalization.update_generation(generation.id, {
+            'status': generation.status,
+            'result': generation.result,
+            'seconds': generation.seconds,
+        })
+    await finalization.commit()
 
+    if generation.has_error:
         await send_error_info(
             bot=bot,
             user_id=user.id,
@@ -70,20 +89,13 @@ async def handle_luma_webhook(bot: Bot, dp: Dispatcher, body: dict):
             hashtags=['luma'],
         )
         logging.exception(f'Error in luma_webhook: {generation_error}')
-    else:
-        generation.result = generation_result
-        await update_generation(generation.id, {
-            'status': generation.status,
-            'result': generation.result,
-            'seconds': generation.seconds,
-        })
 
     if product.details.get('quota') == Quota.LUMA_PHOTON:
-        asyncio.create_task(handle_luma_photon(bot, dp, user, user_language_code, request, generation))
+        asyncio.create_task(handle_luma_photon(bot, dp, user, user_language_code, request, generation, finalization))
     elif product.details.get('quota') == Quota.LUMA_RAY:
-        asyncio.create_task(handle_luma_ray(bot, dp, user, user_language_code, request, generation))
+        asyncio.create_task(handle_luma_ray(bot, dp, user, user_language_code, request, generation, finalization))
     elif product.details.get('quota') == Quota.FACE_SWAP:
-        asyncio.create_task(handle_luma_face_swap(bot, dp, user, user_language_code, request, generation))
+        asyncio.create_task(handle_luma_face_swap(bot, dp, user, user_language_code, request, generation, finalization))
 
 
 async def handle_luma_photon(
@@ -93,6 +105,7 @@ async def handle_luma_photon(
     user_language_code: LanguageCode,
     request: Request,
     generation: Generation,
+    finalization: GenerationFinalization,
 ):
     prompt = generation.details.get('prompt')
 
@@ -123,34 +136,32 @@ async def handle_luma_photon(
 
     if request.status != RequestStatus.FINISHED:
         request.status = RequestStatus.FINISHED
-        await update_request(request.id, {
+        await finalization.update_request(request.id, {
             'status': request.status
         })
 
         total_price = PRICE_LUMA_PHOTON
-        update_tasks = [
-            write_transaction(
-                user_id=user.id,
-                type=TransactionType.EXPENSE,
-                product_id=generation.product_id,
-                amount=total_price,
-                clear_amount=total_price,
-                currency=Currency.USD,
-                quantity=1 if generation.result else 0,
-                details={
-                    'result': generation.result,
-                    'prompt': prompt,
-                    'has_error': generation.has_error,
-                },
-            ),
-            update_user_usage_quota(
-                user,
-                Quota.LUMA_PHOTON,
-                1 if generation.result else 0,
-            ),
-        ]
-
-        await asyncio.gather(*update_tasks)
+        await finalization.write_transaction(
+            user_id=user.id,
+            type=TransactionType.EXPENSE,
+            product_id=generation.product_id,
+            amount=total_price,
+            clear_amount=total_price,
+            currency=Currency.USD,
+            quantity=1 if generation.result else 0,
+            details={
+                'result': generation.result,
+                'prompt': prompt,
+                'has_error': generation.has_error,
+            },
+        )
+        await finalization.update_user_usage_quota(
+            user,
+            Quota.LUMA_PHOTON,
+            1 if generation.result else 0,
+        )
+
+        await finalization.commit()
 
         state = FSMContext(
             storage=dp.storage,
@@ -168,6 +179,8 @@ async def handle_luma_photon(
             except Exception:
                 continue
 
+    await finalization.commit()
+
 
 async def handle_luma_ray(
     bot: Bot,
@@ -176,6 +189,7 @@ async def handle_luma_ray(
     user_language_code: LanguageCode,
     request: Request,
     generation: Generation,
+    finalization: GenerationFinalization,
 ):
     prompt = generation.details.get('prompt')
 
@@ -220,34 +234,32 @@ async def handle_luma_ray(
 
     if request.status != RequestStatus.FINISHED:
         request.status = RequestStatus.FINISHED
-        await update_request(request.id, {
+        await finalization.update_request(request.id, {
             'status': request.status
         })
 
         total_price = PRICE_LUMA_RAY
-        update_tasks = [
-            write_transaction(
-                user_id=user.id,
-                type=TransactionType.EXPENSE,
-                product_id=generation.product_id,
-                amount=total_price,
-                clear_amount=total_price,
-                currency=Currency.USD,
-                quantity=1 if generation.result else 0,
-                details={
-                    'result': generation.result,
-                    'prompt': prompt,
-                    'has_error': generation.has_error,
-                },
-            ),
-            update_user_usage_quota(
-                user,
-                Quota.LUMA_RAY,
-                1 if generation.result else 0,
-            ),
-        ]
-
-        await asyncio.gather(*update_tasks)
+        await finalization.write_transaction(
+            user_id=user.id,
+            type=TransactionType.EXPENSE,
+            product_id=generation.product_id,
+            amount=total_price,
+            clear_amount=total_price,
+            currency=Currency.USD,
+            quantity=1 if generation.result else 0,
+            details={
+                'result': generation.result,
+                'prompt': prompt,
+                'has_error': generation.has_error,
+            },
+        )
+        await finalization.update_user_usage_quota(
+            user,
+            Quota.LUMA_RAY,
+            1 if generation.result else 0,
+        )
+
+        await finalization.commit()
 
         state = FSMContext(
             storage=dp.storage,
@@ -265,6 +277,8 @@ async def handle_luma_ray(
             except Exception:
                 continue
 
+    await finalization.commit()
+
 
 async def handle_luma_face_swap(
     bot: Bot,
@@ -273,6 +287,7 @@ async def handle_luma_face_swap(
     user_language_code: LanguageCode,
     request: Request,
     generation: Generation,
+    finalization: GenerationFinalization,
 ):
     prompt = generation.details.get('prompt')
 
@@ -303,34 +318,32 @@ async def handle_luma_face_swap(
 
     if request.status != RequestStatus.FINISHED:
         request.status = RequestStatus.FINISHED
-        await update_request(request.id, {
+        await finalization.update_request(request.id, {
             'status': request.status
         })
 
         total_price = PRICE_LUMA_PHOTON
-        update_tasks = [
-            write_transaction(
-                user_id=user.id,
-                type=TransactionType.EXPENSE,
-                product_id=generation.product_id,
-                amount=total_price,
-                clear_amount=total_price,
-                currency=Currency.USD,
-                quantity=1 if generation.result else 0,
-                details={
-                    'result': generation.result,
-                    'prompt': prompt,
-                    'has_error': generation.has_error,
-                },
-            ),
-            update_user_usage_quota(
-                user,
-                Quota.FACE_SWAP,
-                1 if generation.result else 0,
-            ),
-        ]
-
-        await asyncio.gather(*update_tasks)
+        await finalization.write_transaction(
+            user_id=user.id,
+            type=TransactionType.EXPENSE,
+            product_id=generation.product_id,
+            amount=total_price,
+            clear_amount=total_price,
+            currency=Currency.USD,
+            quantity=1 if generation.result else 0,
+            details={
+                'result': generation.result,
+                'prompt': prompt,
+                'has_error': generation.has_error,
+            },
+        )
+        await finalization.update_user_usage_quota(
+            user,
+            Quota.FACE_SWAP,
+            1 if generation.result else 0,
+        )
+
+        await finalization.commit()
 
         state = FSMContext(
             storage=dp.storage,
@@ -350,3 +363,5 @@ async def handle_luma_face_swap(
                 await bot.delete_message(user.telegram_chat_id, processing_message_id)
             except Exception:
                 continue
+
+    await finalization.commit()
@@ -12,35 +12,45 @@ from bot.database.models.request import Request, RequestStatus
 from bot.database.models.transaction import TransactionType
 from bot.database.models.user import User, UserSettings
 from bot.database.operations.generation.getters import get_generation
-from bot.database.operations.generation.updaters import update_generation
 from bot.database.operations.request.getters import get_request
-from bot.database.operations.request.updaters import update_request
-from bot.database.operations.transaction.writers import write_transaction
 from bot.database.operations.user.getters import get_user
+from bot.database.operations.webhook_event.cache import WebhookProvider, handle_webhook_event_once
 from bot.handlers.ai.midjourney_handler import PRICE_MIDJOURNEY_REQUEST
 from bot.helpers.senders.send_document import send_document
 from bot.helpers.senders.send_error_info import send_error_info
 from bot.helpers.senders.send_images import send_image
-from bot.helpers.updaters.update_user_usage_quota import update_user_usage_quota
+from bot.helpers.updaters.generation_finalization import GenerationFinalization
 from bot.keyboards.ai.midjourney import build_midjourney_keyboard
 from bot.keyboards.common.common import build_reaction_keyboard, build_error_keyboard, build_buy_motivation_keyboard
 from bot.locales.main import get_localization, get_user_language
 
 
 async def handle_midjourney_webhook(bot: Bot, dp: Dispatcher, body: dict):
+    return await handle_webhook_event_once(
+        WebhookProvider.MIDJOURNEY,
+        body.get('hash'),
+        process_midjourney_webhook,
+        bot,
+        dp,
+        body,
+    )
+
+
+async def process_midjourney_webhook(bot: Bot, dp: Dispatcher, body: dict):
     generation = await get_generation(body.get('hash'))
     if not generation:
         return False
     elif generation.status == GenerationStatus.FINISHED:
         return True
 
+    finalization = GenerationFinalization()
     generation_error = body.get('status_reason', False)
     generation_result = body.get('result', {})
     if generation_error or not generation_result:
         generation.status = GenerationStatus.FINISHED
         generation.has_error = True
         generation.details['error'] = generation_error
-        await update_generation(generation.id, {
+        await finalization.update_generation(generation.id, {
             'status': generation.status,
             'has_error': generation.has_error,
         })
@@ -48,15 +58,17 @@ async def handle_midjourney_webhook(bot: Bot, dp: Dispatcher, body: dict):
     else:
         generation.status = GenerationStatus.FINISHED
         generation.result = generation_result.get('url', '')
-        await update_generation(generation.id, {
+        await finalization.update_generation(generation.id, {
             'status': generation.status,
             'result': generation.result,
         })
 
+    await finalization.commit()
+
     request = await get_request(generation.request_id)
     user = await get_user(request.user_id)
 
-    asyncio.create_task(handle_midjourney_result(bot, dp, user, request, generation))
+    asyncio.create_task(handle_midjourney_result(bot, dp, user, request, generation, finalization))
 
     return True
 
@@ -67,6 +79,7 @@ async def handle_midjourney_result(
     user: User,
     request: Request,
     generation: Generation,
+    finalization: GenerationFinalization,
 ):
     is_suggestion = generation.details.get('is_suggestion', False)
     action_type = generation.details.get('action')
@@ -137,38 +150,34 @@ async def handle_midjourney_result(
             )
 
     request.status = RequestStatus.FINISHED
-    await update_request(request.id, {
+    await finalization.update_request(request.id, {
         'status': request.status
     })
 
-    update_tasks = [
-        write_transaction(
-            user_id=user.id,
-            type=TransactionType.EXPENSE,
-            product_id=generation.product_id,
-            amount=PRICE_MIDJOURNEY_REQUEST,
-            clear_amount=PRICE_MIDJOURNEY_REQUEST,
-            currency=Currency.USD,
-            quantity=1,
-            details={
-                'prompt': generation.details.get('prompt'),
-                'type': generation.details.get('action'),
-                'is_suggestion': generation.details.get('is_suggestion', False),
-                'has_error': generation.details.get('has_error', False),
-            }
-        ),
-    ]
+    await finalization.write_transaction(
+        user_id=user.id,
+        type=TransactionType.EXPENSE,
+        product_id=generation.product_id,
+        amount=PRICE_MIDJOURNEY_REQUEST,
+        clear_amount=PRICE_MIDJOURNEY_REQUEST,
+        currency=Currency.USD,
+        quantity=1,
+        details={
+            'prompt': generation.details.get('prompt'),
+            'type': generation.details.get('action'),
+            'is_suggestion': generation.details.get('is_suggestion', False),
+            'has_error': generation.details.get('has_error', False),
+        }
+    )
 
     if not generation.has_error and not is_suggestion:
-        update_tasks.append(
-            update_user_usage_quota(
-                user,
-                Quota.MIDJOURNEY,
-                1,
-            )
+        await finalization.update_user_usage_quota(
+            user,
+            Quota.MIDJOURNEY,
+            1,
         )
 
-    await asyncio.gather(*update_tasks)
+    await finalization.commit()
 
     state = FSMContext(
         storage=dp.storage,
@@ -12,14 +12,11 @@ from bot.database.models.request import Request, RequestStatus
 from bot.database.models.transaction import TransactionType
 from bot.database.models.user import User, UserSettings
 from bot.database.operations.face_swap_package.getters import get_used_face_swap_package
-from bot.database.operations.face_swap_package.updaters import update_used_face_swap_package
 from bot.database.operations.generation.getters import get_generations_by_request_id, get_generation
-from bot.database.operations.generation.updaters import update_generation
 from bot.database.operations.product.getters import get_product
 from bot.database.operations.request.getters import get_request
-from bot.database.operations.request.updaters import update_request
-from bot.database.operations.transaction.writers import write_transaction
 from bot.database.operations.user.getters import get_user
+from bot.database.operations.webhook_event.cache import WebhookProvider, handle_webhook_event_once
 from bot.handlers.ai.face_swap_handler import PRICE_FACE_SWAP, handle_face_swap
 from bot.handlers.ai.flux_handler import PRICE_FLUX
 from bot.handlers.ai.music_gen_handler import PRICE_MUSIC_GEN, handle_music_gen
@@ -34,13 +31,24 @@ from bot.helpers.senders.send_audio import send_audio
 from bot.helpers.senders.send_document import send_document
 from bot.helpers.senders.send_error_info import send_error_info
 from bot.helpers.senders.send_images import send_image
-from bot.helpers.updaters.update_user_usage_quota import update_user_usage_quota
+from bot.helpers.updaters.generation_finalization import GenerationFinalization
 from bot.keyboards.common.common import build_reaction_keyboard, build_error_keyboard
 from bot.locales.main import get_user_language, get_localization
 from bot.locales.types import LanguageCode
 
 
 async def handle_replicate_webhook(bot: Bot, dp: Dispatcher, prediction: dict):
+    return await handle_webhook_event_once(
+        WebhookProvider.REPLICATE,
+        prediction.get('id'),
+        process_replicate_webhook,
+        bot,
+        dp,
+        prediction,
+    )
+
+
+async def process_replicate_webhook(bot: Bot, dp: Dispatcher, prediction: dict):
     generation = await get_generation(prediction.get('id'))
     if not generation:
         return False
@@ -56,37 +64,22 @@ async def handle_replicate_webhook(bot: Bot, dp: Dispatcher, prediction: dict):
     generation_error, generation_result = prediction.get('error', ''), prediction.get('output', {})
     seconds = prediction.get('metrics', {}).get('predict_time', 0)
 
+    finalization = GenerationFinalization()
     generation.status = GenerationStatus.FINISHED
     generation.seconds = seconds
-    if generation_error and 'NSFW content' in generation_error:
-        await update_generation(generation.id, {
+    is_forbidden = generation_error and 'NSFW content' in generation_error
+    if is_forbidden:
+        await finalization.update_generation(generation.id, {
             'status': generation.status,
             'seconds': generation.seconds,
         })
-
-        await bot.send_sticker(
-            chat_id=user.telegram_chat_id,
-            sticker=config.MESSAGE_STICKERS.get(MessageSticker.FEAR),
-        )
-        await bot.send_message(
-            chat_id=user.telegram_chat_id,
-            text=get_localization(user_language_code).ERROR_REQUEST_FORBIDDEN,
-        )
     elif generation_error or not generation_result:
         generation.has_error = True
-        await update_generation(generation.id, {
+        await finalization.update_generation(generation.id, {
             'status': generation.status,
             'has_error': generation.has_error,
             'seconds': generation.seconds,
         })
-
-        await send_error_info(
-            bot=bot,
-            user_id=user.id,
-            info=generation_error,
-            hashtags=['replicate'],
-        )
-        logging.exception(f'Error in replicate_webhook: {prediction.get("logs")}')
     else:
         generation.result = generation_result[0] if type(generation_result) == list else generation_result
         if (
@@ -94,22 +87,51 @@ async def handle_replicate_webhook(bot: Bot, dp: Dispatcher, prediction: dict):
             request.details.get('type') == PhotoshopAIAction.COLORIZATION
         ):
             generation.result = generation.result.get('image')
-        await update_generation(generation.id, {
+        await finalization.update_generation(generation.id, {
             'status': generation.status,
             'result': generation.result,
             'seconds': generation.seconds,
         })
+    await finalization.commit()
+
+    if is_forbidden:
+        await bot.send_sticker(
+            chat_id=user.telegram_chat_id,
+            sticker=config.MESSAGE_STICKERS.get(MessageSticker.FEAR),
+        )
+        await bot.send_message(
+            chat_id=user.telegram_chat_id,
+            text=get_localization(user_language_code).ERROR_REQUEST_FORBIDDEN,
+        )
+    elif generation.has_error:
+        await send_error_info(
+            bot=bot,
+            user_id=user.id,
+            info=generation_error,
+            hashtags=['replicate'],
+        )
+        logging.exception(f'Error in replicate_webhook: {prediction.get("logs")}')
 
     if product.details.get('quota') == Quota.STABLE_DIFFUSION:
-        asyncio.create_task(handle_replicate_stable_diffusion(bot, dp, user, user_language_code, request, generation))
+        asyncio.create_task(
+            handle_replicate_stable_diffusion(bot, dp, user, user_language_code, request, generation, finalization)
+        )
     elif product.details.get('quota') == Quota.FLUX:
-        asyncio.create_task(handle_replicate_flux(bot, dp, user, user_language_code, request, generation))
+        asyncio.create_task(
+            handle_replicate_flux(bot, dp, user, user_language_code, request, generation, finalization)
+        )
     elif product.details.get('quota') == Quota.FACE_SWAP:
-        asyncio.create_task(handle_replicate_face_swap(bot, dp, user, user_language_code, request, generation))
+        asyncio.create_task(
+            handle_replicate_face_swap(bot, dp, user, user_language_code, request, generation, finalization)
+        )
     elif product.details.get('quota') == Quota.PHOTOSHOP_AI:
-        asyncio.create_task(handle_replicate_photoshop_ai(bot, dp, user, user_language_code, request, generation))
+        asyncio.create_task(
+            handle_replicate_photoshop_ai(bot, dp, user, user_language_code, request, generation, finalization)
+        )
     elif product.details.get('quota') == Quota.MUSIC_GEN:
-        asyncio.create_task(handle_replicate_music_gen(bot, dp, user, user_language_code, request, generation))
+        asyncio.create_task(
+            handle_replicate_music_gen(bot, dp, user, user_language_code, request, generation, finalization)
+        )
 
     return True
 
@@ -121,6 +143,7 @@ async def handle_replicate_photoshop_ai(
     user_language_code: LanguageCode,
     request: Request,
     generation: Generation,
+    finalization: GenerationFinalization,
 ):
     if generation.result:
         footer_text = f'\n\n🖼 {user.daily_limits[Quota.PHOTOSHOP_AI] + user.additional_usage_quota[Quota.PHOTOSHOP_AI]}' \
@@ -149,7 +172,7 @@ async def handle_replicate_photoshop_ai(
 
     if request.status != RequestStatus.FINISHED:
         request.status = RequestStatus.FINISHED
-        await update_request(request.id, {
+        await finalization.update_request(request.id, {
             'status': request.status
         })
 
@@ -163,29 +186,27 @@ async def handle_replicate_photoshop_ai(
         else:
             total_price = round(0.000575 * generation.seconds, 6)
 
-        update_tasks = [
-            write_transaction(
-                user_id=user.id,
-                type=TransactionType.EXPENSE,
-                product_id=generation.product_id,
-                amount=total_price,
-                clear_amount=total_price,
-                currency=Currency.USD,
-                quantity=1 if generation.result else 0,
-                details={
-                    'result': generation.result,
-                    'type': action_name,
-                    'has_error': generation.has_error,
-                },
-            ),
-            update_user_usage_quota(
-                user,
-                Quota.PHOTOSHOP_AI,
-                1 if generation.result else 0,
-            ),
-        ]
+        await finalization.write_transaction(
+            user_id=user.id,
+            type=TransactionType.EXPENSE,
+            product_id=generation.product_id,
+            amount=total_price,
+            clear_amount=total_price,
+            currency=Currency.USD,
+            quantity=1 if generation.result else 0,
+            details={
+                'result': generation.result,
+                'type': action_name,
+                'has_error': generation.has_error,
+            },
+        )
+        await finalization.update_user_usage_quota(
+            user,
+            Quota.PHOTOSHOP_AI,
+            1 if generation.result else 0,
+        )
 
-        await asyncio.gather(*update_tasks)
+        await finalization.commit()
 
         state = FSMContext(
             storage=dp.storage,
@@ -206,6 +227,8 @@ async def handle_replicate_photoshop_ai(
             except Exception:
                 continue
 
+    await finalization.commit()
+
 
 async def handle_replicate_face_swap(
     bot: Bot,
@@ -214,6 +237,7 @@ async def handle_replicate_face_swap(
     user_language_code: LanguageCode,
     request: Request,
     generation: Generation,
+    finalization: GenerationFinalization,
 ):
     if generation.result:
         reply_markup = build_reaction_keyboard(generation.id)
@@ -225,7 +249,7 @@ async def handle_replicate_face_swap(
     current_count = await dp.storage.redis.incr(request.id)
     if current_count == request.requested and request.status != RequestStatus.FINISHED:
         request.status = RequestStatus.FINISHED
-        await update_request(request.id, {
+        await finalization.update_request(request.id, {
             'status': request.status
         })
 
@@ -252,61 +276,54 @@ async def handle_replicate_face_swap(
         used_face_swap_package = await get_used_face_swap_package(
             generation.details.get('used_face_swap_package_id')
         )
+        total_price = round(PRICE_FACE_SWAP * total_seconds, 6)
         if request.details.get('is_test'):
-            total_price = round(PRICE_FACE_SWAP * total_seconds, 6)
-            update_tasks = [
-                write_transaction(
-                    user_id=user.id,
-                    type=TransactionType.EXPENSE,
-                    product_id=generation.product_id,
-                    amount=total_price,
-                    clear_amount=total_price,
-                    currency=Currency.USD,
-                    quantity=total_result,
-                    details={
-                        'name': request.details.get('face_swap_package_name'),
-                        'images': success_generations,
-                        'seconds': total_seconds,
-                        'has_error': generation.has_error,
-                    }),
-            ]
+            await finalization.write_transaction(
+                user_id=user.id,
+                type=TransactionType.EXPENSE,
+                product_id=generation.product_id,
+                amount=total_price,
+                clear_amount=total_price,
+                currency=Currency.USD,
+                quantity=total_result,
+                details={
+                    'name': request.details.get('face_swap_package_name'),
+                    'images': success_generations,
+                    'seconds': total_seconds,
+                    'has_error': generation.has_error,
+                },
+            )
+            await finalization.commit()
         else:
-            total_price = round(PRICE_FACE_SWAP * total_seconds, 6)
-            update_tasks = [
-                write_transaction(
-                    user_id=user.id,
-                    type=TransactionType.EXPENSE,
-                    product_id=generation.product_id,
-                    amount=total_price,
-                    clear_amount=total_price,
-                    currency=Currency.USD,
-                    quantity=total_result,
-                    details={
-                        'name': request.details.get('face_swap_package_name', 'CUSTOM'),
-                        'images': success_generations,
-                        'seconds': total_seconds,
-                        'has_error': generation.has_error,
-                    }
-                ),
-                update_user_usage_quota(
-                    user,
-                    Quota.FACE_SWAP,
-                    total_result,
-                ),
-            ]
-
+            await finalization.write_transaction(
+                user_id=user.id,
+                type=TransactionType.EXPENSE,
+                product_id=generation.product_id,
+                amount=total_price,
+                clear_amount=total_price,
+                currency=Currency.USD,
+                quantity=total_result,
+                details={
+                    'name': request.details.get('face_swap_package_name', 'CUSTOM'),
+                    'images': success_generations,
+                    'seconds': total_seconds,
+                    'has_error': generation.has_error,
+                },
+            )
+            await finalization.update_user_usage_quota(
+                user,
+                Quota.FACE_SWAP,
+                total_result,
+            )
             if (
                 total_result == len(request_generations) and
                 used_face_swap_package and
                 used_face_swap_package_used_images
             ):
-                update_tasks.append(
-                    update_used_face_swap_package(used_face_swap_package.id, {
-                        'used_images': used_face_swap_package.used_images + used_face_swap_package_used_images,
-                    })
-                )
-
-        await asyncio.gather(*update_tasks)
+                await finalization.update_used_face_swap_package(used_face_swap_package.id, {
+                    'used_images': used_face_swap_package.used_images + used_face_swap_package_used_images,
+                })
+            await finalization.commit()
 
         state = FSMContext(
             storage=dp.storage,
@@ -327,6 +344,8 @@ async def handle_replicate_face_swap(
             except Exception:
                 continue
 
+    await finalization.commit()
+
 
 async def handle_replicate_music_gen(
     bot: Bot,
@@ -335,6 +354,7 @@ async def handle_replicate_music_gen(
     user_language_code: LanguageCode,
     request: Request,
     generation: Generation,
+    finalization: GenerationFinalization,
 ):
     prompt = generation.details.get('prompt')
     duration = int(generation.details.get('duration'))
@@ -369,35 +389,33 @@ async def handle_replicate_music_gen(
 
     if request.status != RequestStatus.FINISHED:
         request.status = RequestStatus.FINISHED
-        await update_request(request.id, {
+        await finalization.update_request(request.id, {
             'status': request.status
         })
 
         total_price = round(PRICE_MUSIC_GEN * generation.seconds, 6)
-        update_tasks = [
-            write_transaction(
-                user_id=user.id,
-                type=TransactionType.EXPENSE,
-                product_id=generation.product_id,
-                amount=total_price,
-                clear_amount=total_price,
-                currency=Currency.USD,
-                quantity=1 if generation.result else 0,
-                details={
-                    'result': generation.result,
-                    'prompt': prompt,
-                    'duration': duration,
-                    'has_error': generation.has_error,
-                },
-            ),
-            update_user_usage_quota(
-                user,
-                Quota.MUSIC_GEN,
-                duration // 10 if generation.result else 0,
-            ),
-        ]
+        await finalization.write_transaction(
+            user_id=user.id,
+            type=TransactionType.EXPENSE,
+            product_id=generation.product_id,
+            amount=total_price,
+            clear_amount=total_price,
+            currency=Currency.USD,
+            quantity=1 if generation.result else 0,
+            details={
+                'result': generation.result,
+                'prompt': prompt,
+                'duration': duration,
+                'has_error': generation.has_error,
+            },
+        )
+        await finalization.update_user_usage_quota(
+            user,
+            Quota.MUSIC_GEN,
+            duration // 10 if generation.result else 0,
+        )
 
-        await asyncio.gather(*update_tasks)
+        await finalization.commit()
 
         state = FSMContext(
             storage=dp.storage,
@@ -418,6 +436,8 @@ async def handle_replicate_music_gen(
             except Exception:
                 continue
 
+    await finalization.commit()
+
 
 async def handle_replicate_stable_diffusion(
     bot: Bot,
@@ -426,6 +446,7 @@ async def handle_replicate_stable_diffusion(
     user_language_code: LanguageCode,
     request: Request,
     generation: Generation,
+    finalization: GenerationFinalization,
 ):
     prompt = generation.details.get('prompt')
 
@@ -456,34 +477,32 @@ async def handle_replicate_stable_diffusion(
 
     if request.status != RequestStatus.FINISHED:
         request.status = RequestStatus.FINISHED
-        await update_request(request.id, {
+        await finalization.update_request(request.id, {
             'status': request.status
         })
 
         total_price = PRICE_STABLE_DIFFUSION
-        update_tasks = [
-            write_transaction(
-                user_id=user.id,
-                type=TransactionType.EXPENSE,
-                product_id=generation.product_id,
-                amount=total_price,
-                clear_amount=total_price,
-                currency=Currency.USD,
-                quantity=1 if generation.result else 0,
-                details={
-                    'result': generation.result,
-                    'prompt': prompt,
-                    'has_error': generation.has_error,
-                },
-            ),
-            update_user_usage_quota(
-                user,
-                Quota.STABLE_DIFFUSION,
-                1 if generation.result else 0,
-            ),
-        ]
+        await finalization.write_transaction(
+            user_id=user.id,
+            type=TransactionType.EXPENSE,
+            product_id=generation.product_id,
+            amount=total_price,
+            clear_amount=total_price,
+            currency=Currency.USD,
+            quantity=1 if generation.result else 0,
+            details={
+                'result': generation.result,
+                'prompt': prompt,
+                'has_error': generation.has_error,
+            },
+        )
+        await finalization.update_user_usage_quota(
+            user,
+            Quota.STABLE_DIFFUSION,
+            1 if generation.result else 0,
+        )
 
-        await asyncio.gather(*update_tasks)
+        await finalization.commit()
 
         state = FSMContext(
             storage=dp.storage,
@@ -501,6 +520,8 @@ async def handle_replicate_stable_diffusion(
             except Exception:
                 continue
 
+    await finalization.commit()
+
 
 async def handle_replicate_flux(
     bot: Bot,
@@ -509,6 +530,7 @@ async def handle_replicate_flux(
     user_language_code: LanguageCode,
     request: Request,
     generation: Generation,
+    finalization: GenerationFinalization,
 ):
     prompt = generation.details.get('prompt')
 
@@ -539,34 +561,32 @@ async def handle_replicate_flux(
 
     if request.status != RequestStatus.FINISHED:
         request.status = RequestStatus.FINISHED
-        await update_request(request.id, {
+        await finalization.update_request(request.id, {
             'status': request.status
         })
 
         total_price = PRICE_FLUX
-        update_tasks = [
-            write_transaction(
-                user_id=user.id,
-                type=TransactionType.EXPENSE,
-                product_id=generation.product_id,
-                amount=total_price,
-                clear_amount=total_price,
-                currency=Currency.USD,
-                quantity=1 if generation.result else 0,
-                details={
-                    'result': generation.result,
-                    'prompt': prompt,
-                    'has_error': generation.has_error,
-                },
-            ),
-            update_user_usage_quota(
-                user,
-                Quota.FLUX,
-                1 if generation.result else 0,
-            ),
-        ]
+        await finalization.write_transaction(
+            user_id=user.id,
+            type=TransactionType.EXPENSE,
+            product_id=generation.product_id,
+            amount=total_price,
+            clear_amount=total_price,
+            currency=Currency.USD,
+            quantity=1 if generation.result else 0,
+            details={
+                'result': generation.result,
+                'prompt': prompt,
+                'has_error': generation.has_error,
+            },
+        )
+        await finalization.update_user_usage_quota(
+            user,
+            Quota.FLUX,
+            1 if generation.result else 0,
+        )
 
-        await asyncio.gather(*update_tasks)
+        await finalization.commit()
 
         state = FSMContext(
             storage=dp.storage,
@@ -583,3 +603,5 @@ async def handle_replicate_flux(
                 await bot.delete_message(user.telegram_chat_id, processing_message_id)
             except Exception:
                 continue
+
+    await finalization.commit()
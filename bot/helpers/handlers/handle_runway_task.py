@@ -0,0 +1,170 @@
+import asyncio
+import logging
+
+from aiogram import Bot, Dispatcher
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+
+from bot.config import config, MessageSticker
+from bot.database.models.common import Quota, Model, SendType, Currency
+from bot.database.models.generation import GenerationStatus, Generation
+from bot.database.models.request import Request, RequestStatus
+from bot.database.models.transaction import TransactionType
+from bot.database.models.user import User, UserSettings
+from bot.database.operations.generation.getters import get_generation
+from bot.database.operations.request.getters import get_request
+from bot.database.operations.user.getters import get_user
+from bot.handlers.ai.runway_handler import PRICE_RUNWAY
+from bot.helpers.senders.send_document import send_document
+from bot.helpers.senders.send_error_info import send_error_info
+from bot.helpers.senders.send_video import send_video
+from bot.helpers.updaters.generation_finalization import GenerationFinalization
+from bot.integrations.runway import get_cost_for_video
+from bot.keyboards.common.common import build_reaction_keyboard, build_error_keyboard
+from bot.locales.main import get_user_language, get_localization
+from bot.locales.types import LanguageCode
+
+
+async def handle_runway_task(bot: Bot, dp: Dispatcher, video: dict):
+    generation = await get_generation(video.get('id'))
+    if not generation:
+        return
+    elif generation.status == GenerationStatus.FINISHED:
+        return
+
+    request = await get_request(generation.request_id)
+    user = await get_user(request.user_id)
+
+    user_language_code = await get_user_language(user.id, dp.storage)
+
+    generation_result = (video.get('result') or [None])[0]
+
+    finalization = GenerationFinalization()
+    generation.status = GenerationStatus.FINISHED
+    if video.get('status') != 'SUCCEEDED' or not generation_result:
+        generation_error = f'{video.get("failure_code") or video.get("status")}: {video.get("failure")}'
+        generation.has_error = True
+        await finalization.update_generation(generation.id, {
+            'status': generation.status,
+            'has_error': generation.has_error,
+        })
+    else:
+        generation.result = generation_result
+        await finalization.update_generation(generation.id, {
+            'status': generation.status,
+            'result': generation.result,
+            'seconds': generation.seconds,
+        })
+    await finalization.commit()
+
+    if generation.has_error:
+        await send_error_info(
+            bot=bot,
+            user_id=user.id,
+            info=generation_error,
+            hashtags=['runway'],
+        )
+        logging.exception(f'Error in runway_task: {generation_error}')
+
+    asyncio.create_task(handle_runway(bot, dp, user, user_language_code, request, generation, finalization))
+
+
+async def handle_runway(
+    bot: Bot,
+    dp: Dispatcher,
+    user: User,
+    user_language_code: LanguageCode,
+    request: Request,
+    generation: Generation,
+    finalization: GenerationFinalization,
+):
+    cost = get_cost_for_video(generation.details.get('duration'))
+
+    if generation.result:
+        footer_text = f'\n\n📹 {user.daily_limits[Quota.RUNWAY] + user.additional_usage_quota[Quota.RUNWAY]}' \
+            if user.settings[Model.RUNWAY][UserSettings.SHOW_USAGE_QUOTA] and \
+               user.daily_limits[Quota.RUNWAY] != float('inf') else ''
+        caption = f'{get_localization(user_language_code).GENERATION_VIDEO_SUCCESS}{footer_text}'
+
+        reply_markup = build_reaction_keyboard(generation.id)
+        if user.settings[Model.RUNWAY][UserSettings.SEND_TYPE] == SendType.DOCUMENT:
+            await send_document(
+                bot,
+                user.telegram_chat_id,
+                generation.result,
+                reply_markup,
+                caption,
+            )
+        else:
+            await send_video(
+                bot,
+                user.telegram_chat_id,
+                generation.result,
+                caption,
+                get_localization(user_language_code).SETTINGS_SEND_TYPE_VIDEO,
+                generation.details.get('duration', 5),
+                reply_markup,
+            )
+    elif generation.has_error:
+        await bot.send_sticker(
+            chat_id=user.telegram_chat_id,
+            sticker=config.MESSAGE_STICKERS.get(MessageSticker.ERROR),
+        )
+
+        reply_markup = build_error_keyboard(user_language_code)
+        await bot.send_message(
+            chat_id=user.telegram_chat_id,
+            text=get_localization(user_language_code).ERROR,
+            reply_markup=reply_markup,
+            parse_mode=None,
+        )
+
+    if request.status != RequestStatus.FINISHED:
+        request.status = RequestStatus.FINISHED
+        await finalization.update_request(request.id, {
+            'status': request.status
+        })
+
+        total_price = PRICE_RUNWAY * cost if generation.result else 0
+        await finalization.write_transaction(
+            user_id=user.id,
+            type=TransactionType.EXPENSE,
+            product_id=generation.product_id,
+            amount=total_price,
+            clear_amount=total_price,
+            currency=Currency.USD,
+            quantity=1 if generation.result else 0,
+            details={
+                'result': generation.result,
+                'prompt_text': generation.details.get('prompt_text'),
+                'prompt_image': generation.details.get('prompt_image'),
+                'resolution': generation.details.get('resolution'),
+                'duration': generation.details.get('duration'),
+                'has_error': generation.has_error,
+            },
+        )
+        await finalization.update_user_usage_quota(
+            user,
+            Quota.RUNWAY,
+            cost if generation.result else 0,
+        )
+
+        await finalization.commit()
+
+        state = FSMContext(
+            storage=dp.storage,
+            key=StorageKey(
+                chat_id=int(user.telegram_chat_id),
+                user_id=int(user.id),
+                bot_id=bot.id,
+            )
+        )
+        await state.clear()
+
+        for processing_message_id in request.processing_message_ids:
+            try:
+                await bot.delete_message(user.telegram_chat_id, processing_message_id)
+            except Exception:
+                continue
+
+    await finalization.commit()
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 
 from aiogram import Bot, Dispatcher
@@ -12,25 +11,33 @@ from bot.database.models.generation import GenerationStatus
 from bot.database.models.request import RequestStatus
 from bot.database.models.transaction import TransactionType
 from bot.database.models.user import UserSettings
-from bot.database.operations.generation.getters import get_generation, get_generations_by_request_id
-from bot.database.operations.generation.updaters import update_generation
+from bot.database.operations.generation.getters import get_generation
 from bot.database.operations.product.getters import get_product_by_quota
 from bot.database.operations.request.getters import get_request
-from bot.database.operations.request.updaters import update_request
-from bot.database.operations.transaction.writers import write_transaction
 from bot.database.operations.user.getters import get_user
-from bot.database.operations.user.updaters import update_user
+from bot.database.operations.webhook_event.cache import WebhookProvider, handle_webhook_event_once
 from bot.handlers.ai.suno_handler import PRICE_SUNO
 from bot.helpers.senders.send_audio import send_audio
 from bot.helpers.senders.send_error_info import send_error_info
 from bot.helpers.senders.send_video import send_video
-from bot.helpers.updaters.update_user_usage_quota import get_user_with_updated_quota
+from bot.helpers.updaters.generation_finalization import GenerationFinalization
 from bot.keyboards.ai.suno import build_suno_keyboard
 from bot.keyboards.common.common import build_reaction_keyboard, build_error_keyboard
 from bot.locales.main import get_user_language, get_localization
 
 
 async def handle_suno_webhook(bot: Bot, dp: Dispatcher, body: dict):
+    return await handle_webhook_event_once(
+        WebhookProvider.SUNO,
+        body.get('task_id'),
+        process_suno_webhook,
+        bot,
+        dp,
+        body,
+    )
+
+
+async def process_suno_webhook(bot: Bot, dp: Dispatcher, body: dict):
     first_generation = await get_generation(f'{body.get("task_id")}-1')
     second_generation = await get_generation(f'{body.get("task_id")}-2')
     if not first_generation and not second_generation:
@@ -44,38 +51,20 @@ async def handle_suno_webhook(bot: Bot, dp: Dispatcher, body: dict):
 
     is_generations_success, generations_result = body.get('success', False), body.get('data', [])
 
+    finalization = GenerationFinalization()
     first_generation.status = GenerationStatus.FINISHED
     second_generation.status = GenerationStatus.FINISHED
     if not is_generations_success:
         first_generation.has_error = True
         second_generation.has_error = True
-        await update_generation(first_generation.id, {
+        await finalization.update_generation(first_generation.id, {
             'status': first_generation.status,
             'has_error': first_generation.has_error,
         })
-        await update_generation(second_generation.id, {
+        await finalization.update_generation(second_generation.id, {
             'status': second_generation.status,
             'has_error': second_generation.has_error,
         })
-
-        error_message = body.get('error', {}).get('message', '')
-        logging.exception(f'Error in suno_webhook', error_message)
-        await bot.send_sticker(
-            chat_id=user.telegram_chat_id,
-            sticker=config.MESSAGE_STICKERS.get(MessageSticker.ERROR),
-        )
-
-        await bot.send_message(
-            chat_id=user.telegram_chat_id,
-            text=get_localization(user_language_code).ERROR,
-            reply_markup=build_error_keyboard(user_language_code),
-        )
-        await send_error_info(
-            bot=bot,
-            user_id=user.id,
-            info=str(error_message),
-            hashtags=['suno'],
-        )
     else:
         for i, current_generation in enumerate([first_generation, second_generation]):
             generation_result = generations_result[i]
@@ -91,11 +80,32 @@ async def handle_suno_webhook(bot: Bot, dp: Dispatcher, body: dict):
                 'duration': int(generation_result.get('duration')),
             }
             current_generation.details = {**current_generation.details, **current_generation_new_details}
-            await update_generation(current_generation.id, {
+            await finalization.update_generation(current_generation.id, {
                 'status': current_generation.status,
                 'result': current_generation.result,
                 'details': current_generation.details,
             })
+    await finalization.commit()
+
+    if not is_generations_success:
+        error_message = body.get('error', {}).get('message', '')
+        logging.exception(f'Error in suno_webhook', error_message)
+        await bot.send_sticker(
+            chat_id=user.telegram_chat_id,
+            sticker=config.MESSAGE_STICKERS.get(MessageSticker.ERROR),
+        )
+
+        await bot.send_message(
+            chat_id=user.telegram_chat_id,
+            text=get_localization(user_language_code).ERROR,
+            reply_markup=build_error_keyboard(user_language_code),
+        )
+        await send_error_info(
+            bot=bot,
+            user_id=user.id,
+            info=str(error_message),
+            hashtags=['suno'],
+        )
 
     if len(generations_result) > 0:
         for i, current_generation in enumerate([first_generation, second_generation]):
@@ -148,11 +158,11 @@ async def handle_suno_webhook(bot: Bot, dp: Dispatcher, body: dict):
 
     if request.status != RequestStatus.FINISHED:
         request.status = RequestStatus.FINISHED
-        await update_request(request.id, {
+        await finalization.update_request(request.id, {
             'status': request.status
         })
 
-        request_generations = await get_generations_by_request_id(request.id)
+        request_generations = [first_generation, second_generation]
         success_generations = []
         for request_generation in request_generations:
             if request_generation.result:
@@ -171,31 +181,25 @@ async def handle_suno_webhook(bot: Bot, dp: Dispatcher, body: dict):
             )
 
         quantity_to_delete = total_result
-        user = get_user_with_updated_quota(user, Quota.SUNO, quantity_to_delete)
 
         product = await get_product_by_quota(Quota.SUNO)
-        update_tasks = [
-            write_transaction(
-                user_id=user.id,
-                type=TransactionType.EXPENSE,
-                product_id=product.id,
-                amount=PRICE_SUNO,
-                clear_amount=PRICE_SUNO,
-                currency=Currency.USD,
-                quantity=quantity_to_delete,
-                details={
-                    'mode': request.details.get('mode'),
-                    'is_suggestion': request.details.get('is_suggestion', False),
-                    'has_error': first_generation.has_error or second_generation.has_error,
-                }
-            ),
-            update_user(user.id, {
-                'daily_limits': user.daily_limits,
-                'additional_usage_quota': user.additional_usage_quota
-            }),
-        ]
-
-        await asyncio.gather(*update_tasks)
+        await finalization.write_transaction(
+            user_id=user.id,
+            type=TransactionType.EXPENSE,
+            product_id=product.id,
+            amount=PRICE_SUNO,
+            clear_amount=PRICE_SUNO,
+            currency=Currency.USD,
+            quantity=quantity_to_delete,
+            details={
+                'mode': request.details.get('mode'),
+                'is_suggestion': request.details.get('is_suggestion', False),
+                'has_error': first_generation.has_error or second_generation.has_error,
+            }
+        )
+        await finalization.update_user_usage_quota(user, Quota.SUNO, quantity_to_delete)
+
+        await finalization.commit()
 
         state = FSMContext(
             storage=dp.storage,
@@ -221,6 +225,8 @@ async def handle_suno_webhook(bot: Bot, dp: Dispatcher, body: dict):
             except Exception:
                 continue
 
+    await finalization.commit()
+
     return True
 
 
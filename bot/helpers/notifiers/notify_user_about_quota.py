@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 
 from aiogram import Bot
 from aiogram.fsm.storage.base import BaseStorage
@@ -13,9 +14,15 @@ from bot.helpers.senders.send_message_to_users import send_message_to_user
 from bot.helpers.senders.send_sticker import send_sticker
 from bot.keyboards.common.common import build_notify_about_quota_keyboard
 from bot.locales.main import get_user_language, get_localization
+from bot.utils.token_bucket import ChatTokenBucket
 
 
-async def notify_user_about_quota(bot: Bot, user: User, storage: BaseStorage):
+async def notify_user_about_quota(
+    bot: Bot,
+    user: User,
+    storage: BaseStorage,
+    bucket: Optional[ChatTokenBucket] = None,
+):
     try:
         should_notify = await check_user_last_activity(user.id, user.created_at, storage)
         if not should_notify:
@@ -34,12 +41,14 @@ async def notify_user_about_quota(bot: Bot, user: User, storage: BaseStorage):
             bot,
             user.id,
             config.MESSAGE_STICKERS.get(MessageSticker.HELLO),
+            bucket,
         )
         await send_message_to_user(
             bot,
             user,
             get_localization(user_language_code).notify_about_quota(subscription_limits),
             build_notify_about_quota_keyboard(user_language_code),
+            bucket,
         )
     except Exception as e:
         logging.exception(f'error in notify_user_about_quota: {e}')
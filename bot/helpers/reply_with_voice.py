@@ -1,13 +1,51 @@
 import asyncio
+import re
 from typing import Optional, Literal
 
 from aiogram.types import Message, InlineKeyboardMarkup, BufferedInputFile
 
+from bot.config import config
 from bot.database.models.common import Currency, Quota
 from bot.database.models.transaction import TransactionType
 from bot.database.operations.product.getters import get_product_by_quota
+from bot.database.operations.speech.cache import get_cached_speech, set_cached_speech
 from bot.database.operations.transaction.writers import write_transaction
 from bot.integrations.openAI import get_response_text_to_speech
+from bot.utils.concat_ogg_opus import concat_ogg_opus
+
+
+def split_text_to_speech(text: str) -> list[str]:
+    sentences = []
+    for sentence in re.split(r'(?<=[.!?…])\s+', text.strip()):
+        while len(sentence) > config.SPEECH_CHUNK_CHARACTERS:
+            cut_index = sentence.rfind(' ', 0, config.SPEECH_CHUNK_CHARACTERS)
+            if cut_index <= 0:
+                cut_index = config.SPEECH_CHUNK_CHARACTERS
+            sentences.append(sentence[:cut_index])
+            sentence = sentence[cut_index:].lstrip()
+        if sentence:
+            sentences.append(sentence)
+
+    chunks = []
+    for sentence in sentences:
+        max_characters = config.SPEECH_FIRST_CHUNK_CHARACTERS if len(chunks) == 1 else config.SPEECH_CHUNK_CHARACTERS
+        if chunks and len(chunks[-1]) + len(sentence) + 1 <= max_characters:
+            chunks[-1] += f' {sentence}'
+        else:
+            chunks.append(sentence)
+
+    return chunks
+
+
+async def get_speech(text: str, voice: str) -> tuple[bytes, bool]:
+    audio = await get_cached_speech(text, voice)
+    if audio:
+        return audio, True
+
+    audio = await get_response_text_to_speech(text, voice)
+    await set_cached_speech(text, voice, audio)
+
+    return audio, False
 
 
 async def reply_with_voice(
@@ -17,29 +55,64 @@ async def reply_with_voice(
     reply_markup: Optional[InlineKeyboardMarkup],
     voice: Literal["alloy", "echo", "fable", "onyx", "nova", "shimmer"],
 ):
-    audio_content = await get_response_text_to_speech(text, voice)
-
-    product = await get_product_by_quota(Quota.VOICE_MESSAGES)
-
-    total_price = 0.000015 * len(text)
-    await write_transaction(
-        user_id=user_id,
-        type=TransactionType.EXPENSE,
-        product_id=product.id,
-        amount=total_price,
-        clear_amount=total_price,
-        currency=Currency.USD,
-        quantity=1,
-        details={
-            'subtype': 'TTS',
-            'text': text,
-            'has_error': False,
-        },
-    )
-
-    file = await asyncio.to_thread(audio_content.read)
-    await message.reply_voice(
-        voice=BufferedInputFile(file, filename='answer.ogg'),
-        reply_markup=reply_markup,
-        allow_sending_without_reply=True,
-    )
+    chunks = split_text_to_speech(text)
+    if not chunks:
+        return
+
+    synthesized_characters = 0
+
+    async def get_chunk_speech(chunk: str) -> bytes:
+        nonlocal synthesized_characters
+
+        audio, is_cached = await get_speech(chunk, voice)
+        if not is_cached:
+            synthesized_characters += len(chunk)
+
+        return audio
+
+    first_speech_task = asyncio.create_task(get_chunk_speech(chunks[0]))
+    other_speech_task = asyncio.gather(*[get_chunk_speech(chunk) for chunk in chunks[1:]], return_exceptions=True)
+    has_error = False
+    try:
+        first_audio = await first_speech_task
+        await message.reply_voice(
+            voice=BufferedInputFile(first_audio, filename='answer.ogg'),
+            reply_markup=None if chunks[1:] else reply_markup,
+            allow_sending_without_reply=True,
+        )
+
+        other_audios = await other_speech_task
+        for other_audio in other_audios:
+            if isinstance(other_audio, Exception):
+                raise other_audio
+
+        if other_audios:
+            other_audio = await asyncio.to_thread(concat_ogg_opus, other_audios)
+            await message.reply_voice(
+                voice=BufferedInputFile(other_audio, filename='answer.ogg'),
+                reply_markup=reply_markup,
+                allow_sending_without_reply=True,
+            )
+    except Exception:
+        has_error = True
+        other_speech_task.cancel()
+        raise
+    finally:
+        product = await get_product_by_quota(Quota.VOICE_MESSAGES)
+
+        total_price = 0.000015 * synthesized_characters
+        await write_transaction(
+            user_id=user_id,
+            type=TransactionType.EXPENSE,
+            product_id=product.id,
+            amount=total_price,
+            clear_amount=total_price,
+            currency=Currency.USD,
+            quantity=1,
+            details={
+                'subtype': 'TTS',
+                'text': text,
+                'is_cached': synthesized_characters == 0,
+                'has_error': has_error,
+            },
+        )
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import time
+import traceback
+from typing import Awaitable, Callable, Optional
+
+from redis.exceptions import RedisError
+
+from bot.config import config
+from bot.database.cache import cache
+from bot.integrations.runway import get_video
+
+RUNWAY_TASKS_KEY = 'runway:tasks'
+RUNWAY_TASKS_CREATED_AT_KEY = 'runway:tasks:created_at'
+RUNWAY_TASKS_ATTEMPTS_KEY = 'runway:tasks:attempts'
+RUNWAY_FINISHED_STATUSES = ['SUCCEEDED', 'FAILED', 'CANCELLED']
+RUNWAY_POLLING_DELAYS = [
+    (60, 5),
+    (180, 10),
+    (float('inf'), 20),
+]
+
+
+class RunwayPoller:
+    def __init__(self, interval: float, batch_size: int, timeout: int, max_attempts: int):
+        self.handler: Optional[Callable[[dict], Awaitable[None]]] = None
+        self.interval = interval
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.task: Optional[asyncio.Task] = None
+
+    async def start(self, handler: Callable[[dict], Awaitable[None]]):
+        self.handler = handler
+        self.task = asyncio.create_task(self.run())
+
+    async def close(self):
+        if self.task:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+
+    async def add(self, task_id: str):
+        if not cache.redis:
+            asyncio.create_task(self.watch(task_id))
+            return
+
+        now = time.time()
+        async with cache.redis.pipeline(transaction=True) as pipeline:
+            pipeline.hset(RUNWAY_TASKS_CREATED_AT_KEY, task_id, now)
+            pipeline.zadd(RUNWAY_TASKS_KEY, {task_id: now + RUNWAY_POLLING_DELAYS[0][1]})
+            await pipeline.execute()
+
+    async def run(self):
+        while True:
+            try:
+                await self.poll()
+            except RedisError as e:
+                logging.warning(f'Error in RunwayPoller.run: {e}')
+            except Exception:
+                error_trace = traceback.format_exc()
+                logging.exception(f'Error in RunwayPoller.run: {error_trace}')
+
+            await asyncio.sleep(self.interval)
+
+    async def poll(self):
+        if not cache.redis:
+            return
+
+        task_ids = await cache.redis.zrangebyscore(RUNWAY_TASKS_KEY, '-inf', time.time(), start=0, num=self.batch_size)
+        if not task_ids:
+            return
+
+        task_ids = [task_id.decode() for task_id in task_ids]
+        created_ats = await cache.redis.hmget(RUNWAY_TASKS_CREATED_AT_KEY, task_ids)
+        await asyncio.gather(
+            *[
+                self.poll_task(task_id, float(created_at) if created_at else time.time())
+                for task_id, created_at in zip(task_ids, created_ats)
+            ]
+        )
+
+    async def watch(self, task_id: str):
+        created_at = time.time()
+        while True:
+            await asyncio.sleep(self.get_delay(time.time() - created_at))
+
+            video = await self.get_task_video(task_id, created_at)
+            if video['status'] in RUNWAY_FINISHED_STATUSES:
+                try:
+                    await self.handler(video)
+                except Exception:
+                    error_trace = traceback.format_exc()
+                    logging.exception(f'Error in RunwayPoller.watch: {error_trace}')
+                return
+
+    async def get_task_video(self, task_id: str, created_at: float) -> dict:
+        age = time.time() - created_at
+        try:
+            video = await get_video(task_id)
+        except Exception as e:
+            logging.warning(f'Error in RunwayPoller.get_task_video: {e}')
+            video = {
+                'id': task_id,
+                'status': 'UNKNOWN',
+                'result': None,
+                'failure': str(e),
+                'failure_code': None,
+            }
+
+        if video['status'] not in RUNWAY_FINISHED_STATUSES and age > self.timeout:
+            video['status'] = 'FAILED'
+            video['failure'] = video['failure'] or 'Timeout'
+
+        return video
+
+    async def poll_task(self, task_id: str, created_at: float):
+        age = time.time() - created_at
+        video = await self.get_task_video(task_id, created_at)
+        if video['status'] in RUNWAY_FINISHED_STATUSES:
+            is_removed = await cache.redis.zrem(RUNWAY_TASKS_KEY, task_id)
+            if not is_removed:
+                return
+
+            try:
+                await self.handler(video)
+            except Exception as e:
+                attempts = await cache.redis.hincrby(RUNWAY_TASKS_ATTEMPTS_KEY, task_id, 1)
+                logging.warning(f'Error in RunwayPoller.poll_task: {task_id}, attempt {attempts}: {e}')
+                if attempts < self.max_attempts:
+                    delay = self.get_delay(age) * 2 ** attempts
+                    await cache.redis.zadd(RUNWAY_TASKS_KEY, {task_id: time.time() + delay})
+                    return
+
+            await cache.redis.hdel(RUNWAY_TASKS_CREATED_AT_KEY, task_id)
+            await cache.redis.hdel(RUNWAY_TASKS_ATTEMPTS_KEY, task_id)
+        else:
+            await cache.redis.zadd(RUNWAY_TASKS_KEY, {task_id: time.time() + self.get_delay(age)}, xx=True)
+
+    @staticmethod
+    def get_delay(age: float) -> float:
+        for max_age, delay in RUNWAY_POLLING_DELAYS:
+            if age < max_age:
+                return delay
+
+        return RUNWAY_POLLING_DELAYS[-1][1]
+
+
+runway_poller = RunwayPoller(
+    config.RUNWAY_POLLER_INTERVAL_SECONDS,
+    config.RUNWAY_POLLER_BATCH_SIZE,
+    config.RUNWAY_TASK_TIMEOUT_SECONDS,
+    config.RUNWAY_TASK_MAX_ATTEMPTS,
+)
@@ -1,4 +1,7 @@
 import asyncio
+import logging
+import time
+from typing import Optional
 
 from aiogram.enums import ParseMode
 from aiogram.exceptions import TelegramBadRequest, TelegramNetworkError, TelegramRetryAfter
@@ -8,11 +11,18 @@ from redis.exceptions import ConnectionError
 from telegramify_markdown import markdownify, customize
 
 from bot.config import config
+from bot.database.models.chat import Chat
+from bot.database.models.role import Role
+from bot.database.models.user import User, UserSettings
 from bot.helpers.split_message import split_message
+from bot.locales.types import LanguageCode
 
 customize.markdown_symbol.head_level_3 = '🔖'
 customize.markdown_symbol.head_level_4 = '🔹'
 
+AI_MESSAGE_STREAM_MIN_LENGTH = 32
+AI_MESSAGE_STREAM_CURSOR = ' ▌'
+
 
 async def delayed_send_ai_message(message: Message, text: str, timeout: int, reply_markup=None):
     await asyncio.sleep(timeout)
@@ -81,3 +91,120 @@ async def send_ai_message(message: Message, text: str, reply_markup=None):
                 )
             else:
                 raise e
+
+
+def get_ai_message_header_text(user: User, chat: Chat, role: Role, user_language_code: LanguageCode) -> str:
+    chat_info = f'💬 {chat.title}\n' if (
+        user.settings[user.current_model][UserSettings.SHOW_THE_NAME_OF_THE_CHATS]
+    ) else ''
+    role_info = f'{role.translated_names.get(user_language_code, "en")}\n' if (
+        user.settings[user.current_model][UserSettings.SHOW_THE_NAME_OF_THE_ROLES]
+    ) else ''
+
+    return f'{chat_info}{role_info}\n' if chat_info or role_info else ''
+
+
+class AIMessageStream:
+    def __init__(self, message: Message, header_text=''):
+        self.message = message
+        self.header_text = header_text
+        self.sent_messages: list[Message] = []
+        self.sent_texts: list[str] = []
+        self.last_update_time = 0.0
+        self.is_finished = False
+
+    async def update(self, text: str):
+        current_time = time.monotonic()
+        if current_time - self.last_update_time < config.AI_MESSAGE_STREAM_INTERVAL_SECONDS:
+            return
+        if not self.sent_messages and len(text) < AI_MESSAGE_STREAM_MIN_LENGTH:
+            return
+
+        self.last_update_time = current_time
+        try:
+            messages = split_message(f'{self.header_text}{text}{AI_MESSAGE_STREAM_CURSOR}')
+            await self.render([formatted_message for formatted_message in messages if formatted_message], None)
+        except TelegramRetryAfter as e:
+            self.last_update_time = current_time + e.retry_after
+        except TelegramBadRequest as e:
+            logging.warning(e)
+        except (ConnectionResetError, OSError, ClientOSError, ConnectionError, TelegramNetworkError) as e:
+            logging.warning(e)
+
+    async def finish(self, text: str, reply_markup=None):
+        if not self.sent_messages:
+            await send_ai_message(self.message, text, reply_markup)
+            self.is_finished = True
+            return
+
+        formatted_text = markdownify(
+            content=text,
+            normalize_whitespace=True,
+        )
+        messages = [formatted_message for formatted_message in split_message(formatted_text) if formatted_message]
+        for i in range(config.MAX_RETRIES):
+            try:
+                await self.render(messages, ParseMode.MARKDOWN_V2, reply_markup)
+                break
+            except TelegramRetryAfter as e:
+                await asyncio.sleep(e.retry_after)
+            except (ConnectionResetError, OSError, ClientOSError, ConnectionError, TelegramNetworkError) as e:
+                if i == config.MAX_RETRIES - 1:
+                    raise e
+                continue
+
+        for sent_message in self.sent_messages[len(messages):]:
+            await sent_message.delete()
+        self.sent_messages = self.sent_messages[:len(messages)]
+        self.sent_texts = self.sent_texts[:len(messages)]
+        self.is_finished = True
+
+    async def abort(self):
+        if self.is_finished:
+            return
+
+        for sent_message in self.sent_messages:
+            try:
+                await sent_message.delete()
+            except TelegramBadRequest as e:
+                logging.warning(e)
+        self.sent_messages = []
+        self.sent_texts = []
+        self.is_finished = True
+
+    async def render(self, messages: list[str], parse_mode: Optional[ParseMode], reply_markup=None):
+        for i in range(len(messages)):
+            formatted_message = messages[i]
+            formatted_reply_markup = reply_markup if i == len(messages) - 1 else None
+            try:
+                await self.render_message(i, formatted_message, parse_mode, formatted_reply_markup)
+            except TelegramBadRequest as e:
+                if e.message.startswith('Bad Request: message is not modified'):
+                    continue
+                elif parse_mode and e.message.startswith('Bad Request: can\'t parse entities'):
+                    await self.render_message(i, formatted_message, None, formatted_reply_markup)
+                elif e.message.startswith('Bad Request: message is too long'):
+                    await self.render_message(i, formatted_message[:4096], None, formatted_reply_markup)
+                else:
+                    raise e
+
+    async def render_message(self, i: int, text: str, parse_mode: Optional[ParseMode], reply_markup=None):
+        if i < len(self.sent_messages):
+            if self.sent_texts[i] == text and not reply_markup:
+                return
+
+            await self.sent_messages[i].edit_text(
+                text=text,
+                reply_markup=reply_markup,
+                parse_mode=parse_mode,
+            )
+            self.sent_texts[i] = text
+        else:
+            sent_message = await self.message.reply(
+                text=text,
+                reply_markup=reply_markup,
+                allow_sending_without_reply=True,
+                parse_mode=parse_mode,
+            )
+            self.sent_messages.append(sent_message)
+            self.sent_texts.append(text)
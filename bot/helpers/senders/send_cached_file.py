@@ -0,0 +1,77 @@
+import logging
+from typing import Awaitable, Callable, Optional
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import InputMediaPhoto, Message, URLInputFile
+
+from bot.database.operations.telegram_file.cache import (
+    TelegramFileType,
+    delete_cached_telegram_files,
+    get_cached_telegram_file,
+    set_cached_telegram_file,
+)
+
+
+async def send_cached_file(
+    send: Callable[..., Awaitable[Message]],
+    source: str,
+    file_type: TelegramFileType,
+    filename: Optional[str] = None,
+    **kwargs,
+) -> Message:
+    file_id = await get_cached_telegram_file(source, file_type)
+    if file_id:
+        try:
+            return await send(**{file_type: file_id}, **kwargs)
+        except TelegramBadRequest as e:
+            logging.warning(f'Error in send_cached_file: {e}')
+            await delete_cached_telegram_files(source)
+
+    sent_message = await send(**{file_type: URLInputFile(source, filename=filename, timeout=300)}, **kwargs)
+    await set_cached_telegram_file(source, file_type, sent_message)
+
+    return sent_message
+
+
+async def send_cached_media_group(
+    send: Callable[..., Awaitable[list[Message]]],
+    sources: list[str],
+    filenames: list[str],
+    media: list[InputMediaPhoto],
+    **kwargs,
+) -> list[Message]:
+    file_ids = [await get_cached_telegram_file(source, TelegramFileType.PHOTO) for source in sources]
+    if any(file_ids):
+        try:
+            sent_messages = await send(
+                media=[
+                    media_item.model_copy(update={
+                        'media': file_id or URLInputFile(source, filename=filename, timeout=300),
+                    })
+                    for media_item, source, filename, file_id in zip(media, sources, filenames, file_ids)
+                ],
+                **kwargs,
+            )
+        except TelegramBadRequest as e:
+            logging.warning(f'Error in send_cached_media_group: {e}')
+            for source, file_id in zip(sources, file_ids):
+                if file_id:
+                    await delete_cached_telegram_files(source)
+        else:
+            for source, file_id, sent_message in zip(sources, file_ids, sent_messages):
+                if not file_id:
+                    await set_cached_telegram_file(source, TelegramFileType.PHOTO, sent_message)
+
+            return sent_messages
+
+    sent_messages = await send(
+        media=[
+            media_item.model_copy(update={'media': URLInputFile(source, filename=filename, timeout=300)})
+            for media_item, source, filename in zip(media, sources, filenames)
+        ],
+        **kwargs,
+    )
+    for source, sent_message in zip(sources, sent_messages):
+        await set_cached_telegram_file(source, TelegramFileType.PHOTO, sent_message)
+
+    return sent_messages
@@ -1,19 +1,53 @@
 import asyncio
 import logging
 import traceback
+import uuid
+from enum import StrEnum
+from typing import Optional
 
 from aiogram import Bot
 from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter, TelegramForbiddenError, TelegramNetworkError
+from aiogram.types import InlineKeyboardMarkup
 from aiohttp import ClientOSError
-from redis.exceptions import ConnectionError
+from google.cloud.firestore_v1 import FieldFilter, FieldPath
+from redis.exceptions import ConnectionError, RedisError
 
+from bot.config import config
+from bot.database.cache import cache
+from bot.database.main import firebase
 from bot.database.models.user import User
-from bot.database.operations.user.getters import get_users_by_language_code
-from bot.database.operations.user.updaters import update_user
+from bot.database.operations.user.updaters import update_user, update_users
+from bot.helpers.senders.send_message_to_admins_and_developers import send_message_to_admins_and_developers
 from bot.locales.types import LanguageCode
+from bot.utils.token_bucket import ChatTokenBucket
 
-BATCH_SIZE = 30
 DELAY_SECONDS = 1
+BROADCASTS_KEY = 'broadcasts'
+BROADCAST_LOCK_SECONDS = 60
+BROADCAST_LOCK_REFRESH_SECONDS = 10
+BROADCAST_LOCK_REFRESH_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('expire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+BROADCAST_MESSAGES_PER_SECOND = 30
+BROADCAST_MESSAGES_PER_CHAT_PER_SECOND = 1
+
+
+class BroadcastStatus(StrEnum):
+    SENT = 'sent'
+    BLOCKED = 'blocked'
+    FAILED = 'failed'
+
+
+broadcast_bucket = ChatTokenBucket(
+    rate=BROADCAST_MESSAGES_PER_SECOND,
+    capacity=BROADCAST_MESSAGES_PER_SECOND,
+    chat_rate=BROADCAST_MESSAGES_PER_CHAT_PER_SECOND,
+    chat_capacity=BROADCAST_MESSAGES_PER_CHAT_PER_SECOND,
+)
+broadcast_tasks = set()
 
 
 async def delayed_send_message_to_user(bot: Bot, chat_id: str, text: str, timeout: int, reply_markup=None):
@@ -43,9 +77,17 @@ async def delayed_send_message_to_user(bot: Bot, chat_id: str, text: str, timeou
         logging.exception(f'Error in delayed_send_message: {error_trace}')
 
 
-async def send_message_to_user(bot: Bot, user: User, message: str, reply_markup=None):
+async def send_message_to_user(
+    bot: Bot,
+    user: User,
+    message: str,
+    reply_markup=None,
+    bucket: Optional[ChatTokenBucket] = None,
+):
     try:
         if not user.is_blocked:
+            if bucket:
+                await bucket.acquire(user.telegram_chat_id)
             await bot.send_message(
                 chat_id=user.telegram_chat_id,
                 text=message,
@@ -55,6 +97,8 @@ async def send_message_to_user(bot: Bot, user: User, message: str, reply_markup=
     except TelegramForbiddenError:
         asyncio.create_task(update_user(user.id, {'is_blocked': True}))
     except TelegramRetryAfter as e:
+        if bucket:
+            bucket.pause(e.retry_after)
         asyncio.create_task(
             delayed_send_message_to_user(bot, user.telegram_chat_id, message, e.retry_after + 30, reply_markup)
         )
@@ -69,21 +113,184 @@ async def send_message_to_user(bot: Bot, user: User, message: str, reply_markup=
         logging.exception(f'Error in send_message: {error_trace}')
 
 
-async def send_message_to_users(bot: Bot, user_type: str, language_code: LanguageCode, message: str, reply_markup=None):
-    users = await get_users_by_language_code(language_code)
-    for i in range(0, len(users), BATCH_SIZE):
-        batch_users = users[i:i + BATCH_SIZE]
+def get_broadcast_key(broadcast_id: str) -> str:
+    return f'broadcast:{broadcast_id}'
+
+
+async def send_broadcast_message(
+    bot: Bot,
+    chat_id: str,
+    text: str,
+    reply_markup=None,
+    is_lock_lost: Optional[asyncio.Event] = None,
+) -> BroadcastStatus:
+    for _ in range(config.MAX_RETRIES + 1):
+        await broadcast_bucket.acquire(chat_id)
+        if is_lock_lost and is_lock_lost.is_set():
+            return BroadcastStatus.FAILED
+
+        try:
+            await bot.send_message(
+                chat_id=chat_id,
+                text=text,
+                reply_markup=reply_markup,
+                disable_notification=True,
+            )
+            return BroadcastStatus.SENT
+        except TelegramForbiddenError:
+            return BroadcastStatus.BLOCKED
+        except TelegramRetryAfter as e:
+            broadcast_bucket.pause(e.retry_after)
+        except (ConnectionResetError, OSError, ClientOSError, ConnectionError, TelegramNetworkError):
+            await asyncio.sleep(DELAY_SECONDS)
+        except TelegramBadRequest as error:
+            logging.error(error)
+            return BroadcastStatus.FAILED
+        except Exception:
+            error_trace = traceback.format_exc()
+            logging.exception(f'Error in send_broadcast_message: {error_trace}')
+            return BroadcastStatus.FAILED
+
+    return BroadcastStatus.FAILED
+
+
+async def keep_broadcast_lock(lock_key: str, lock_token: str, is_lock_lost: asyncio.Event):
+    while not is_lock_lost.is_set():
+        await asyncio.sleep(BROADCAST_LOCK_REFRESH_SECONDS)
+
+        try:
+            is_refreshed = await cache.redis.eval(
+                BROADCAST_LOCK_REFRESH_SCRIPT,
+                1,
+                lock_key,
+                lock_token,
+                BROADCAST_LOCK_SECONDS,
+            )
+        except RedisError as e:
+            logging.warning(f'Error in keep_broadcast_lock: {e}')
+            continue
+
+        if not is_refreshed:
+            is_lock_lost.set()
+
+
+async def run_broadcast(bot: Bot, broadcast_id: str) -> dict:
+    lock_key = f'{get_broadcast_key(broadcast_id)}:lock'
+    lock_token = str(uuid.uuid4())
+    is_locked = await cache.redis.set(lock_key, lock_token, nx=True, ex=BROADCAST_LOCK_SECONDS)
+    if not is_locked:
+        return {}
+
+    is_lock_lost = asyncio.Event()
+    lock_task = asyncio.create_task(keep_broadcast_lock(lock_key, lock_token, is_lock_lost))
+    try:
+        return await process_broadcast(bot, broadcast_id, is_lock_lost)
+    finally:
+        lock_task.cancel()
+
+
+async def process_broadcast(bot: Bot, broadcast_id: str, is_lock_lost: asyncio.Event) -> dict:
+    broadcast_key = get_broadcast_key(broadcast_id)
+    broadcast = {key.decode(): value.decode() for key, value in (await cache.redis.hgetall(broadcast_key)).items()}
+    if not broadcast:
+        await cache.redis.srem(BROADCASTS_KEY, broadcast_id)
+        return {}
+
+    user_type = broadcast['user_type']
+    reply_markup = InlineKeyboardMarkup.model_validate_json(broadcast['reply_markup']) \
+        if broadcast.get('reply_markup') \
+        else None
+    last_user_id = broadcast.get('cursor')
+
+    users_collection = firebase.db.collection(User.COLLECTION_NAME)
+    while True:
+        users_query = users_collection \
+            .where(filter=FieldFilter('interface_language_code', '==', broadcast['language_code'])) \
+            .order_by(FieldPath.document_id())
+        if last_user_id:
+            users_query = users_query.where(
+                filter=FieldFilter(FieldPath.document_id(), '>', users_collection.document(last_user_id)),
+            )
+        users_query = users_query.limit(config.BATCH_SIZE)
 
-        tasks = []
-        for user in batch_users:
-            if (
+        users = [User(**doc.to_dict()) async for doc in users_query.stream()]
+        if not users:
+            break
+
+        recipients = [
+            user for user in users
+            if not user.is_blocked and (
                 user_type == 'all' or
                 (user_type == 'free' and not user.subscription_id) or
                 (user_type == 'paid' and user.subscription_id)
-            ):
-                tasks.append(send_message_to_user(bot, user, message, reply_markup))
+            )
+        ]
+        statuses = await asyncio.gather(*[
+            send_broadcast_message(bot, user.telegram_chat_id, broadcast['message'], reply_markup, is_lock_lost)
+            for user in recipients
+        ])
+        if is_lock_lost.is_set():
+            logging.warning(f'Broadcast {broadcast_id} is stopped: lock is lost')
+            return {}
 
-        await asyncio.gather(*tasks, return_exceptions=True)
+        blocked_user_ids = [
+            user.id for user, status in zip(recipients, statuses) if status == BroadcastStatus.BLOCKED
+        ]
+        if blocked_user_ids:
+            await update_users(blocked_user_ids, {'is_blocked': True})
 
-        if i + BATCH_SIZE < len(users):
-            await asyncio.sleep(DELAY_SECONDS)
+        last_user_id = users[-1].id
+        async with cache.redis.pipeline(transaction=False) as pipeline:
+            pipeline.hset(broadcast_key, 'cursor', last_user_id)
+            for status in BroadcastStatus:
+                pipeline.hincrby(broadcast_key, status, statuses.count(status))
+            await pipeline.execute()
+
+        if len(users) < config.BATCH_SIZE:
+            break
+
+    broadcast = {key.decode(): value.decode() for key, value in (await cache.redis.hgetall(broadcast_key)).items()}
+    async with cache.redis.pipeline(transaction=False) as pipeline:
+        pipeline.delete(broadcast_key, f'{broadcast_key}:lock')
+        pipeline.srem(BROADCASTS_KEY, broadcast_id)
+        await pipeline.execute()
+
+    return {status: int(broadcast.get(status, 0)) for status in BroadcastStatus}
+
+
+async def resume_broadcast(bot: Bot, broadcast_id: str):
+    while await cache.redis.exists(get_broadcast_key(broadcast_id)):
+        statuses = await run_broadcast(bot, broadcast_id)
+        if statuses:
+            await send_message_to_admins_and_developers(
+                bot,
+                f'<b>Broadcast {broadcast_id} is resumed and finished</b> 📢\n\n'
+                f'✅ Sent: {statuses[BroadcastStatus.SENT]}\n'
+                f'🚫 Blocked: {statuses[BroadcastStatus.BLOCKED]}\n'
+                f'❌ Failed: {statuses[BroadcastStatus.FAILED]}',
+            )
+            break
+
+        await asyncio.sleep(BROADCAST_LOCK_SECONDS)
+
+
+async def resume_broadcasts(bot: Bot):
+    broadcast_ids = await cache.redis.smembers(BROADCASTS_KEY)
+    for broadcast_id in broadcast_ids:
+        task = asyncio.create_task(resume_broadcast(bot, broadcast_id.decode()))
+        broadcast_tasks.add(task)
+        task.add_done_callback(broadcast_tasks.discard)
+
+
+async def send_message_to_users(bot: Bot, user_type: str, language_code: LanguageCode, message: str, reply_markup=None):
+    broadcast_id = str(uuid.uuid4())
+    await cache.redis.hset(get_broadcast_key(broadcast_id), mapping={
+        'user_type': user_type,
+        'language_code': language_code,
+        'message': message,
+        'reply_markup': reply_markup.model_dump_json() if reply_markup else '',
+        'cursor': '',
+    })
+    await cache.redis.sadd(BROADCASTS_KEY, broadcast_id)
+
+    return await run_broadcast(bot, broadcast_id)
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import traceback
+from typing import Optional
 
 from aiogram import Bot
 from aiogram.exceptions import TelegramForbiddenError, TelegramRetryAfter, TelegramNetworkError, TelegramBadRequest
@@ -8,6 +9,7 @@ from aiohttp import ClientOSError
 from redis.exceptions import ConnectionError
 
 from bot.database.operations.user.updaters import update_user
+from bot.utils.token_bucket import ChatTokenBucket
 
 
 async def delayed_send_sticker(bot: Bot, chat_id: str, sticker_id: str, timeout: int):
@@ -38,8 +40,11 @@ async def send_sticker(
     bot: Bot,
     chat_id: str,
     sticker_id: str,
+    bucket: Optional[ChatTokenBucket] = None,
 ):
     try:
+        if bucket:
+            await bucket.acquire(chat_id)
         await bot.send_sticker(
             chat_id=chat_id,
             sticker=sticker_id,
@@ -50,6 +55,8 @@ async def send_sticker(
             'is_blocked': True,
         })
     except TelegramRetryAfter as e:
+        if bucket:
+            bucket.pause(e.retry_after)
         asyncio.create_task(delayed_send_sticker(bot, chat_id, sticker_id, e.retry_after + 30))
     except (ConnectionResetError, OSError, ClientOSError, ConnectionError, TelegramNetworkError):
         asyncio.create_task(
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import time
+import traceback
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+from bot.config import config
+from bot.utils.get_latency_percentiles import get_latency_percentiles
+
+UPDATE_SCHEDULER_LATENCY_SAMPLES = 1000
+UPDATE_SCHEDULER_SERIALIZED_TYPES = ['message', 'edited_message', 'my_chat_member']
+
+
+class UpdateScheduler:
+    def __init__(self, workers: int, max_queue_size: int):
+        self.handler: Optional[Callable[[dict], Awaitable[None]]] = None
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.queue: Optional[asyncio.Queue] = None
+        self.user_updates: dict[str, deque] = {}
+        self.worker_tasks: list[asyncio.Task] = []
+        self.count_queued_updates = 0
+        self.count_active_updates = 0
+        self.count_handled_updates = 0
+        self.count_dropped_updates = 0
+        self.wait_latencies = deque(maxlen=UPDATE_SCHEDULER_LATENCY_SAMPLES)
+        self.handle_latencies = deque(maxlen=UPDATE_SCHEDULER_LATENCY_SAMPLES)
+
+    async def start(self, handler: Callable[[dict], Awaitable[None]]):
+        self.handler = handler
+        self.queue = asyncio.Queue()
+        self.worker_tasks = [asyncio.create_task(self.work()) for _ in range(self.workers)]
+
+    async def close(self):
+        for worker_task in self.worker_tasks:
+            worker_task.cancel()
+        await asyncio.gather(*self.worker_tasks, return_exceptions=True)
+        self.worker_tasks = []
+
+    def schedule(self, update: dict) -> bool:
+        if self.count_queued_updates >= self.max_queue_size:
+            self.count_dropped_updates += 1
+            logging.warning(f'Update {update.get("update_id")} is dropped: queue is full')
+            return False
+
+        key = self.get_update_key(update)
+        if key in self.user_updates:
+            self.user_updates[key].append((update, time.monotonic()))
+        else:
+            self.user_updates[key] = deque([(update, time.monotonic())])
+            self.queue.put_nowait(key)
+        self.count_queued_updates += 1
+
+        return True
+
+    async def work(self):
+        while True:
+            key = await self.queue.get()
+            user_updates = self.user_updates[key]
+
+            while user_updates:
+                update, queued_at = user_updates[0]
+                started_at = time.monotonic()
+                self.wait_latencies.append(started_at - queued_at)
+                self.count_active_updates += 1
+
+                try:
+                    await self.handler(update)
+                except Exception:
+                    error_trace = traceback.format_exc()
+                    logging.exception(f'Error in UpdateScheduler: {error_trace}')
+                finally:
+                    self.handle_latencies.append(time.monotonic() - started_at)
+                    self.count_active_updates -= 1
+                    self.count_handled_updates += 1
+                    self.count_queued_updates -= 1
+                    user_updates.popleft()
+
+            del self.user_updates[key]
+            self.queue.task_done()
+
+    def get_metrics(self) -> dict:
+        return {
+            'workers': self.workers,
+            'queue_size': self.count_queued_updates - self.count_active_updates,
+            'max_queue_size': self.max_queue_size,
+            'active': self.count_active_updates,
+            'users': len(self.user_updates),
+            'handled': self.count_handled_updates,
+            'dropped': self.count_dropped_updates,
+            'wait_latency': get_latency_percentiles(self.wait_latencies),
+            'handle_latency': get_latency_percentiles(self.handle_latencies),
+        }
+
+    @staticmethod
+    def get_update_key(update: dict) -> str:
+        for update_type in UPDATE_SCHEDULER_SERIALIZED_TYPES:
+            from_user = (update.get(update_type) or {}).get('from')
+            if from_user:
+                return str(from_user['id'])
+
+        return f'update:{update.get("update_id")}'
+
+
+update_scheduler = UpdateScheduler(config.UPDATE_WORKERS, config.UPDATE_QUEUE_MAX_SIZE)
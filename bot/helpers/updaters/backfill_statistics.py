@@ -0,0 +1,93 @@
+import logging
+import traceback
+import uuid
+from datetime import datetime
+
+from aiogram import Bot
+from google.cloud.firestore_v1 import FieldFilter
+
+from bot.config import config
+from bot.database.cache import cache
+from bot.database.main import firebase
+from bot.database.models.transaction import Transaction
+from bot.database.operations.product.getters import get_product
+from bot.database.operations.statistics.deleters import delete_namespace_statistics
+from bot.database.operations.statistics.helpers import (
+    STATISTICS_NAMESPACE,
+    add_transaction_to_statistics,
+    get_statistics_days,
+)
+from bot.database.operations.statistics.updaters import get_subscription_key, replace_statistics
+from bot.helpers.senders.send_message_to_admins_and_developers import send_message_to_admins_and_developers
+
+
+async def backfill_statistics(bot: Bot, start_date: datetime, end_date: datetime):
+    days = get_statistics_days(start_date, end_date)
+    if not days:
+        return
+
+    # rollups are built under a temporary namespace and swapped in only on success
+    backfill_namespace = f'{STATISTICS_NAMESPACE}:backfill:{uuid.uuid4()}'
+
+    transactions_query = firebase.db.collection(Transaction.COLLECTION_NAME) \
+        .where(filter=FieldFilter('created_at', '>=', start_date)) \
+        .where(filter=FieldFilter('created_at', '<=', end_date)) \
+        .order_by('created_at') \
+        .limit(config.BATCH_SIZE)
+
+    products = {}
+    subscription_keys = {}
+    count_transactions = 0
+
+    is_running = True
+    last_doc = None
+
+    try:
+        while is_running:
+            if last_doc:
+                transactions_query = transactions_query.start_after(last_doc)
+
+            docs = transactions_query.stream()
+
+            count = 0
+            async with cache.redis.pipeline(transaction=False) as pipeline:
+                async for doc in docs:
+                    count += 1
+
+                    transaction = Transaction(**doc.to_dict())
+
+                    if transaction.product_id not in products:
+                        products[transaction.product_id] = await get_product(transaction.product_id)
+                    if transaction.user_id not in subscription_keys:
+                        subscription_keys[transaction.user_id] = await get_subscription_key(transaction.user_id)
+
+                    add_transaction_to_statistics(
+                        pipeline,
+                        transaction,
+                        products[transaction.product_id],
+                        subscription_keys[transaction.user_id],
+                        backfill_namespace,
+                    )
+
+                    last_doc = doc
+                await pipeline.execute()
+
+            count_transactions += count
+
+            if count < config.BATCH_SIZE:
+                is_running = False
+                break
+
+        await replace_statistics(days, backfill_namespace)
+
+        await send_message_to_admins_and_developers(
+            bot,
+            f'<b>Statistics backfill is done ✅</b>\n\n'
+            f'📅 Days: {days[0]} — {days[-1]}\n'
+            f'🧾 Transactions: {count_transactions}',
+        )
+    except Exception:
+        error_trace = traceback.format_exc()
+        logging.exception(f'Error in backfill_statistics: {error_trace}')
+
+        await delete_namespace_statistics(backfill_namespace)
@@ -0,0 +1,90 @@
+from typing import Awaitable, Callable
+
+from bot.database.main import firebase
+from bot.database.models.common import Quota
+from bot.database.models.user import User
+from bot.database.operations.face_swap_package.updaters import update_used_face_swap_package_in_transaction
+from bot.database.operations.generation.updaters import update_generation_in_transaction
+from bot.database.operations.request.updaters import update_request_in_transaction
+from bot.database.operations.statistics.updaters import update_statistics
+from bot.database.operations.transaction.writers import write_transaction_in_transaction
+from bot.database.operations.user.getters import get_user_in_transaction
+from bot.database.operations.user.updaters import update_user_in_transaction
+from bot.database.transactional import add_post_commit_callback, async_transactional
+from bot.helpers.updaters.update_user_usage_quota import get_user_with_updated_quota
+
+
+@async_transactional
+async def commit_generation_finalization(
+    transaction,
+    operations: list[Callable[..., Awaitable]],
+    user_usage_quotas: list[tuple[str, Quota, int]],
+):
+    # firestore transactions require all reads before writes
+    users: dict[str, User] = {}
+    for user_id, _, _ in user_usage_quotas:
+        if user_id not in users:
+            users[user_id] = await get_user_in_transaction(transaction, user_id)
+
+    for user_id, user_quota, quantity_to_delete in user_usage_quotas:
+        users[user_id] = get_user_with_updated_quota(users[user_id], user_quota, quantity_to_delete)
+
+    for user in users.values():
+        await update_user_in_transaction(transaction, user.id, {
+            'daily_limits': user.daily_limits,
+            'additional_usage_quota': user.additional_usage_quota,
+        })
+
+    for operation in operations:
+        await operation(transaction)
+
+
+async def write_transaction_with_statistics(transaction, **kwargs):
+    transaction_object = await write_transaction_in_transaction(transaction, **kwargs)
+    add_post_commit_callback(transaction, lambda: update_statistics(transaction_object))
+
+
+class GenerationFinalization:
+    def __init__(self):
+        self.operations: list[Callable[..., Awaitable]] = []
+        self.user_usage_quotas: list[tuple[str, Quota, int]] = []
+
+    async def update_generation(self, generation_id: str, data: dict):
+        self.operations.append(
+            lambda transaction: update_generation_in_transaction(transaction, generation_id, data)
+        )
+
+    async def update_request(self, request_id: str, data: dict):
+        self.operations.append(
+            lambda transaction: update_request_in_transaction(transaction, request_id, data)
+        )
+
+    async def update_used_face_swap_package(self, used_face_swap_package_id: str, data: dict):
+        self.operations.append(
+            lambda transaction: update_used_face_swap_package_in_transaction(
+                transaction,
+                used_face_swap_package_id,
+                data,
+            )
+        )
+
+    async def write_transaction(self, **kwargs):
+        self.operations.append(
+            lambda transaction: write_transaction_with_statistics(transaction, **kwargs)
+        )
+
+    async def update_user_usage_quota(self, user: User, user_quota: Quota, quantity_to_delete: int):
+        if quantity_to_delete < 0:
+            return
+
+        self.user_usage_quotas.append((user.id, user_quota, quantity_to_delete))
+
+    async def commit(self):
+        if not self.operations and not self.user_usage_quotas:
+            return
+
+        operations, user_usage_quotas = self.operations, self.user_usage_quotas
+        self.operations = []
+        self.user_usage_quotas = []
+
+        await commit_generation_finalization(firebase.db.transaction(), operations, user_usage_quotas)
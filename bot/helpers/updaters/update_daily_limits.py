@@ -1,14 +1,17 @@
 import asyncio
 import logging
+import time
 import traceback
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
+from typing import Optional
 
 from aiogram import Bot
 from aiogram.exceptions import TelegramForbiddenError
 from aiogram.fsm.storage.base import BaseStorage
-from google.cloud.firestore_v1 import AsyncWriteBatch, FieldFilter
+from google.cloud.firestore_v1 import AsyncWriteBatch, FieldFilter, FieldPath
 
 from bot.config import config, MessageSticker
+from bot.database.cache import cache
 from bot.database.main import firebase
 from bot.database.models.common import Quota, PaymentMethod, Currency
 from bot.database.models.subscription import (
@@ -22,60 +25,112 @@ from bot.database.operations.package.getters import get_packages_by_user_id
 from bot.database.operations.product.getters import get_product
 from bot.database.operations.subscription.getters import get_subscription, get_activated_subscriptions_by_user_id
 from bot.database.operations.subscription.updaters import update_subscription
+from bot.database.operations.user.cache import delete_cached_users
 from bot.database.operations.user.updaters import update_user
 from bot.helpers.billing.create_auto_payment import create_auto_payment
 from bot.helpers.billing.create_payment import OrderItem
 from bot.helpers.notifiers.notify_user_about_quota import notify_user_about_quota
 from bot.helpers.senders.send_message_to_admins_and_developers import send_message_to_admins_and_developers
-from bot.helpers.senders.send_message_to_users import send_message_to_user
+from bot.helpers.senders.send_message_to_users import broadcast_bucket, send_message_to_user
 from bot.helpers.senders.send_sticker import send_sticker
 from bot.keyboards.common.common import build_buy_motivation_keyboard
 from bot.locales.main import get_localization, get_user_language
 
 
-async def update_daily_limits(bot: Bot, storage: BaseStorage):
-    users_query = firebase.db.collection(User.COLLECTION_NAME) \
-        .where(filter=FieldFilter('is_blocked', '==', False)) \
-        .limit(config.BATCH_SIZE)
-    is_running = True
-    last_doc = None
-
-    while is_running:
-        if last_doc:
-            users_query = users_query.start_after(last_doc)
-
-        docs = users_query.stream()
-
-        tasks = []
-        batch = firebase.db.batch()
+def get_update_daily_limits_key(start_user_id: Optional[str], end_user_id: Optional[str]) -> str:
+    current_day = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    return f'update_daily_limits:{current_day}:{start_user_id or ""}-{end_user_id or ""}'
 
-        count = 0
-        async for doc in docs:
-            count += 1
 
-            user = User(**doc.to_dict())
+async def update_daily_limits(
+    bot: Bot,
+    storage: BaseStorage,
+    start_user_id: Optional[str] = None,
+    end_user_id: Optional[str] = None,
+):
+    users_collection = firebase.db.collection(User.COLLECTION_NAME)
+    progress_key = get_update_daily_limits_key(start_user_id, end_user_id)
+    progress = await cache.redis.hgetall(progress_key)
+    if progress.get(b'is_finished'):
+        logging.info(f'update_daily_limits {progress_key} is already finished')
+        return
+
+    last_user_id = progress.get(b'cursor', b'').decode() or None
+    count_processed_users = int(progress.get(b'processed', 0))
+    count_processed_users_before = count_processed_users
+    semaphore = asyncio.Semaphore(config.UPDATE_DAILY_LIMITS_CONCURRENCY)
+    started_at = time.monotonic()
+    is_running = True
 
+    async def update_user_daily_limits_with_semaphore(user: User, batch: AsyncWriteBatch):
+        async with semaphore:
             await update_user_daily_limits(bot, user, batch, storage)
 
-            if not user.subscription_id:
-                tasks.append(
-                    notify_user_about_quota(
-                        bot=bot,
-                        user=user,
-                        storage=storage,
-                    )
-                )
+    while is_running:
+        users_query = users_collection \
+            .where(filter=FieldFilter('is_blocked', '==', False)) \
+            .order_by(FieldPath.document_id())
+        if last_user_id:
+            users_query = users_query.where(
+                filter=FieldFilter(FieldPath.document_id(), '>', users_collection.document(last_user_id)),
+            )
+        elif start_user_id:
+            users_query = users_query.where(
+                filter=FieldFilter(FieldPath.document_id(), '>=', users_collection.document(start_user_id)),
+            )
+        if end_user_id:
+            users_query = users_query.where(
+                filter=FieldFilter(FieldPath.document_id(), '<', users_collection.document(end_user_id)),
+            )
+        users_query = users_query.limit(config.BATCH_SIZE)
 
+        users = [User(**doc.to_dict()) async for doc in users_query.stream()]
+        if not users:
+            break
+
+        batch = firebase.db.batch()
+        await asyncio.gather(*[update_user_daily_limits_with_semaphore(user, batch) for user in users])
         await batch.commit()
-        await asyncio.gather(*tasks, return_exceptions=True)
+        await delete_cached_users([user.id for user in users])
 
-        if count < config.BATCH_SIZE:
+        last_user_id = users[-1].id
+        count_processed_users += len(users)
+        await cache.redis.hset(progress_key, mapping={
+            'cursor': last_user_id,
+            'processed': count_processed_users,
+        })
+        await cache.redis.expire(progress_key, timedelta(days=1))
+
+        elapsed_seconds = time.monotonic() - started_at
+        throughput = (count_processed_users - count_processed_users_before) / elapsed_seconds
+        logging.info(
+            f'update_daily_limits {progress_key}: '
+            f'processed {count_processed_users} users, {throughput:.1f} users/s'
+        )
+
+        await asyncio.gather(*[
+            notify_user_about_quota(
+                bot=bot,
+                user=user,
+                storage=storage,
+                bucket=broadcast_bucket,
+            ) for user in users if not user.subscription_id
+        ], return_exceptions=True)
+
+        if len(users) < config.BATCH_SIZE:
             is_running = False
-            break
 
-        last_doc = doc
+    await cache.redis.hset(progress_key, 'is_finished', 1)
 
-    await send_message_to_admins_and_developers(bot, f'<b>Updated Daily Limits Successfully</b> 🎉')
+    elapsed_seconds = time.monotonic() - started_at
+    throughput = (count_processed_users - count_processed_users_before) / elapsed_seconds
+    await send_message_to_admins_and_developers(
+        bot,
+        f'<b>Updated Daily Limits Successfully</b> 🎉\n\n'
+        f'🔢 Range: {start_user_id or "∞"} — {end_user_id or "∞"}\n'
+        f'👥 Users: {count_processed_users}\n'
+        f'⏱ Time: {elapsed_seconds:.0f}s ({throughput:.1f} users/s)',
+    )
 
 
 async def update_user_daily_limits(bot: Bot, user: User, batch: AsyncWriteBatch, storage: BaseStorage):
@@ -152,12 +207,14 @@ async def update_user_subscription(bot: Bot, user: User, batch: AsyncWriteBatch,
                         bot,
                         user.telegram_chat_id,
                         config.MESSAGE_STICKERS.get(MessageSticker.SAD),
+                        broadcast_bucket,
                     )
                     await send_message_to_user(
                         bot,
                         user,
                         get_localization(user_language_code).SUBSCRIPTION_END,
                         build_buy_motivation_keyboard(user_language_code),
+                        broadcast_bucket,
                     )
             return user
 
@@ -214,12 +271,14 @@ async def update_user_subscription(bot: Bot, user: User, batch: AsyncWriteBatch,
                             bot,
                             user.telegram_chat_id,
                             config.MESSAGE_STICKERS.get(MessageSticker.SAD),
+                            broadcast_bucket,
                         )
                         await send_message_to_user(
                             bot,
                             user,
                             get_localization(user_language_code).SUBSCRIPTION_END,
                             build_buy_motivation_keyboard(user_language_code),
+                            broadcast_bucket,
                         )
                 return user
             elif current_subscription.payment_method == PaymentMethod.STRIPE or current_subscription.payment_method == PaymentMethod.TELEGRAM_STARS:
@@ -251,12 +310,14 @@ async def update_user_subscription(bot: Bot, user: User, batch: AsyncWriteBatch,
                             bot,
                             user.telegram_chat_id,
                             config.MESSAGE_STICKERS.get(MessageSticker.SAD),
+                            broadcast_bucket,
                         )
                         await send_message_to_user(
                             bot,
                             user,
                             get_localization(user_language_code).SUBSCRIPTION_END,
                             build_buy_motivation_keyboard(user_language_code),
+                            broadcast_bucket,
                         )
         else:
             current_subscription.status = SubscriptionStatus.FINISHED if current_subscription.status != SubscriptionStatus.CANCELED else current_subscription.status
@@ -285,12 +346,14 @@ async def update_user_subscription(bot: Bot, user: User, batch: AsyncWriteBatch,
                     bot,
                     user.telegram_chat_id,
                     config.MESSAGE_STICKERS.get(MessageSticker.SAD),
+                    broadcast_bucket,
                 )
                 await send_message_to_user(
                     bot,
                     user,
                     get_localization(user_language_code).SUBSCRIPTION_END,
                     build_buy_motivation_keyboard(user_language_code),
+                    broadcast_bucket,
                 )
 
         return user
@@ -359,12 +422,14 @@ async def update_user_additional_usage_quota(
                 bot,
                 user.telegram_chat_id,
                 config.MESSAGE_STICKERS.get(MessageSticker.SAD),
+                broadcast_bucket,
             )
             await send_message_to_user(
                 bot,
                 user,
                 get_localization(user_language_code).PACKAGES_END,
                 build_buy_motivation_keyboard(user_language_code),
+                broadcast_bucket,
             )
 
 
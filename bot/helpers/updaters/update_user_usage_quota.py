@@ -1,6 +1,9 @@
+from bot.database.main import firebase
 from bot.database.models.common import Quota
 from bot.database.models.user import User
-from bot.database.operations.user.updaters import update_user, update_user_in_transaction
+from bot.database.operations.user.getters import get_user_in_transaction
+from bot.database.operations.user.updaters import update_user_in_transaction
+from bot.database.transactional import async_transactional
 
 TEXT_SIMPLE_QUOTA = [
     Quota.CHAT_GPT4_OMNI_MINI,
@@ -77,25 +80,23 @@ def get_user_with_updated_quota(user: User, user_quota: Quota, quantity_to_delet
     return user
 
 
-async def update_user_usage_quota(user: User, user_quota: Quota, quantity_to_delete: int):
-    if quantity_to_delete < 0:
-        return
-
-    user = get_user_with_updated_quota(user, user_quota, quantity_to_delete)
-
-    await update_user(user.id, {
-        'daily_limits': user.daily_limits,
-        'additional_usage_quota': user.additional_usage_quota,
-    })
-
-
 async def update_user_usage_quota_in_transaction(transaction, user: User, user_quota: Quota, quantity_to_delete: int):
     if quantity_to_delete < 0:
         return
 
+    user = await get_user_in_transaction(transaction, user.id)
     user = get_user_with_updated_quota(user, user_quota, quantity_to_delete)
 
     await update_user_in_transaction(transaction, user.id, {
         'daily_limits': user.daily_limits,
         'additional_usage_quota': user.additional_usage_quota,
     })
+
+
+async def update_user_usage_quota(user: User, user_quota: Quota, quantity_to_delete: int):
+    await async_transactional(update_user_usage_quota_in_transaction)(
+        firebase.db.transaction(),
+        user,
+        user_quota,
+        quantity_to_delete,
+    )
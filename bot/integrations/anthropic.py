@@ -1,3 +1,5 @@
+from typing import Callable, Awaitable
+
 from anthropic import AsyncAnthropic
 
 from bot.config import config
@@ -30,3 +32,32 @@ async def get_response_message(model_version: ClaudeGPTVersion, system_prompt: s
         'input_tokens': response.usage.input_tokens,
         'output_tokens': response.usage.output_tokens
     }
+
+
+async def get_response_message_stream(
+    model_version: ClaudeGPTVersion,
+    system_prompt: str,
+    history: list,
+    on_text: Callable[[str], Awaitable[None]],
+) -> dict:
+    max_tokens = get_default_max_tokens(model_version)
+
+    text = ''
+    async with client.messages.stream(
+        model=model_version,
+        system=system_prompt,
+        messages=history,
+        max_tokens=max_tokens,
+    ) as stream:
+        async for text_delta in stream.text_stream:
+            text += text_delta
+            await on_text(text)
+
+        response = await stream.get_final_message()
+
+    return {
+        'finish_reason': response.stop_reason,
+        'message': text,
+        'input_tokens': response.usage.input_tokens,
+        'output_tokens': response.usage.output_tokens
+    }
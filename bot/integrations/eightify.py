@@ -3,6 +3,7 @@ import aiohttp
 from bot.config import config
 from bot.database.models.common import VideoSummaryFocus, VideoSummaryFormat, VideoSummaryAmount
 from bot.locales.types import LanguageCode
+from bot.integrations.http_client import http_client, HTTPProvider
 
 EIGHTIFY_API_URL = 'https://backend.eightify.app'
 EIGHTIFY_TOKEN = config.EIGHTIFY_API_TOKEN.get_secret_value()
@@ -16,6 +17,7 @@ class Eightify:
             'Authorization': f'Bearer {EIGHTIFY_TOKEN}'
         }
         self.session = session
+        self.is_session_owner = session is None
 
     async def __aenter__(self):
         if not self.session:
@@ -25,7 +27,8 @@ class Eightify:
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        await self.session.close()
+        if self.is_session_owner:
+            await self.session.close()
 
     async def request(self, method: str, url: str, **kwargs):
         async with self.session.request(method, url, headers=self.headers, **kwargs) as response:
@@ -76,7 +79,7 @@ async def generate_summary(
     format: VideoSummaryFormat,
     amount: VideoSummaryAmount,
 ) -> str:
-    async with Eightify() as client:
+    async with Eightify(http_client.get_session(HTTPProvider.EIGHTIFY)) as client:
         summary = await client.summary.generate(
             language_code=language_code,
             video_id=video_id,
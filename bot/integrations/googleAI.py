@@ -1,16 +1,30 @@
 import asyncio
-import io
+import hashlib
+from tempfile import SpooledTemporaryFile
+from typing import Callable, Awaitable, IO, Optional
 
 import httpx
 from filetype import filetype
+from google.api_core.exceptions import GoogleAPIError
 from google.generativeai import configure, GenerativeModel, GenerationConfig, upload_file, get_file
-from google.generativeai.types import HarmCategory, HarmBlockThreshold
+from google.generativeai.types import File, HarmCategory, HarmBlockThreshold
 
 from bot.config import config
 from bot.database.models.common import GeminiGPTVersion
 
 configure(api_key=config.GEMINI_API_KEY.get_secret_value())
 
+VIDEO_CHUNK_SIZE = 1024 * 1024
+VIDEO_POLLING_MIN_DELAY = 1
+VIDEO_POLLING_MAX_DELAY = 10
+
+SAFETY_SETTINGS = {
+    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+}
+
 
 def get_default_max_tokens(model_version: GeminiGPTVersion) -> int:
     base = 1024
@@ -45,12 +59,7 @@ async def get_response_message(
         generation_config=GenerationConfig(
             max_output_tokens=max_tokens,
         ),
-        safety_settings={
-            HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-            HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-            HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-            HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-        }
+        safety_settings=SAFETY_SETTINGS,
     )
 
     return {
@@ -61,28 +70,97 @@ async def get_response_message(
     }
 
 
-async def get_response_video_summary(
-    prompt: str,
-    video_file_link: str,
+async def get_response_message_stream(
+    model_version: GeminiGPTVersion,
+    system_prompt: str,
+    history: list,
+    on_text: Callable[[str], Awaitable[None]],
 ) -> dict:
-    async with httpx.AsyncClient() as client:
-        response = await client.head(video_file_link)
-        mime_type = response.headers.get('Content-Type')
-        if not mime_type.startswith('video/'):
-            raise ValueError(f'Unsupported MIME type: {mime_type}')
-
-        response = await client.get(video_file_link)
-        video_content = response.content
-    video_io = io.BytesIO(video_content)
+    max_tokens = get_default_max_tokens(model_version)
+
+    if model_version == GeminiGPTVersion.V1_Ultra:
+        model_name = GeminiGPTVersion.V1_Pro
+    else:
+        model_name = model_version
+    model = GenerativeModel(
+        model_name=model_name,
+        system_instruction=system_prompt,
+    )
+    response = await model.generate_content_async(
+        contents=history,
+        generation_config=GenerationConfig(
+            max_output_tokens=max_tokens,
+        ),
+        safety_settings=SAFETY_SETTINGS,
+        stream=True,
+    )
+
+    text = ''
+    async for chunk in response:
+        if chunk.parts:
+            text += chunk.text
+            await on_text(text)
+
+    return {
+        'finish_reason': response.candidates[-1].finish_reason,
+        'message': text,
+        'input_tokens': response.usage_metadata.prompt_token_count,
+        'output_tokens': response.usage_metadata.candidates_token_count,
+    }
+
+
+async def download_video_file(video_file_link: str) -> tuple[SpooledTemporaryFile, str, str]:
+    video_io = SpooledTemporaryFile(max_size=config.GEMINI_VIDEO_SPOOL_MAX_SIZE)
+    content_hash = hashlib.sha256()
+    try:
+        async with httpx.AsyncClient(timeout=httpx.Timeout(60, read=300)) as client:
+            async with client.stream('GET', video_file_link) as response:
+                response.raise_for_status()
+                mime_type = response.headers.get('Content-Type', '')
+                if not mime_type.startswith('video/'):
+                    raise ValueError(f'Unsupported MIME type: {mime_type}')
+
+                async for chunk in response.aiter_bytes(VIDEO_CHUNK_SIZE):
+                    content_hash.update(chunk)
+                    video_io.write(chunk)
+    except Exception:
+        video_io.close()
+        raise
+
+    video_io.seek(0)
+    return video_io, mime_type, content_hash.hexdigest()
+
+
+async def upload_video_file(video_io: IO[bytes], mime_type: str) -> File:
     video_file = await asyncio.to_thread(lambda: upload_file(path=video_io, mime_type=mime_type))
+    return await wait_for_video_file(video_file)
 
+
+async def wait_for_video_file(video_file: File) -> File:
+    delay = VIDEO_POLLING_MIN_DELAY
     while video_file.state.name == 'PROCESSING':
-        await asyncio.sleep(10)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, VIDEO_POLLING_MAX_DELAY)
         video_file = await asyncio.to_thread(lambda: get_file(video_file.name))
 
     if video_file.state.name == 'FAILED':
         raise ValueError(video_file.state.name)
 
+    return video_file
+
+
+async def get_active_video_file(file_name: str) -> Optional[File]:
+    try:
+        video_file = await asyncio.to_thread(lambda: get_file(file_name))
+        return await wait_for_video_file(video_file)
+    except (GoogleAPIError, ValueError):
+        return None
+
+
+async def get_response_video_summary(
+    prompt: str,
+    video_file: File,
+) -> dict:
     model_name = GeminiGPTVersion.V2_Flash
     model = GenerativeModel(
         model_name=model_name,
@@ -1,4 +1,7 @@
+from typing import Callable, Awaitable
+
 import openai
+from openai.types.chat import ChatCompletionMessage
 
 from bot.config import config
 from bot.database.models.common import GrokGPTVersion
@@ -24,3 +27,40 @@ async def get_response_message(
         'input_tokens': response.usage.prompt_tokens,
         'output_tokens': response.usage.completion_tokens,
     }
+
+
+async def get_response_message_stream(
+    model_version: GrokGPTVersion,
+    history: list,
+    on_text: Callable[[str], Awaitable[None]],
+) -> dict:
+    stream = await client.chat.completions.create(
+        model=model_version,
+        messages=history,
+        stream=True,
+        stream_options={'include_usage': True},
+    )
+
+    text = ''
+    finish_reason = None
+    input_tokens = 0
+    output_tokens = 0
+    async for chunk in stream:
+        if chunk.usage:
+            input_tokens = chunk.usage.prompt_tokens
+            output_tokens = chunk.usage.completion_tokens
+        if not chunk.choices:
+            continue
+
+        if chunk.choices[0].delta.content:
+            text += chunk.choices[0].delta.content
+            await on_text(text)
+        if chunk.choices[0].finish_reason:
+            finish_reason = chunk.choices[0].finish_reason
+
+    return {
+        'finish_reason': finish_reason,
+        'message': ChatCompletionMessage(role='assistant', content=text),
+        'input_tokens': input_tokens,
+        'output_tokens': output_tokens,
+    }
@@ -0,0 +1,125 @@
+import logging
+from enum import StrEnum
+from types import SimpleNamespace
+
+import aiohttp
+
+from bot.config import config
+
+
+class HTTPProvider(StrEnum):
+    MIDJOURNEY = 'midjourney'
+    TRANSLATE = 'translate'
+    SUNO = 'suno'
+    KLING = 'kling'
+    EIGHTIFY = 'eightify'
+    STORAGE = 'storage'
+
+
+HTTP_PROVIDER_SETTINGS = {
+    HTTPProvider.MIDJOURNEY: {
+        'limit': 20,
+        'timeout': aiohttp.ClientTimeout(total=60, connect=10),
+    },
+    HTTPProvider.TRANSLATE: {
+        'limit': 50,
+        'timeout': aiohttp.ClientTimeout(total=30, connect=5),
+    },
+    HTTPProvider.SUNO: {
+        'limit': 10,
+        'timeout': aiohttp.ClientTimeout(total=60, connect=10),
+    },
+    HTTPProvider.KLING: {
+        'limit': 10,
+        'timeout': aiohttp.ClientTimeout(total=60, connect=10),
+    },
+    HTTPProvider.EIGHTIFY: {
+        'limit': 10,
+        'timeout': aiohttp.ClientTimeout(total=300, connect=10),
+    },
+    HTTPProvider.STORAGE: {
+        'limit': 50,
+        'timeout': aiohttp.ClientTimeout(total=600, connect=10),
+    },
+}
+
+
+class HTTPClient:
+    def __init__(self):
+        self.sessions: dict[HTTPProvider, aiohttp.ClientSession] = {}
+        self.metrics: dict[HTTPProvider, dict[str, int]] = {
+            provider: {
+                'requests': 0,
+                'new_connections': 0,
+                'reused_connections': 0,
+            } for provider in HTTPProvider
+        }
+
+    async def init(self):
+        for provider in HTTPProvider:
+            self.get_session(provider)
+
+    async def close(self):
+        sessions = list(self.sessions.values())
+        self.sessions.clear()
+
+        for session in sessions:
+            try:
+                await session.close()
+            except Exception as e:
+                logging.warning(f'Error in HTTPClient.close: {e}')
+
+    def get_session(self, provider: HTTPProvider) -> aiohttp.ClientSession:
+        session = self.sessions.get(provider)
+        if session is None or session.closed:
+            session = self.create_session(provider)
+            self.sessions[provider] = session
+
+        return session
+
+    def create_session(self, provider: HTTPProvider) -> aiohttp.ClientSession:
+        settings = HTTP_PROVIDER_SETTINGS[provider]
+        connector = aiohttp.TCPConnector(
+            limit=settings['limit'],
+            ttl_dns_cache=config.HTTP_CLIENT_DNS_CACHE_TTL_SECONDS,
+            keepalive_timeout=config.HTTP_CLIENT_KEEPALIVE_TIMEOUT_SECONDS,
+        )
+
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=settings['timeout'],
+            trace_configs=[self.create_trace_config(provider)],
+        )
+
+    def create_trace_config(self, provider: HTTPProvider) -> aiohttp.TraceConfig:
+        metrics = self.metrics[provider]
+
+        async def on_request_start(_: aiohttp.ClientSession, __: SimpleNamespace, ___):
+            metrics['requests'] += 1
+
+        async def on_connection_create_end(_: aiohttp.ClientSession, __: SimpleNamespace, ___):
+            metrics['new_connections'] += 1
+
+        async def on_connection_reuseconn(_: aiohttp.ClientSession, __: SimpleNamespace, ___):
+            metrics['reused_connections'] += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+
+        return trace_config
+
+    def get_metrics(self) -> dict:
+        result = {}
+        for provider, metrics in self.metrics.items():
+            connections = metrics['new_connections'] + metrics['reused_connections']
+            result[provider] = {
+                **metrics,
+                'reuse_rate': round(metrics['reused_connections'] / connections, 4) if connections else 0.0,
+            }
+
+        return result
+
+
+http_client = HTTPClient()
@@ -1,8 +1,9 @@
-from aiogram.client.session import aiohttp
+import aiohttp
 from typing_extensions import Optional
 
 from bot.config import config
 from bot.database.models.common import KlingVersion, KlingMode, KlingDuration, AspectRatio
+from bot.integrations.http_client import http_client, HTTPProvider
 
 KLING_API_URL = 'https://api.piapi.ai'
 KLING_API_KEY = config.KLING_API_KEY.get_secret_value()
@@ -16,6 +17,7 @@ class Kling:
             'x-api-key': KLING_API_KEY
         }
         self.session = session
+        self.is_session_owner = session is None
 
     async def __aenter__(self):
         if not self.session:
@@ -25,7 +27,8 @@ class Kling:
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        await self.session.close()
+        if self.is_session_owner:
+            await self.session.close()
 
     async def request(self, method: str, url: str, **kwargs):
         async with self.session.request(method, url, headers=self.headers, **kwargs) as response:
@@ -91,7 +94,7 @@ async def generate_video(
     aspect_ratio: AspectRatio,
     image_url: Optional[str] = None,
 ) -> str:
-    async with Kling() as client:
+    async with Kling(http_client.get_session(HTTPProvider.KLING)) as client:
         video_id = await client.videos.generate(
             prompt=prompt,
             version=version,
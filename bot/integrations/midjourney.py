@@ -1,9 +1,8 @@
 import logging
 from typing import Optional
 
-from aiogram.client.session import aiohttp
-
 from bot.config import config
+from bot.integrations.http_client import http_client, HTTPProvider
 
 MIDJOURNEY_API_URL = 'https://api.userapi.ai'
 MIDJOURNEY_API_TOKEN = config.MIDJOURNEY_API_TOKEN.get_secret_value()
@@ -23,15 +22,15 @@ async def create_midjourney_images(prompt: str):
         'is_disable_prefilter': False,
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, json=data, headers=headers) as response:
-            if response.status == 200:
-                data = await response.json()
-                return data.get('hash', '')
-            else:
-                error_message = await response.text()
-                logging.exception(f'Error in create_midjourney_images: {error_message}')
-                return ''
+    session = http_client.get_session(HTTPProvider.MIDJOURNEY)
+    async with session.post(url, json=data, headers=headers) as response:
+        if response.status == 200:
+            data = await response.json()
+            return data.get('hash', '')
+        else:
+            error_message = await response.text()
+            logging.exception(f'Error in create_midjourney_images: {error_message}')
+            return ''
 
 
 async def create_midjourney_image(hash_id: str, choice: int) -> Optional[str]:
@@ -47,15 +46,15 @@ async def create_midjourney_image(hash_id: str, choice: int) -> Optional[str]:
         'webhook_type': 'result',
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, json=data, headers=headers) as response:
-            if response.status == 200:
-                data = await response.json()
-                return data.get('hash', '')
-            else:
-                error_message = await response.text()
-                logging.exception(f'Error in create_midjourney_image: {error_message}')
-                return ''
+    session = http_client.get_session(HTTPProvider.MIDJOURNEY)
+    async with session.post(url, json=data, headers=headers) as response:
+        if response.status == 200:
+            data = await response.json()
+            return data.get('hash', '')
+        else:
+            error_message = await response.text()
+            logging.exception(f'Error in create_midjourney_image: {error_message}')
+            return ''
 
 
 async def create_different_midjourney_images(hash_id: str) -> Optional[str]:
@@ -70,15 +69,15 @@ async def create_different_midjourney_images(hash_id: str) -> Optional[str]:
         'webhook_type': 'result',
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, json=data, headers=headers) as response:
-            if response.status == 200:
-                data = await response.json()
-                return data.get('hash', '')
-            else:
-                error_message = await response.text()
-                logging.exception(f'Error in create_different_midjourney_images: {error_message}')
-                return ''
+    session = http_client.get_session(HTTPProvider.MIDJOURNEY)
+    async with session.post(url, json=data, headers=headers) as response:
+        if response.status == 200:
+            data = await response.json()
+            return data.get('hash', '')
+        else:
+            error_message = await response.text()
+            logging.exception(f'Error in create_different_midjourney_images: {error_message}')
+            return ''
 
 
 async def create_different_midjourney_image(hash_id: str, choice: int) -> Optional[str]:
@@ -94,12 +93,12 @@ async def create_different_midjourney_image(hash_id: str, choice: int) -> Option
         'webhook_type': 'result',
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, json=data, headers=headers) as response:
-            if response.status == 200:
-                data = await response.json()
-                return data.get('hash', '')
-            else:
-                error_message = await response.text()
-                logging.exception(f'Error in create_different_midjourney_image: {error_message}')
-                return ''
+    session = http_client.get_session(HTTPProvider.MIDJOURNEY)
+    async with session.post(url, json=data, headers=headers) as response:
+        if response.status == 200:
+            data = await response.json()
+            return data.get('hash', '')
+        else:
+            error_message = await response.text()
+            logging.exception(f'Error in create_different_midjourney_image: {error_message}')
+            return ''
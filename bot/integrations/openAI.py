@@ -1,6 +1,7 @@
-from typing import BinaryIO, Literal
+from typing import BinaryIO, Literal, Callable, Awaitable
 
 import openai
+from openai.types.chat import ChatCompletionMessage
 
 from bot.config import config
 from bot.database.models.common import ChatGPTVersion, DALLEResolution, DALLEQuality, DALLEVersion
@@ -44,6 +45,61 @@ async def get_response_message(model_version: ChatGPTVersion, history: list) ->
     }
 
 
+def is_streaming_supported(model_version: ChatGPTVersion) -> bool:
+    return model_version != ChatGPTVersion.V1_O
+
+
+async def get_response_message_stream(
+    model_version: ChatGPTVersion,
+    history: list,
+    on_text: Callable[[str], Awaitable[None]],
+) -> dict:
+    if not is_streaming_supported(model_version):
+        return await get_response_message(model_version, history)
+
+    max_tokens = get_default_max_tokens(model_version)
+
+    if model_version == ChatGPTVersion.V4_Omni_Mini or model_version == ChatGPTVersion.V4_Omni:
+        stream = await client.chat.completions.create(
+            model=model_version,
+            messages=history,
+            max_tokens=max_tokens,
+            stream=True,
+            stream_options={'include_usage': True},
+        )
+    else:
+        stream = await client.chat.completions.create(
+            model=model_version,
+            messages=history,
+            stream=True,
+            stream_options={'include_usage': True},
+        )
+
+    text = ''
+    finish_reason = None
+    input_tokens = 0
+    output_tokens = 0
+    async for chunk in stream:
+        if chunk.usage:
+            input_tokens = chunk.usage.prompt_tokens
+            output_tokens = chunk.usage.completion_tokens
+        if not chunk.choices:
+            continue
+
+        if chunk.choices[0].delta.content:
+            text += chunk.choices[0].delta.content
+            await on_text(text)
+        if chunk.choices[0].finish_reason:
+            finish_reason = chunk.choices[0].finish_reason
+
+    return {
+        'finish_reason': finish_reason,
+        'message': ChatCompletionMessage(role='assistant', content=text),
+        'input_tokens': input_tokens,
+        'output_tokens': output_tokens,
+    }
+
+
 def get_cost_for_image(quality: DALLEQuality, resolution: DALLEResolution):
     if quality == DALLEQuality.STANDARD and resolution == DALLEResolution.LOW:
         return 1
@@ -84,7 +140,10 @@ async def get_response_speech_to_text(audio_file: BinaryIO) -> str:
     return response.text
 
 
-async def get_response_text_to_speech(text: str, voice: Literal['alloy', 'echo', 'fable', 'onyx', 'nova', 'shimmer']):
+async def get_response_text_to_speech(
+    text: str,
+    voice: Literal['alloy', 'echo', 'fable', 'onyx', 'nova', 'shimmer'],
+) -> bytes:
     response = await client.audio.speech.create(
         model='tts-1',
         voice=voice,
@@ -92,4 +151,4 @@ async def get_response_text_to_speech(text: str, voice: Literal['alloy', 'echo',
         input=text,
     )
 
-    return response
+    return response.content
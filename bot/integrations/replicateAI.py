@@ -3,6 +3,8 @@ import os
 from typing import Optional
 
 import replicate
+from replicate.model import Model
+from replicate.version import Version
 
 from bot.config import config
 from bot.database.models.common import PhotoshopAIAction, AspectRatio
@@ -10,6 +12,34 @@ from bot.database.models.common import PhotoshopAIAction, AspectRatio
 os.environ['REPLICATE_API_TOKEN'] = config.REPLICATE_API_TOKEN.get_secret_value()
 WEBHOOK_REPLICATE_URL = config.WEBHOOK_URL + config.WEBHOOK_REPLICATE_PATH
 
+models: dict[str, Model] = {}
+model_versions: dict[tuple[str, str], Version] = {}
+model_lock = asyncio.Lock()
+
+
+async def get_model(model_name: str, refresh=False) -> Model:
+    if not refresh and model_name in models:
+        return models[model_name]
+
+    async with model_lock:
+        if refresh or model_name not in models:
+            models[model_name] = await replicate.models.async_get(model_name)
+
+    return models[model_name]
+
+
+async def get_model_version(model_name: str, version_id: str, refresh=False) -> Version:
+    key = (model_name, version_id)
+    if not refresh and key in model_versions:
+        return model_versions[key]
+
+    model = await get_model(model_name, refresh)
+    async with model_lock:
+        if refresh or key not in model_versions:
+            model_versions[key] = await model.versions.async_get(version_id)
+
+    return model_versions[key]
+
 
 async def create_face_swap_images(images: list[dict]):
     tasks = [create_face_swap_image(image['target_image'], image['source_image']) for image in images]
@@ -24,8 +54,10 @@ async def create_face_swap_image(target_image: str, source_image: str) -> Option
         'swap_image': source_image,
     }
 
-    model = await replicate.models.async_get('codeplugtech/face-swap')
-    version = await model.versions.async_get('278a81e7ebb22db98bcba54de985d22cc1abeead2754eb1f2af717247be69b34')
+    version = await get_model_version(
+        'codeplugtech/face-swap',
+        '278a81e7ebb22db98bcba54de985d22cc1abeead2754eb1f2af717247be69b34',
+    )
     prediction = await replicate.predictions.async_create(
         version=version,
         input=input_parameters,
@@ -42,22 +74,28 @@ async def create_photoshop_ai_image(action: PhotoshopAIAction, image_url: str) -
             'img': image_url,
         }
 
-        model = await replicate.models.async_get('tencentarc/gfpgan')
-        version = await model.versions.async_get('0fbacf7afc6c144e5be9767cff80f25aff23e52b0708f17e20f9879b2f21516c')
+        version = await get_model_version(
+            'tencentarc/gfpgan',
+            '0fbacf7afc6c144e5be9767cff80f25aff23e52b0708f17e20f9879b2f21516c',
+        )
     elif action == PhotoshopAIAction.COLORIZATION:
         input_parameters = {
             'image': image_url,
         }
 
-        model = await replicate.models.async_get('cjwbw/bigcolor')
-        version = await model.versions.async_get('9451bfbf652b21a9bccc741e5c7046540faa5586cfa3aa45abc7dbb46151a4f7')
+        version = await get_model_version(
+            'cjwbw/bigcolor',
+            '9451bfbf652b21a9bccc741e5c7046540faa5586cfa3aa45abc7dbb46151a4f7',
+        )
     elif action == PhotoshopAIAction.REMOVAL_BACKGROUND:
         input_parameters = {
             'image': image_url,
         }
 
-        model = await replicate.models.async_get('cjwbw/rembg')
-        version = await model.versions.async_get('fb8af171cfa1616ddcf1242c093f9c46bcada5ad4cf6f2fbe8b81b330ec5c003')
+        version = await get_model_version(
+            'cjwbw/rembg',
+            'fb8af171cfa1616ddcf1242c093f9c46bcada5ad4cf6f2fbe8b81b330ec5c003',
+        )
     else:
         return
 
@@ -79,8 +117,10 @@ async def create_music_gen_melody(prompt: str, duration: int) -> Optional[str]:
         'duration': duration,
     }
 
-    model = await replicate.models.async_get('meta/musicgen')
-    version = await model.versions.async_get('671ac645ce5e552cc63a54a2bbff63fcf798043055d2dac5fc9e36a837eedcfb')
+    version = await get_model_version(
+        'meta/musicgen',
+        '671ac645ce5e552cc63a54a2bbff63fcf798043055d2dac5fc9e36a837eedcfb',
+    )
     prediction = await replicate.predictions.async_create(
         version=version,
         input=input_parameters,
@@ -106,7 +146,7 @@ async def create_stable_diffusion_image(
         input_parameters['image'] = image_link
         input_parameters['prompt_strength'] = 0.75
 
-    model = await replicate.models.async_get('stability-ai/stable-diffusion-3.5-large-turbo')
+    model = await get_model('stability-ai/stable-diffusion-3.5-large-turbo')
     prediction = await replicate.predictions.async_create(
         model=model,
         input=input_parameters,
@@ -133,7 +173,7 @@ async def create_flux_image(
     if image_link:
         input_parameters['image_prompt'] = image_link
 
-    model = await replicate.models.async_get('black-forest-labs/flux-1.1-pro')
+    model = await get_model('black-forest-labs/flux-1.1-pro')
     prediction = await replicate.predictions.async_create(
         model=model,
         input=input_parameters,
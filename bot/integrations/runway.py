@@ -1,5 +1,3 @@
-import asyncio
-
 from runwayml import AsyncRunwayML
 
 from bot.config import config
@@ -19,13 +17,13 @@ def get_cost_for_video(duration: RunwayDuration):
     return 1
 
 
-async def get_response_video(
+async def create_video(
     model_version: RunwayVersion,
     prompt_text: str,
     prompt_image: str,
     resolution: RunwayResolution,
     duration: RunwayDuration,
-) -> dict:
+) -> str:
     response = await client.image_to_video.create(
         model=model_version,
         prompt_text=prompt_text,
@@ -35,17 +33,14 @@ async def get_response_video(
         watermark=False,
     )
 
-    task_id = response.id
+    return response.id
+
 
-    await asyncio.sleep(10)
+async def get_video(task_id: str) -> dict:
     task = await client.tasks.retrieve(task_id)
-    for i in range(60):
-        await asyncio.sleep(10)
-        task = await client.tasks.retrieve(task_id)
-        if task.status in ['SUCCEEDED', 'FAILED', 'CANCELLED']:
-            break
 
     return {
+        'id': task.id,
         'status': task.status,
         'result': task.output,
         'failure': task.failure,
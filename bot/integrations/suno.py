@@ -2,6 +2,7 @@ import aiohttp
 
 from bot.config import config
 from bot.database.models.common import SunoVersion
+from bot.integrations.http_client import http_client, HTTPProvider
 
 SUNO_API_URL = 'https://api.acedata.cloud/suno/audios'
 SUNO_API_TOKEN = config.SUNO_API_TOKEN.get_secret_value()
@@ -16,6 +17,7 @@ class Suno:
             'authorization': f'Bearer {SUNO_API_TOKEN}',
         }
         self.session = session
+        self.is_session_owner = session is None
 
     async def __aenter__(self):
         if not self.session:
@@ -25,7 +27,8 @@ class Suno:
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        await self.session.close()
+        if self.is_session_owner:
+            await self.session.close()
 
     async def request(self, method: str, url: str, **kwargs):
         async with self.session.request(method, url, headers=self.headers, **kwargs) as response:
@@ -71,7 +74,7 @@ async def generate_song(
     custom: bool = False,
     tags: str = ''
 ) -> str:
-    async with Suno() as client:
+    async with Suno(http_client.get_session(HTTPProvider.SUNO)) as client:
         task_id = await client.songs.generate(
             version=version,
             prompt=prompt,
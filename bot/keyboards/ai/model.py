@@ -1,10 +1,12 @@
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from bot.database.models.common import Model, ModelType, ChatGPTVersion, ClaudeGPTVersion, GeminiGPTVersion
+from bot.keyboards.cache import cache_keyboard
 from bot.locales.main import get_localization
 from bot.locales.types import LanguageCode
 
 
+@cache_keyboard
 def build_model_keyboard(
     language_code: LanguageCode,
     model: Model,
@@ -390,6 +392,7 @@ def build_model_keyboard(
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@cache_keyboard
 def build_switched_to_ai_keyboard(language_code: LanguageCode, model: Model) -> InlineKeyboardMarkup:
     buttons = [
         [
@@ -0,0 +1,51 @@
+import time
+from typing import Callable
+
+from bot.database.models.common import Model, ModelType, ChatGPTVersion
+from bot.database.models.user import User
+from bot.keyboards.ai.model import build_model_keyboard, build_switched_to_ai_keyboard
+from bot.keyboards.settings.settings import (
+    build_settings_choose_model_type_keyboard,
+    build_settings_choose_text_model_keyboard,
+    build_settings_keyboard,
+    build_voice_messages_settings_keyboard,
+)
+from bot.locales.main import get_localization, localization_classes
+from bot.locales.types import LanguageCode
+
+COUNT_ITERATIONS = 1000
+
+
+def measure(builder: Callable, *args) -> float:
+    started_at = time.perf_counter()
+    for _ in range(COUNT_ITERATIONS):
+        builder(*args)
+
+    return (time.perf_counter() - started_at) / COUNT_ITERATIONS * 1_000_000
+
+
+def run_benchmark():
+    settings = User.DEFAULT_SETTINGS
+    cases = [
+        (build_model_keyboard, LanguageCode.EN, Model.CHAT_GPT, ChatGPTVersion.V4_Omni_Mini, 0, Model.CHAT_GPT),
+        (build_switched_to_ai_keyboard, LanguageCode.EN, Model.CHAT_GPT),
+        (build_settings_choose_model_type_keyboard, LanguageCode.EN),
+        (build_settings_choose_text_model_keyboard, LanguageCode.EN),
+        (build_settings_keyboard, LanguageCode.EN, Model.CHAT_GPT, ModelType.TEXT, settings),
+        (build_settings_keyboard, LanguageCode.EN, Model.MIDJOURNEY, ModelType.IMAGE, settings),
+        (build_voice_messages_settings_keyboard, LanguageCode.EN, settings),
+    ]
+
+    print(f'{"keyboard":<45} {"uncached, µs":>14} {"cached, µs":>12}')
+    for builder, *args in cases:
+        uncached = measure(builder.__wrapped__, *args)
+        cached = measure(builder, *args)
+        print(f'{builder.__name__:<45} {uncached:>14.2f} {cached:>12.2f}')
+
+    uncached = measure(localization_classes[LanguageCode.EN])
+    cached = measure(get_localization, LanguageCode.EN)
+    print(f'{"get_localization":<45} {uncached:>14.2f} {cached:>12.2f}')
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,61 @@
+import inspect
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Hashable
+
+from aiogram.types import InlineKeyboardMarkup
+
+from bot.config import config
+
+keyboards: OrderedDict[Hashable, InlineKeyboardMarkup] = OrderedDict()
+keyboard_stats = {
+    'hits': 0,
+    'misses': 0,
+}
+
+
+def freeze(value) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    elif isinstance(value, (list, tuple, set)):
+        return tuple(freeze(item) for item in value)
+
+    return value
+
+
+def cache_keyboard(builder: Callable[..., InlineKeyboardMarkup]) -> Callable[..., InlineKeyboardMarkup]:
+    signature = inspect.signature(builder)
+
+    # callers get a copy, so mutating a returned markup never leaks into the cache
+    @wraps(builder)
+    def wrapper(*args, **kwargs) -> InlineKeyboardMarkup:
+        arguments = signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        key = (builder.__module__, builder.__qualname__, freeze(arguments.arguments))
+
+        keyboard = keyboards.get(key)
+        if keyboard is not None:
+            keyboards.move_to_end(key)
+            keyboard_stats['hits'] += 1
+            return keyboard.model_copy(deep=True)
+
+        keyboard = builder(*args, **kwargs)
+        keyboards[key] = keyboard
+        keyboard_stats['misses'] += 1
+        if len(keyboards) > config.KEYBOARD_CACHE_MAX_SIZE:
+            keyboards.popitem(last=False)
+
+        return keyboard.model_copy(deep=True)
+
+    return wrapper
+
+
+def get_keyboard_cache_stats() -> dict:
+    total = keyboard_stats['hits'] + keyboard_stats['misses']
+
+    return {
+        'size': len(keyboards),
+        'hits': keyboard_stats['hits'],
+        'misses': keyboard_stats['misses'],
+        'hit_rate': keyboard_stats['hits'] / total if total else 0,
+    }
@@ -20,10 +20,12 @@ from bot.database.models.common import (
     RunwayDuration,
 )
 from bot.database.models.user import UserSettings, UserGender
+from bot.keyboards.cache import cache_keyboard
 from bot.locales.main import get_localization
 from bot.locales.types import LanguageCode
 
 
+@cache_keyboard
 def build_settings_choose_model_type_keyboard(language_code: LanguageCode) -> InlineKeyboardMarkup:
     buttons = [
         [
@@ -61,6 +63,7 @@ def build_settings_choose_model_type_keyboard(language_code: LanguageCode) -> In
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@cache_keyboard
 def build_settings_choose_text_model_keyboard(language_code: LanguageCode) -> InlineKeyboardMarkup:
     buttons = [
         [
@@ -104,6 +107,7 @@ def build_settings_choose_text_model_keyboard(language_code: LanguageCode) -> In
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@cache_keyboard
 def build_settings_choose_summary_model_keyboard(language_code: LanguageCode) -> InlineKeyboardMarkup:
     buttons = [
         [
@@ -129,6 +133,7 @@ def build_settings_choose_summary_model_keyboard(language_code: LanguageCode) ->
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@cache_keyboard
 def build_settings_choose_image_model_keyboard(language_code: LanguageCode) -> InlineKeyboardMarkup:
     buttons = [
         [
@@ -184,6 +189,7 @@ def build_settings_choose_image_model_keyboard(language_code: LanguageCode) -> I
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@cache_keyboard
 def build_settings_choose_music_model_keyboard(language_code: LanguageCode) -> InlineKeyboardMarkup:
     buttons = [
         [
@@ -209,6 +215,7 @@ def build_settings_choose_music_model_keyboard(language_code: LanguageCode) -> I
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@cache_keyboard
 def build_settings_choose_video_model_keyboard(language_code: LanguageCode) -> InlineKeyboardMarkup:
     buttons = [
         [
@@ -240,6 +247,7 @@ def build_settings_choose_video_model_keyboard(language_code: LanguageCode) -> I
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@cache_keyboard
 def build_settings_keyboard(
     language_code: LanguageCode,
     model: Model,
@@ -1331,6 +1339,7 @@ def build_settings_keyboard(
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@cache_keyboard
 def build_voice_messages_settings_keyboard(
     language_code: LanguageCode,
     settings: dict,
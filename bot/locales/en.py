@@ -439,6 +439,13 @@ Please try again with a smaller file 😊
 That doesn't seem like a number 🤔
 
 Can you please enter a numeric value? 🔢
+"""
+    ERROR_VOICE_MESSAGE_PARTIALLY_RECOGNIZED = """
+🚧 <b>Heads up!</b>
+
+I couldn't recognize part of your audio, so the text below may be incomplete 🎙
+
+If something is missing, please send that part again 😊
 """
 
     # Examples
@@ -439,6 +439,13 @@ Por favor, intenta de nuevo con un archivo más pequeño. 😊
 Parece que esto no es un número 🤔
 
 Por favor, envíame un valor numérico 🔢
+"""
+    ERROR_VOICE_MESSAGE_PARTIALLY_RECOGNIZED = """
+🚧 <b>¡Atención!</b>
+
+No pude reconocer una parte de tu audio, así que el texto puede estar incompleto 🎙
+
+Si falta algo, por favor envía esa parte de nuevo 😊
 """
 
     # Examples
@@ -439,6 +439,13 @@ class Hindi(Texts):
 लगता है कि यह कोई संख्या नहीं है 🤔
 
 कृपया मुझे एक संख्या भेजें 🔢
+"""
+    ERROR_VOICE_MESSAGE_PARTIALLY_RECOGNIZED = """
+🚧 <b>ध्यान दें!</b>
+
+मैं आपके ऑडियो का एक हिस्सा पहचान नहीं सका, इसलिए टेक्स्ट अधूरा हो सकता है 🎙
+
+अगर कुछ छूट गया हो, तो कृपया वह हिस्सा फिर से भेजें 😊
 """
 
     # Examples
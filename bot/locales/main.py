@@ -13,6 +13,9 @@ localization_classes: dict[LanguageCode, Type[Texts]] = {
     LanguageCode.ES: es.Spanish,
     LanguageCode.HI: hi.Hindi,
 }
+localizations: dict[LanguageCode, Texts] = {
+    language_code: localization_class() for language_code, localization_class in localization_classes.items()
+}
 
 
 async def set_user_language(user_id: str, language_code: LanguageCode, storage: BaseStorage):
@@ -43,5 +46,4 @@ async def get_user_language(user_id: str, storage: BaseStorage) -> LanguageCode:
 
 
 def get_localization(language_code: LanguageCode) -> Texts:
-    localization_class = localization_classes.get(language_code, en.English)
-    return localization_class()
+    return localizations.get(language_code, localizations[LanguageCode.EN])
@@ -443,6 +443,13 @@ class Russian(Texts):
 Похоже, это не число 🤔
 
 Отправьте мне, пожалуйста, числовое значение 🔢
+"""
+    ERROR_VOICE_MESSAGE_PARTIALLY_RECOGNIZED = """
+🚧 <b>Обратите внимание!</b>
+
+Я не смог распознать часть вашего аудио, поэтому текст может быть неполным 🎙
+
+Если чего-то не хватает, отправьте эту часть ещё раз, пожалуйста 😊
 """
 
     # Examples
@@ -157,6 +157,7 @@ class Texts(Protocol):
     ERROR_SERVER_OVERLOADED: str
     ERROR_FILE_TOO_BIG: str
     ERROR_IS_NOT_NUMBER: str
+    ERROR_VOICE_MESSAGE_PARTIALLY_RECOGNIZED: str
 
     # Examples
     EXAMPLE_INFO: str
@@ -1,47 +1,159 @@
-import logging
-
-from aiogram.client.session import aiohttp
+import asyncio
 import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Optional
 
 from bot.config import config
+from bot.database.operations.translation.cache import get_cached_translations, set_cached_translations
+from bot.integrations.http_client import http_client, HTTPProvider
+
+TRANSLATE_MAX_CHARACTERS = 10000
+
+translate_token = {
+    'value': '',
+    'expires_at': 0.0,
+}
+translate_token_lock = asyncio.Lock()
+
+
+def get_translate_token_expires_at(expires_at: Optional[str]) -> float:
+    try:
+        return datetime.strptime(expires_at[:19], '%Y-%m-%dT%H:%M:%S').replace(tzinfo=timezone.utc).timestamp()
+    except (TypeError, ValueError):
+        return time.time() + 3600
+
+
+async def get_translate_token(refresh=False) -> str:
+    if not refresh and translate_token['expires_at'] > time.time() + config.TRANSLATE_TOKEN_REFRESH_MARGIN_SECONDS:
+        return translate_token['value']
 
+    async with translate_token_lock:
+        if not refresh and translate_token['expires_at'] > time.time() + config.TRANSLATE_TOKEN_REFRESH_MARGIN_SECONDS:
+            return translate_token['value']
 
-async def get_translate_token() -> str:
-    url = 'https://iam.api.cloud.yandex.net/iam/v1/tokens'
-    headers = {'Content-Type': 'application/json'}
-    data = {'yandexPassportOauthToken': config.OAUTH_YANDEX_TOKEN.get_secret_value()}
+        url = 'https://iam.api.cloud.yandex.net/iam/v1/tokens'
+        headers = {'Content-Type': 'application/json'}
+        data = {'yandexPassportOauthToken': config.OAUTH_YANDEX_TOKEN.get_secret_value()}
 
-    async with aiohttp.ClientSession() as session:
+        session = http_client.get_session(HTTPProvider.TRANSLATE)
         async with session.post(url, json=data, headers=headers) as response:
             if response.status == 200:
                 token_data = await response.json()
-                return token_data.get('iamToken', '')
+                translate_token['value'] = token_data.get('iamToken', '')
+                translate_token['expires_at'] = get_translate_token_expires_at(token_data.get('expiresAt'))
+                return translate_token['value']
             else:
                 error_message = await response.text()
                 logging.exception(f'Error trying to get IAM_TOKEN: {error_message}')
                 return ''
 
 
-async def translate_text(text: str, source_language_code: str, target_language_code: str):
-    token = await get_translate_token()
+def split_texts(texts: list[str]) -> list[list[str]]:
+    batches = [[]]
+    count_characters = 0
+    for text in texts:
+        if batches[-1] and count_characters + len(text) > TRANSLATE_MAX_CHARACTERS:
+            batches.append([])
+            count_characters = 0
+
+        batches[-1].append(text)
+        count_characters += len(text)
+
+    return batches
+
+
+async def request_translations(texts: list[str], source_language_code: str, target_language_code: str) -> list[str]:
     url = 'https://translate.api.cloud.yandex.net/translate/v2/translate'
-    headers = {
-        'Authorization': f'Bearer {token}',
-        'Content-Type': 'application/json'
-    }
     payload = {
         'folder_id': 'b1gauqcr90jd0sdpald9',
         'sourceLanguageCode': source_language_code,
         'targetLanguageCode': target_language_code,
-        'texts': [text],
+        'texts': texts,
     }
 
-    async with aiohttp.ClientSession() as session:
+    session = http_client.get_session(HTTPProvider.TRANSLATE)
+    for refresh in [False, True]:
+        token = await get_translate_token(refresh)
+        headers = {
+            'Authorization': f'Bearer {token}',
+            'Content-Type': 'application/json'
+        }
+
         async with session.post(url, headers=headers, data=json.dumps(payload)) as response:
             if response.status == 200:
                 data = await response.json()
-                return data['translations'][0]['text']
+                return [translation['text'] for translation in data['translations']]
+            elif response.status == 401 and not refresh:
+                continue
             else:
                 error_message = await response.text()
                 logging.exception(f'Error in translate_text: {error_message}')
-                return ''
+                break
+
+    return [''] * len(texts)
+
+
+async def translate_texts(texts: list[str], source_language_code: str, target_language_code: str) -> list[str]:
+    translations = await get_cached_translations(texts, source_language_code, target_language_code)
+
+    missed_texts = list(dict.fromkeys(text for text, translation in zip(texts, translations) if translation is None))
+    if missed_texts:
+        missed_translations = []
+        for batch in split_texts(missed_texts):
+            missed_translations.extend(await request_translations(batch, source_language_code, target_language_code))
+
+        await set_cached_translations(missed_texts, missed_translations, source_language_code, target_language_code)
+
+        translated_texts = dict(zip(missed_texts, missed_translations))
+        translations = [
+            translated_texts[text] if translation is None else translation
+            for text, translation in zip(texts, translations)
+        ]
+
+    return translations
+
+
+async def translate_texts_to_languages(
+    texts: list[str],
+    source_language_code: str,
+    target_language_codes: list[str],
+) -> dict[str, list[str]]:
+    translated_language_codes = [
+        target_language_code for target_language_code in target_language_codes
+        if target_language_code != source_language_code
+    ]
+    results = await asyncio.gather(
+        *[
+            translate_texts(texts, source_language_code, target_language_code)
+            for target_language_code in translated_language_codes
+        ]
+    )
+    translations = dict(zip(translated_language_codes, results))
+
+    return {
+        target_language_code: [
+            translation or text for text, translation in zip(texts, translations.get(target_language_code, texts))
+        ]
+        for target_language_code in target_language_codes
+    }
+
+
+async def translate_text_to_languages(
+    text: str,
+    source_language_code: str,
+    target_language_codes: list[str],
+) -> dict[str, str]:
+    translations = await translate_texts_to_languages([text], source_language_code, target_language_codes)
+
+    return {
+        target_language_code: translated_texts[0]
+        for target_language_code, translated_texts in translations.items()
+    }
+
+
+async def translate_text(text: str, source_language_code: str, target_language_code: str):
+    translations = await translate_texts([text], source_language_code, target_language_code)
+
+    return translations[0]
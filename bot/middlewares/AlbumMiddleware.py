@@ -1,14 +1,40 @@
 import asyncio
+import logging
+import time
+from collections import deque
 from typing import Callable, Any, Awaitable
 
 from aiogram import BaseMiddleware
 from aiogram.types import Message
+from redis.exceptions import RedisError
+
+from bot.config import config
+from bot.database.cache import cache
+from bot.utils.get_latency_percentiles import get_latency_percentiles
+
+ALBUM_LATENCY_SAMPLES = 1000
+
+
+def get_album_key(media_group_id: str) -> str:
+    return f'album:{media_group_id}'
+
+
+def get_album_messages_key(media_group_id: str) -> str:
+    return f'album:{media_group_id}:messages'
 
 
 class AlbumMiddleware(BaseMiddleware):
-    def __init__(self, latency: float = 2.0):
-        self.latency = latency
-        self.albums = {}
+    count_albums = 0
+    latencies = deque(maxlen=ALBUM_LATENCY_SAMPLES)
+    sizes = deque(maxlen=ALBUM_LATENCY_SAMPLES)
+
+    def __init__(
+        self,
+        quiet_window: float = config.ALBUM_QUIET_WINDOW_SECONDS,
+        max_latency: float = config.ALBUM_MAX_LATENCY_SECONDS,
+    ):
+        self.quiet_window = quiet_window
+        self.max_latency = max_latency
 
     async def __call__(
         self,
@@ -17,17 +43,83 @@ class AlbumMiddleware(BaseMiddleware):
         data: dict[str, Any],
     ):
         if message.media_group_id:
-            if message.media_group_id not in self.albums:
-                self.albums[message.media_group_id] = []
+            try:
+                is_first_message = await self.add_album_message(message)
+            except RedisError as e:
+                logging.warning(f'Error in AlbumMiddleware: {e}')
+                data['album'] = [message]
+                await handler(message, data)
+                return
+
+            if is_first_message:
                 asyncio.create_task(self.dispatch_album(message.media_group_id, handler, data, message))
-            self.albums[message.media_group_id].append(message)
         else:
             data['album'] = []
             await handler(message, data)
 
+    async def add_album_message(self, message: Message) -> bool:
+        album_key = get_album_key(message.media_group_id)
+        album_messages_key = get_album_messages_key(message.media_group_id)
+        album_ttl = int(self.max_latency) + 60
+        current_time = time.time()
+
+        async with cache.redis.pipeline(transaction=True) as pipeline:
+            pipeline.hsetnx(album_key, 'started_at', current_time)
+            pipeline.hset(album_key, 'updated_at', current_time)
+            pipeline.rpush(album_messages_key, message.model_dump_json(by_alias=True, exclude_none=True))
+            pipeline.expire(album_key, album_ttl)
+            pipeline.expire(album_messages_key, album_ttl)
+            is_first_message, *_ = await pipeline.execute()
+
+        return bool(is_first_message)
+
     async def dispatch_album(self, media_group_id: str, handler: Callable, data: dict[str, Any], message: Message):
-        await asyncio.sleep(self.latency)
-        album = self.albums.pop(media_group_id, [])
-        if album:
-            data['album'] = album
-            await handler(message, data)
+        album_key = get_album_key(media_group_id)
+        album_messages_key = get_album_messages_key(media_group_id)
+
+        try:
+            while True:
+                await asyncio.sleep(self.quiet_window)
+
+                started_at, updated_at = await cache.redis.hmget(album_key, 'started_at', 'updated_at')
+                if started_at is None or updated_at is None:
+                    break
+
+                current_time = time.time()
+                if (
+                    current_time - float(updated_at) >= self.quiet_window or
+                    current_time - float(started_at) >= self.max_latency
+                ):
+                    break
+
+            async with cache.redis.pipeline(transaction=True) as pipeline:
+                pipeline.lrange(album_messages_key, 0, -1)
+                pipeline.delete(album_key, album_messages_key)
+                album_messages, _ = await pipeline.execute()
+        except RedisError as e:
+            logging.warning(f'Error in AlbumMiddleware.dispatch_album: {e}')
+            started_at = None
+            album_messages = []
+
+        album = {message.message_id: message}
+        for album_message in album_messages:
+            album_message = Message.model_validate_json(album_message).as_(message.bot)
+            album.setdefault(album_message.message_id, album_message)
+
+        AlbumMiddleware.count_albums += 1
+        self.latencies.append(time.time() - (float(started_at) if started_at else message.date.timestamp()))
+        self.sizes.append(len(album))
+
+        data['album'] = [album[message_id] for message_id in sorted(album)]
+        await handler(message, data)
+
+    @classmethod
+    def get_metrics(cls) -> dict:
+        if not cls.latencies:
+            return {}
+
+        return {
+            'albums': cls.count_albums,
+            'average_size': round(sum(cls.sizes) / len(cls.sizes), 2),
+            'latency': get_latency_percentiles(cls.latencies),
+        }
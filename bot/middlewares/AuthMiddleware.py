@@ -20,6 +20,7 @@ class AuthMessageMiddleware(BaseMiddleware):
             )
             return
 
+        data['user'] = user
         await handler(message, data)
 
 
@@ -37,4 +38,5 @@ class AuthCallbackQueryMiddleware(BaseMiddleware):
             )
             return
 
+        data['user'] = user
         await handler(callback_query, data)
@@ -0,0 +1,85 @@
+import struct
+
+OGG_PAGE_HEADER = struct.Struct('<4sBBqIIIB')
+OGG_HEADER_TYPE_EOS = 0x04
+OGG_OPUS_HEADER_PACKETS = 2
+
+
+def get_ogg_crc_table() -> list[int]:
+    table = []
+    for index in range(256):
+        crc = index << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x04C11DB7) if crc & 0x80000000 else (crc << 1)
+        table.append(crc & 0xFFFFFFFF)
+
+    return table
+
+
+OGG_CRC_TABLE = get_ogg_crc_table()
+
+
+def get_ogg_crc(page: bytes) -> int:
+    crc = 0
+    for byte in page:
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ OGG_CRC_TABLE[(crc >> 24) ^ byte]
+
+    return crc
+
+
+def read_ogg_pages(stream: bytes):
+    offset = 0
+    while offset + OGG_PAGE_HEADER.size <= len(stream):
+        capture_pattern, version, header_type, granule, serial, sequence, _, count_segments = \
+            OGG_PAGE_HEADER.unpack_from(stream, offset)
+        if capture_pattern != b'OggS':
+            raise ValueError('Invalid Ogg page')
+
+        segment_table_offset = offset + OGG_PAGE_HEADER.size
+        segment_table = stream[segment_table_offset:segment_table_offset + count_segments]
+        data_offset = segment_table_offset + count_segments
+        data = stream[data_offset:data_offset + sum(segment_table)]
+        offset = data_offset + len(data)
+
+        yield header_type, granule, segment_table, data
+
+
+def write_ogg_page(header_type: int, granule: int, serial: int, sequence: int, segment_table: bytes, data: bytes):
+    page = bytearray(OGG_PAGE_HEADER.pack(b'OggS', 0, header_type, granule, serial, sequence, 0, len(segment_table)))
+    page += segment_table
+    page += data
+    struct.pack_into('<I', page, 22, get_ogg_crc(page))
+
+    return bytes(page)
+
+
+def concat_ogg_opus(streams: list[bytes]) -> bytes:
+    if len(streams) == 1:
+        return streams[0]
+
+    serial = OGG_PAGE_HEADER.unpack_from(streams[0])[4]
+    sequence = 0
+    granule_offset = 0
+    pages = []
+    for index, stream in enumerate(streams):
+        is_last_stream = index == len(streams) - 1
+        count_header_packets = 0
+        last_granule = 0
+        for header_type, granule, segment_table, data in read_ogg_pages(stream):
+            if count_header_packets < OGG_OPUS_HEADER_PACKETS:
+                count_header_packets += sum(1 for lacing in segment_table if lacing < 255)
+                if index > 0:
+                    continue
+            elif granule != -1:
+                last_granule = granule
+                granule += granule_offset
+
+            if not is_last_stream:
+                header_type &= ~OGG_HEADER_TYPE_EOS
+
+            pages.append(write_ogg_page(header_type, granule, serial, sequence, segment_table, data))
+            sequence += 1
+
+        granule_offset += last_granule
+
+    return b''.join(pages)
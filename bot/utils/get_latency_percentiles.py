@@ -0,0 +1,13 @@
+from typing import Iterable
+
+
+def get_latency_percentiles(latencies: Iterable[float]) -> dict:
+    sorted_latencies = sorted(latencies)
+    if not sorted_latencies:
+        return {}
+
+    return {
+        'p50': round(sorted_latencies[len(sorted_latencies) // 2], 3),
+        'p95': round(sorted_latencies[int(len(sorted_latencies) * 0.95)], 3),
+        'max': round(sorted_latencies[-1], 3),
+    }
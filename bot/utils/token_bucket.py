@@ -0,0 +1,53 @@
+import asyncio
+import time
+
+from cachetools import TTLCache
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = asyncio.Lock()
+
+    def pause(self, seconds: float):
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                current_time = time.monotonic()
+                if current_time < self.paused_until:
+                    await asyncio.sleep(self.paused_until - current_time)
+                    continue
+
+                self.tokens = min(self.capacity, self.tokens + (current_time - self.updated_at) * self.rate)
+                self.updated_at = current_time
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class ChatTokenBucket:
+    def __init__(self, rate: float, capacity: float, chat_rate: float, chat_capacity: float):
+        self.bucket = TokenBucket(rate, capacity)
+        self.chat_rate = chat_rate
+        self.chat_capacity = chat_capacity
+        self.chat_buckets = TTLCache(maxsize=100000, ttl=max(60.0, chat_capacity / chat_rate))
+
+    def pause(self, seconds: float):
+        self.bucket.pause(seconds)
+
+    async def acquire(self, chat_id: str):
+        chat_bucket = self.chat_buckets.get(chat_id)
+        if chat_bucket is None:
+            chat_bucket = TokenBucket(self.chat_rate, self.chat_capacity)
+            self.chat_buckets[chat_id] = chat_bucket
+
+        await chat_bucket.acquire()
+        await self.bucket.acquire()
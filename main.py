@@ -4,6 +4,8 @@ import os
 import traceback
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone, timedelta
+from functools import partial
+from typing import Optional
 
 import uvicorn
 from aiogram.client.default import DefaultBotProperties
@@ -28,7 +30,11 @@ from redis.retry import Retry
 from redis.exceptions import ConnectionError
 
 from bot.config import config
+from bot.database.cache import cache
 from bot.database.main import firebase
+from bot.database.operations.product.cache import product_catalog
+from bot.database.operations.speech.cache import get_speech_cache_stats
+from bot.database.operations.video_summary.cache import get_video_summary_cache_stats
 from bot.handlers.admin.admin_handler import admin_router
 from bot.handlers.admin.ads_handler import ads_router
 from bot.handlers.admin.ban_handler import ban_router
@@ -73,6 +79,7 @@ from bot.handlers.payment.payment_handler import payment_router
 from bot.handlers.payment.promo_code_handler import promo_code_router
 from bot.handlers.settings.language_handler import language_router
 from bot.handlers.settings.settings_handler import settings_router
+from bot.helpers.audio_transcoder import audio_transcoder
 from bot.helpers.billing.check_waiting_payments import check_waiting_payments
 from bot.helpers.billing.update_daily_expenses import update_daily_expenses
 from bot.helpers.checkers.check_unresolved_requests import check_unresolved_requests
@@ -84,14 +91,22 @@ from bot.helpers.handlers.handle_luma_webhook import handle_luma_webhook
 from bot.helpers.handlers.handle_midjourney_webhook import handle_midjourney_webhook
 from bot.helpers.handlers.handle_network_error import handle_network_error
 from bot.helpers.handlers.handle_replicate_webhook import handle_replicate_webhook
+from bot.helpers.handlers.handle_runway_task import handle_runway_task
 from bot.helpers.handlers.handle_stripe_webhook import handle_stripe_webhook
 from bot.helpers.handlers.handle_suno_webhook import handle_suno_webhook
 from bot.helpers.handlers.handle_yookassa_webhook import handle_yookassa_webhook
 from bot.helpers.notifiers.notify_admins_about_error import notify_admins_about_error
+from bot.helpers.runway_poller import runway_poller
+from bot.helpers.senders.send_message_to_users import resume_broadcasts
 from bot.helpers.senders.send_statistics import send_statistics
 from bot.helpers.setters.set_commands import set_commands
 from bot.helpers.setters.set_description import set_description
+from bot.helpers.update_scheduler import update_scheduler
+from bot.helpers.updaters.backfill_statistics import backfill_statistics
 from bot.helpers.updaters.update_daily_limits import update_daily_limits
+from bot.integrations.http_client import http_client
+from bot.keyboards.cache import get_keyboard_cache_stats
+from bot.middlewares.AlbumMiddleware import AlbumMiddleware
 from bot.middlewares.AuthMiddleware import AuthMessageMiddleware, AuthCallbackQueryMiddleware
 from bot.middlewares.LoggingMiddleware import LoggingMessageMiddleware, LoggingCallbackQueryMiddleware
 from bot.utils.migrate import migrate
@@ -195,8 +210,20 @@ async def lifespan(_: FastAPI):
     await set_description(bot)
     await set_commands(bot)
     await firebase.init()
+    await cache.init(storage.redis)
+    await http_client.init()
+    await resume_broadcasts(bot)
+    await product_catalog.start()
+    await update_scheduler.start(handle_update)
+    await runway_poller.start(partial(handle_runway_task, bot, dp))
     yield
+    await runway_poller.close()
+    await update_scheduler.close()
+    await product_catalog.close()
+    await audio_transcoder.close()
+    await http_client.close()
     await bot.session.close()
+    await cache.close()
     await storage.close()
     await firebase.close()
 
@@ -205,8 +232,45 @@ app = FastAPI(lifespan=lifespan)
 
 
 @app.post(WEBHOOK_BOT_PATH)
-async def bot_webhook(update: dict, background_tasks: BackgroundTasks):
-    background_tasks.add_task(handle_update, update)
+async def bot_webhook(update: dict):
+    is_scheduled = update_scheduler.schedule(update)
+    if not is_scheduled:
+        return JSONResponse(content={}, status_code=503)
+
+
+@app.get('/update-scheduler-metrics')
+async def update_scheduler_metrics():
+    return update_scheduler.get_metrics()
+
+
+@app.get('/http-client-metrics')
+async def http_client_metrics():
+    return http_client.get_metrics()
+
+
+@app.get('/video-summary-cache-metrics')
+async def video_summary_cache_metrics():
+    return await get_video_summary_cache_stats()
+
+
+@app.get('/speech-cache-metrics')
+async def speech_cache_metrics():
+    return await get_speech_cache_stats()
+
+
+@app.get('/keyboard-cache-metrics')
+async def keyboard_cache_metrics():
+    return get_keyboard_cache_stats()
+
+
+@app.get('/audio-transcoder-metrics')
+async def audio_transcoder_metrics():
+    return audio_transcoder.get_metrics()
+
+
+@app.get('/album-metrics')
+async def album_metrics():
+    return AlbumMiddleware.get_metrics()
 
 
 async def delayed_handle_update(update: Update, timeout: int):
@@ -379,9 +443,28 @@ async def run_daily_tasks(background_tasks: BackgroundTasks):
     return {'code': 200}
 
 
+@app.get('/backfill-statistics')
+async def backfill_statistics_webhook(start_date: str, end_date: str, background_tasks: BackgroundTasks):
+    start_date = datetime.strptime(start_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+    end_date = datetime.strptime(end_date, '%Y-%m-%d').replace(
+        hour=23,
+        minute=59,
+        second=59,
+        microsecond=999999,
+        tzinfo=timezone.utc,
+    )
+    background_tasks.add_task(backfill_statistics, bot, start_date, end_date)
+
+    return {'code': 200}
+
+
 @app.get('/update-daily-limits')
-async def daily_tasks(background_tasks: BackgroundTasks):
-    background_tasks.add_task(update_daily_limits, bot, storage)
+async def daily_tasks(
+    background_tasks: BackgroundTasks,
+    start_user_id: Optional[str] = None,
+    end_user_id: Optional[str] = None,
+):
+    background_tasks.add_task(update_daily_limits, bot, storage, start_user_id, end_user_id)
 
     return {'code': 200}
 